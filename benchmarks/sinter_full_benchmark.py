@@ -7,6 +7,7 @@ Extended benchmark configuration for CEO-ready results:
 - Rounds: 100-200 per task
 - Shots: 1,000,000 or max_errors=1000
 - All three decoders: PyMatching, Union-Find, BP+OSD
+- Tail latency (p50/p99/p99.9) merged across all sinter workers
 
 This script generates statistically significant results for the Riverlane report.
 
@@ -28,6 +29,7 @@ import sinter
 import stim
 
 from asr_mp.decoder import TesseractBPOSD
+from asr_mp.latency import LatencyHistogram, LatencySampler
 from asr_mp.noise_models import generate_stress_circuit
 from asr_mp.union_find_decoder import UnionFindSinterDecoder
 
@@ -226,10 +228,11 @@ def main() -> None:
     print(f"  - {len(tasks)//2} standard noise tasks")
     print(f"  - {len(tasks)//2} stress-test tasks")
 
-    # Build custom decoders
+    # Build custom decoders, wrapped so each worker reports a latency histogram
     custom_decoders = {
-        "tesseract": TesseractBPOSD(),
-        "union_find": UnionFindSinterDecoder(),
+        "pymatching": LatencySampler(sinter.BUILT_IN_DECODERS["pymatching"]),
+        "tesseract": LatencySampler(TesseractBPOSD()),
+        "union_find": LatencySampler(UnionFindSinterDecoder()),
     }
     decoders = ["pymatching", "union_find", "tesseract"]
 
@@ -262,11 +265,12 @@ def main() -> None:
     print(f"Results saved to: {args.output}")
 
     # Summary table
-    print("\n" + "-" * 80)
+    print("\n" + "-" * 112)
     print(
         f"{'Decoder':<12} {'d':<4} {'p':<8} {'Stress':<25} {'Shots':<12} {'Errors':<8} {'P_L':<12}"
+        f" {'p50 us':>9} {'p99 us':>9} {'p99.9 us':>9}"
     )
-    print("-" * 80)
+    print("-" * 112)
 
     for s in sorted(
         samples,
@@ -281,8 +285,11 @@ def main() -> None:
         p = s.json_metadata["p"]
         stress = s.json_metadata.get("stress", "Unknown")[:24]
         p_l = s.errors / s.shots if s.shots > 0 else 0
+        latency = LatencyHistogram.from_custom_counts(s.custom_counts)
         print(
             f"{s.decoder:<12} {d:<4} {p:<8.4f} {stress:<25} {s.shots:<12,} {s.errors:<8} {p_l:<12.4e}"
+            f" {latency.percentile(50) * 1e6:>9.1f} {latency.percentile(99) * 1e6:>9.1f}"
+            f" {latency.percentile(99.9) * 1e6:>9.1f}"
         )
 
     # Decoder comparison by condition
@@ -305,11 +312,15 @@ def main() -> None:
 
         for s in sorted(relevant, key=lambda x: x.decoder):
             p_l = s.errors / s.shots if s.shots > 0 else 0
+            p99 = LatencyHistogram.from_custom_counts(s.custom_counts).percentile(99) * 1e6
             if baseline and p_l > 0:
                 improvement = baseline / p_l
-                print(f"  {s.decoder:<15}: P_L = {p_l:.4e} ({improvement:.2f}x vs MWPM)")
+                print(
+                    f"  {s.decoder:<15}: P_L = {p_l:.4e} ({improvement:.2f}x vs MWPM),"
+                    f" p99 = {p99:.1f} us"
+                )
             else:
-                print(f"  {s.decoder:<15}: P_L = {p_l:.4e}")
+                print(f"  {s.decoder:<15}: P_L = {p_l:.4e}, p99 = {p99:.1f} us")
 
     print("\n" + "=" * 80)
     print("Benchmark complete!")
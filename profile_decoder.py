@@ -26,5 +26,10 @@ packed_shots = np.packbits(shots, axis=1, bitorder='little')
 print("Decoding 10 shots...")
 t0 = time.time()
 decoder.decode_shots_bit_packed(bit_packed_detection_event_data=packed_shots)
-params = f"MaxIter={decoder.decoder.max_iter}, OSD={decoder.decoder.osd_order}"
+params = (
+    f"Preset={decoder.decoder.preset}, MaxIter={decoder.decoder.max_iter}, "
+    f"OSD={decoder.decoder.osd_method} order {decoder.decoder.osd_order}"
+)
 print(f"Decoding 10 shots took {time.time()-t0:.4f}s ({params})")
+print(f"Trivial (zero-syndrome) shots skipped: {decoder.trivial_fraction:.1%}")
+print(f"BP convergence rate (no OSD needed): {decoder.decoder.bp_convergence_rate:.1%}")
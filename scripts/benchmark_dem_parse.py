@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark DEM Parsing: per-target instruction walk vs vectorized text parse.
+
+Measures the time to convert a DetectorErrorModel into (H, L, priors) for
+the previous implementation, which called ``targets_copy()`` and
+``is_relative_detector_id()`` for every target, against the current
+``dem_to_matrices``, which parses the DEM text in one pass and expands
+repeat blocks by tiling instead of flattening.
+
+Usage:
+    python benchmark_dem_parse.py --distances 5 9 13 17 --rounds-factor 1 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add src to path for local development
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np
+import scipy.sparse
+import stim
+
+from asr_mp.dem_utils import dem_to_matrices
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare DEM-to-matrix parse times",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "-d",
+        "--distances",
+        nargs="+",
+        type=int,
+        default=[5, 9, 13, 17],
+        help="Code distances to benchmark",
+    )
+    parser.add_argument(
+        "-r",
+        "--rounds-factor",
+        nargs="+",
+        type=int,
+        default=[1, 3, 10],
+        help="Rounds as multiples of the distance",
+    )
+    parser.add_argument(
+        "-p",
+        "--error-rate",
+        type=float,
+        default=0.001,
+        help="Physical error rate",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Timing repeats per configuration (best is reported)",
+    )
+    return parser.parse_args()
+
+
+def dem_to_matrices_loop(
+    dem: stim.DetectorErrorModel,
+) -> tuple[scipy.sparse.csc_matrix, scipy.sparse.csc_matrix, np.ndarray]:
+    """Reference parser walking every target of every error instruction."""
+    row_inds_H: list[int] = []
+    col_inds_H: list[int] = []
+    row_inds_L: list[int] = []
+    col_inds_L: list[int] = []
+    priors: list[float] = []
+
+    col_idx = 0
+    for instruction in dem.flattened():
+        if instruction.type == "error":
+            priors.append(instruction.args_copy()[0])
+            for t in instruction.targets_copy():
+                if t.is_relative_detector_id():
+                    row_inds_H.append(t.val)
+                    col_inds_H.append(col_idx)
+                elif t.is_logical_observable_id():
+                    row_inds_L.append(t.val)
+                    col_inds_L.append(col_idx)
+            col_idx += 1
+
+    H = scipy.sparse.csc_matrix(
+        (np.ones(len(row_inds_H), dtype=np.uint8), (row_inds_H, col_inds_H)),
+        shape=(dem.num_detectors, col_idx),
+        dtype=np.uint8,
+    )
+    L = scipy.sparse.csc_matrix(
+        (np.ones(len(row_inds_L), dtype=np.uint8), (row_inds_L, col_inds_L)),
+        shape=(dem.num_observables, col_idx),
+        dtype=np.uint8,
+    )
+    # Symptoms repeated across "^" components cancel
+    for matrix in (H, L):
+        matrix.data %= 2
+        matrix.eliminate_zeros()
+    return H, L, np.array(priors)
+
+
+def best_time(func, dem: stim.DetectorErrorModel, repeats: int) -> float:
+    """Best wall-clock time of ``func(dem)`` over several repeats."""
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        func(dem)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main() -> None:
+    """Run the parser comparison."""
+    args = parse_args()
+
+    print("=" * 70)
+    print("DEM Parse Time")
+    print("=" * 70)
+    print(
+        f"{'d':<4} {'Rounds':<8} {'Errors':<10} {'loop (ms)':<12} {'vector (ms)':<12} "
+        f"{'Speedup':<8}"
+    )
+    print("-" * 70)
+
+    for d in args.distances:
+        for factor in args.rounds_factor:
+            rounds = d * factor
+            circuit = stim.Circuit.generated(
+                "surface_code:rotated_memory_z",
+                distance=d,
+                rounds=rounds,
+                after_clifford_depolarization=args.error_rate,
+                before_round_data_depolarization=args.error_rate,
+                before_measure_flip_probability=args.error_rate,
+                after_reset_flip_probability=args.error_rate,
+            )
+            dem = circuit.detector_error_model(decompose_errors=True)
+
+            H, L, priors = dem_to_matrices(dem)
+            H_ref, L_ref, priors_ref = dem_to_matrices_loop(dem)
+            assert (H != H_ref).nnz == 0 and (L != L_ref).nnz == 0
+            assert np.array_equal(priors, priors_ref)
+
+            loop_time = best_time(dem_to_matrices_loop, dem, args.repeats)
+            vector_time = best_time(dem_to_matrices, dem, args.repeats)
+
+            print(
+                f"{d:<4} {rounds:<8} {len(priors):<10} {loop_time * 1e3:<12.1f} "
+                f"{vector_time * 1e3:<12.1f} {loop_time / vector_time:<8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
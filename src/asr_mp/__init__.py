@@ -15,24 +15,48 @@ __version__ = "1.0.0-alpha"
 __author__ = "Justin Arndt"
 __email__ = "justin@example.com"
 
-from .decoder import ASRMPDecoder, TesseractBPOSD
-from .dem_utils import dem_to_matrices
+from .decoder import DECODER_PRESETS, ASRMPDecoder, TesseractBPOSD
+from .dem_utils import (
+    dem_to_graphlike_components,
+    dem_to_matrices,
+    dem_to_matrices_cached,
+    merge_duplicate_columns,
+)
+from .drift import DriftEstimator
+from .hierarchical import HierarchicalDecoder
+from .latency import LatencyBuffer, LatencyHistogram, LatencySampler
 from .noise_models import (
     generate_leakage_circuit,
     generate_leakage_tasks,
     generate_stress_circuit,
     generate_undeniable_tasks,
 )
+from .parallel import ParallelTesseractDecoder
+from .profiling import DecodeProfile
 from .union_find_decoder import UnionFindDecoder
+from .windowed import SlidingWindowBPOSD, SlidingWindowDecoder
 
 __all__ = [
     "ASRMPDecoder",
     "TesseractBPOSD",
+    "DECODER_PRESETS",
+    "ParallelTesseractDecoder",
+    "SlidingWindowDecoder",
+    "SlidingWindowBPOSD",
+    "DriftEstimator",
+    "HierarchicalDecoder",
+    "LatencyBuffer",
+    "LatencyHistogram",
+    "LatencySampler",
+    "DecodeProfile",
     "UnionFindDecoder",
     "generate_stress_circuit",
     "generate_undeniable_tasks",
     "generate_leakage_circuit",
     "generate_leakage_tasks",
     "dem_to_matrices",
+    "dem_to_graphlike_components",
+    "dem_to_matrices_cached",
+    "merge_duplicate_columns",
     "__version__",
 ]
@@ -0,0 +1,227 @@
+"""
+Batched BP Engine: Vectorized Belief Propagation over Many Syndromes
+
+Pure-NumPy flooding-schedule belief propagation on the Tanner graph of a
+parity check matrix. Messages for a whole batch of syndromes are held as
+2-D arrays of shape (num_shots, num_edges), so each iteration is a handful
+of array operations regardless of batch size. Shots that satisfy their
+syndrome drop out of the active set.
+
+Supported check-node rules:
+    - product_sum: exact tanh-rule
+    - minimum_sum: min-sum with normalization (ms_scaling_factor) and
+      offset (ms_offset) corrections
+"""
+
+import numpy as np
+import scipy.sparse
+
+from .dem_utils import get_channel_llrs
+
+# Cap on message magnitudes; keeps degree-1 checks and saturated tanh finite
+_MAX_LLR = 100.0
+
+_BP_METHODS = {
+    "product_sum": "product_sum",
+    "ps": "product_sum",
+    "minimum_sum": "minimum_sum",
+    "min_sum": "minimum_sum",
+    "ms": "minimum_sum",
+}
+
+
+class BatchBPDecoder:
+    """
+    Vectorized belief propagation decoder for batches of syndromes.
+
+    Attributes:
+        H: Parity check matrix (sparse, entries reduced mod 2)
+        bp_method: Check-node rule ("product_sum" or "minimum_sum")
+        max_iter: Maximum BP iterations
+        ms_scaling_factor: Min-sum normalization factor
+        ms_offset: Min-sum offset subtracted from message magnitudes
+        batch_size: Number of shots processed per message array
+        iterations: Iterations used per shot in the last decode call
+        failed_llrs: Posterior LLRs of the shots that did not converge in the
+            last decode call, in shot order (num_failed, num_errors)
+
+    Example:
+        >>> bp = BatchBPDecoder(H, priors, bp_method="minimum_sum", ms_scaling_factor=0.75)
+        >>> errors, converged = bp.decode(syndromes)
+    """
+
+    def __init__(
+        self,
+        H: scipy.sparse.spmatrix,
+        priors: np.ndarray,
+        bp_method: str = "product_sum",
+        max_iter: int = 50,
+        ms_scaling_factor: float = 1.0,
+        ms_offset: float = 0.0,
+        batch_size: int = 256,
+    ):
+        """
+        Initialize the batched BP decoder.
+
+        Args:
+            H: Parity check matrix (num_detectors × num_errors)
+            priors: Prior error probabilities for each column of H
+            bp_method: "product_sum" or "minimum_sum" (aliases "ps", "min_sum", "ms")
+            max_iter: Maximum BP iterations
+            ms_scaling_factor: Min-sum normalization factor (1.0 for plain min-sum)
+            ms_offset: Min-sum offset (0.0 for no offset)
+            batch_size: Shots per message array; bounds memory to batch_size × num_edges
+
+        Raises:
+            ValueError: If bp_method is not recognized
+        """
+        if bp_method not in _BP_METHODS:
+            raise ValueError(f"Unknown bp_method '{bp_method}'. Choose from: {sorted(_BP_METHODS)}")
+
+        H = scipy.sparse.csr_matrix(H, dtype=np.uint8)
+        H.data %= 2
+        H.eliminate_zeros()
+
+        self.H = H
+        self.bp_method = _BP_METHODS[bp_method]
+        self.max_iter = max_iter
+        self.ms_scaling_factor = ms_scaling_factor
+        self.ms_offset = ms_offset
+        self.batch_size = batch_size
+        self.iterations = np.zeros(0, dtype=np.int32)
+        self.failed_llrs = np.zeros((0, H.shape[1]))
+
+        # Edges sorted by check: CSR order already groups them
+        num_checks, num_vars = H.shape
+        self._edge_check = np.repeat(np.arange(num_checks), np.diff(H.indptr))
+        self._edge_var = H.indices.astype(np.int64)
+        num_edges = len(self._edge_var)
+
+        # Segment boundaries for per-check reductions (non-empty checks only)
+        degrees = np.diff(H.indptr)
+        self._seg_starts = H.indptr[:-1][degrees > 0]
+        self._edge_seg = np.repeat(np.arange(len(self._seg_starts)), degrees[degrees > 0])
+
+        # Edge → variable incidence, for summing check messages per variable
+        self._var_incidence = scipy.sparse.csr_matrix(
+            (np.ones(num_edges), (np.arange(num_edges), self._edge_var)),
+            shape=(num_edges, num_vars),
+        )
+        self._HT = H.T.tocsr()
+
+        self.update_channel_probs(priors)
+
+    def update_channel_probs(self, priors: np.ndarray) -> None:
+        """
+        Set the channel error probabilities.
+
+        Args:
+            priors: Prior error probabilities for each column of H
+        """
+        priors = np.asarray(priors, dtype=np.float64)
+        if priors.shape != (self.H.shape[1],):
+            raise ValueError(f"Expected {self.H.shape[1]} priors, got shape {priors.shape}")
+        self.channel_llrs = get_channel_llrs(priors)
+
+    def decode(self, syndromes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Run BP on a batch of syndromes.
+
+        Args:
+            syndromes: Binary syndrome array (num_shots, num_detectors)
+
+        Returns:
+            errors: Hard-decision error estimates (num_shots, num_errors)
+            converged: Whether each estimate reproduces its syndrome (num_shots,)
+        """
+        syndromes = np.asarray(syndromes, dtype=np.uint8)
+        num_shots = syndromes.shape[0]
+
+        errors = np.zeros((num_shots, self.H.shape[1]), dtype=np.uint8)
+        converged = np.zeros(num_shots, dtype=bool)
+        self.iterations = np.zeros(num_shots, dtype=np.int32)
+
+        failed_rows: list[np.ndarray] = []
+        failed_llrs: list[np.ndarray] = []
+        for start in range(0, num_shots, self.batch_size):
+            stop = min(start + self.batch_size, num_shots)
+            self._decode_chunk(
+                syndromes[start:stop], start, errors, converged, failed_rows, failed_llrs
+            )
+
+        # Shots give up in iteration order; put their posteriors in shot order
+        self.failed_llrs = np.zeros((0, self.H.shape[1]))
+        if failed_rows:
+            order = np.argsort(np.concatenate(failed_rows))
+            self.failed_llrs = np.concatenate(failed_llrs)[order]
+        return errors, converged
+
+    def _decode_chunk(
+        self,
+        syndromes: np.ndarray,
+        offset: int,
+        errors: np.ndarray,
+        converged: np.ndarray,
+        failed_rows: list[np.ndarray],
+        failed_llrs: list[np.ndarray],
+    ) -> None:
+        """Run BP on one chunk, writing results into the output arrays."""
+        llrs = self.channel_llrs
+        active = np.arange(syndromes.shape[0])
+        edge_syndrome = syndromes[:, self._edge_check].astype(bool)
+        q = np.broadcast_to(llrs[self._edge_var], (len(active), len(self._edge_var))).copy()
+
+        for it in range(1, self.max_iter + 1):
+            r = self._check_update(q, edge_syndrome)
+            posterior = llrs + r @ self._var_incidence
+            hard = (posterior < 0).astype(np.uint8)
+
+            done = (((hard @ self._HT) & 1) == syndromes[active]).all(axis=1)
+            finished = done if it < self.max_iter else np.ones_like(done)
+
+            rows = offset + active[finished]
+            errors[rows] = hard[finished]
+            converged[rows] = done[finished]
+            self.iterations[rows] = it
+            gave_up = finished & ~done
+            if gave_up.any():
+                failed_rows.append(offset + active[gave_up])
+                failed_llrs.append(np.asarray(posterior[gave_up]))
+
+            keep = ~finished
+            if not keep.any():
+                break
+            active = active[keep]
+            edge_syndrome = edge_syndrome[keep]
+            q = posterior[keep][:, self._edge_var] - r[keep]
+
+    def _check_update(self, q: np.ndarray, edge_syndrome: np.ndarray) -> np.ndarray:
+        """Compute check-to-variable messages from variable-to-check messages."""
+        starts = self._seg_starts
+        seg = self._edge_seg
+
+        # Outgoing sign: parity of the other incoming signs and the syndrome bit
+        negative = q < 0
+        parity = np.add.reduceat(negative, starts, axis=1, dtype=np.int32) & 1
+        flip = (parity[:, seg] == 1) ^ negative ^ edge_syndrome
+        sign = np.where(flip, -1.0, 1.0)
+
+        if self.bp_method == "product_sum":
+            log_mag = np.log(np.maximum(np.abs(np.tanh(q / 2)), 1e-300))
+            total = np.add.reduceat(log_mag, starts, axis=1)
+            excl = np.minimum(np.exp(total[:, seg] - log_mag), 1.0 - 1e-15)
+            mag = np.minimum(2 * np.arctanh(excl), _MAX_LLR)
+        else:
+            abs_q = np.abs(q)
+            min1 = np.minimum.reduceat(abs_q, starts, axis=1)
+            is_min = abs_q == min1[:, seg]
+            num_min = np.add.reduceat(is_min, starts, axis=1, dtype=np.int32)
+            min2 = np.minimum.reduceat(np.where(is_min, np.inf, abs_q), starts, axis=1)
+            unique_min = is_min & (num_min[:, seg] == 1)
+            mag = np.where(unique_min, min2[:, seg], min1[:, seg])
+            mag = np.minimum(mag, _MAX_LLR)
+            if self.ms_offset:
+                mag = np.maximum(mag - self.ms_offset, 0.0)
+            mag *= self.ms_scaling_factor
+
+        return sign * mag
@@ -0,0 +1,138 @@
+"""
+Cache Utilities: Bounded LRU Mapping
+
+Provides a small least-recently-used cache with entry and byte limits and
+hit/miss accounting, used to memoize decoder results.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used mapping.
+
+    Entries are evicted oldest-first once either ``max_entries`` or
+    ``max_bytes`` would be exceeded. Each instance is independent, so a
+    cache owned by a compiled decoder is private to its sinter worker.
+
+    Attributes:
+        max_entries: Maximum number of cached entries
+        max_bytes: Maximum total size of cached entries (None for no limit)
+        nbytes: Current total size of cached entries
+        hits: Number of successful lookups
+        misses: Number of failed lookups
+        evictions: Number of entries evicted to respect the limits
+
+    Example:
+        >>> cache = LRUCache(max_entries=2)
+        >>> cache.put(b"a", b"1", nbytes=2)
+        >>> cache.get(b"a")
+        b'1'
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached entries (must be positive)
+            max_bytes: Maximum total size in bytes (None for no limit)
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key, marking it as most recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value, or ``default`` if the key is not present
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int = 0) -> None:
+        """
+        Insert or replace an entry, evicting old entries as needed.
+
+        Entries larger than ``max_bytes`` on their own are not stored.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            nbytes: Size of the entry counted against ``max_bytes``
+        """
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[1]
+
+        self._data[key] = (value, nbytes)
+        self.nbytes += nbytes
+
+        while len(self._data) > self.max_entries or (
+            self.max_bytes is not None and self.nbytes > self.max_bytes
+        ):
+            _, (_, evicted_bytes) = self._data.popitem(last=False)
+            self.nbytes -= evicted_bytes
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._data.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / lookups
+
+    def stats(self) -> dict[str, float]:
+        """Summary of cache occupancy and hit/miss counters."""
+        return {
+            "entries": len(self._data),
+            "nbytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
@@ -12,7 +12,23 @@ import numpy as np
 import sinter
 import stim
 
-from .dem_utils import dem_to_matrices
+from .bp_engine import BatchBPDecoder
+from .cache import LRUCache
+from .dem_utils import (
+    DEFAULT_UNPACK_CHUNK_BYTES,
+    SyndromeUnpacker,
+    dem_to_matrices,
+    dem_to_matrices_cached,
+    get_probs_from_llrs,
+    logical_projection_words,
+    merge_duplicate_columns,
+    merge_priors,
+    pack_bit_rows,
+    project_packed,
+)
+from .drift import DriftEstimator
+from .latency import LatencyBuffer
+from .profiling import DecodeProfile
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore")
@@ -23,6 +39,17 @@ try:
 except ImportError:
     from ldpc import bposd_decoder as BpOsdDecoder
 
+# Speed/accuracy presets for ASRMPDecoder. Explicit keyword arguments
+# override the preset's values.
+#   fast:     OSD-0 only, short BP; lowest latency for online decoding
+#   balanced: OSD-CS order 10; reasonable suppression, <100ms per shot at d=5
+#   deep:     OSD-CS order 35; offline deep search for code capacity limits
+DECODER_PRESETS: dict[str, dict] = {
+    "fast": {"max_iter": 20, "osd_method": "osd_0", "osd_order": 0},
+    "balanced": {"max_iter": 50, "osd_method": "osd_cs", "osd_order": 10},
+    "deep": {"max_iter": 100, "osd_method": "osd_cs", "osd_order": 35},
+}
+
 
 class ASRMPDecoder:
     """
@@ -31,26 +58,72 @@ class ASRMPDecoder:
     A high-precision decoder using Belief Propagation with OSD post-processing.
     Designed for drift-resilient fault tolerance in the Tera-Quop regime.
 
+    Two BP backends are available:
+        - "ldpc": ldpc's compiled BP+OSD, one syndrome at a time
+        - "numpy": the in-package BatchBPDecoder runs BP on whole batches;
+          shots that fail to converge go to ldpc OSD seeded with their BP
+          posteriors (one BP iteration, so BP is not run twice)
+
+    The numpy backend is not a large throughput win: end to end it measured
+    1.1-1.4x the ldpc backend at d=3-5, p=0.003, and about 1.05x at d=7,
+    where BP converges on only ~40% of shots and OSD dominates
+    (scripts/benchmark_bp_backends.py).
+
+    Either way OSD only runs on shots whose BP estimate does not reproduce
+    the syndrome; the BP convergence counters show how many shots that is.
+
+    With ``adaptive_osd=True`` non-converged shots are first solved with
+    OSD-0. Its reliability margin is the total |LLR| of the bits where the
+    OSD-0 solution overrules BP's hard decision, under the BP posteriors.
+    The OSD-0 answer is kept unless that margin exceeds ``escalation_margin``;
+    only those unreliable shots are re-decoded with the configured OSD
+    method and order (pair with an osd_cs preset such as "deep").
+    The escalation tier is seeded with the shot's BP posteriors and runs a
+    single BP iteration, so ambiguous shots do not pay for BP twice.
+
+    With ``profile=True`` a DecodeProfile accumulates BP, OSD and logical
+    projection times and BP iteration counts; it is None otherwise, and the
+    decode loops then do no extra work.
+
+    Under drift only the error probabilities change. ``update_priors`` and
+    ``update_from_dem`` refresh them in place without re-parsing the DEM or
+    re-allocating the ldpc decoders.
+
     Attributes:
         H: Parity check matrix (sparse)
         L: Logical observable matrix (sparse)
         priors: Prior error probabilities
-        latencies: List of per-shot decode times (for profiling)
+        column_map: Merged column of each DEM error (None unless merge_duplicates)
+        latencies: Ring buffer of per-shot decode times (for profiling)
+        last_latencies: Per-shot decode times of the most recent batch
+        num_decoded: Number of shots decoded
+        num_bp_converged: Number of shots resolved by BP without OSD
+        last_batch_convergence: BP convergence rate of the most recent batch
+        tier_counts: Shots resolved at each adaptive OSD tier ("bp", "osd_0", "escalated")
+        profile: Per-stage timing breakdown (None unless profile=True)
 
     Example:
         >>> dem = circuit.detector_error_model(decompose_errors=True)
         >>> decoder = ASRMPDecoder(dem)
         >>> correction = decoder.decode(syndrome)
+        >>> fast_decoder = ASRMPDecoder(dem, preset="fast")
     """
 
     def __init__(
         self,
         dem: stim.DetectorErrorModel,
         bp_method: str = "product_sum",
-        max_iter: int = 50,
-        osd_method: str = "osd_cs",
-        osd_order: int = 35,
+        max_iter: int | None = None,
+        osd_method: str | None = None,
+        osd_order: int | None = None,
         error_rate: float = 0.001,
+        backend: str = "ldpc",
+        preset: str = "balanced",
+        adaptive_osd: bool = False,
+        escalation_margin: float = 20.0,
+        matrix_cache_dir: str | None = None,
+        merge_duplicates: bool = False,
+        profile: bool = False,
     ):
         """
         Initialize the ASR-MP decoder.
@@ -58,31 +131,169 @@ class ASRMPDecoder:
         Args:
             dem: Stim DetectorErrorModel
             bp_method: BP algorithm variant ("product_sum" for exact arithmetic)
-            max_iter: Maximum BP iterations (balanced for speed/accuracy)
-            osd_method: OSD variant ("osd_cs" for Combination Sweep)
-            osd_order: OSD search depth (35 for deep search, 0 for fast)
+            max_iter: Maximum BP iterations (default from preset)
+            osd_method: OSD variant, "osd_cs" for Combination Sweep (default from preset)
+            osd_order: OSD search depth, 35 for deep search, 0 for fast (default from preset)
             error_rate: Base error rate for channel initialization
+            backend: BP backend ("ldpc" or "numpy")
+            preset: Speed/accuracy preset ("fast", "balanced" or "deep"),
+                see DECODER_PRESETS
+            adaptive_osd: Try OSD-0 first and escalate only ambiguous shots
+            escalation_margin: Largest posterior |LLR| total the OSD-0 solution may
+                overrule before the shot is escalated
+            matrix_cache_dir: On-disk cache for the DEM-to-matrix conversion,
+                see dem_to_matrices_cached
+            merge_duplicates: Merge error mechanisms with identical supports into
+                one column (decoded errors are then over the merged columns)
+            profile: Collect a per-stage timing breakdown in ``self.profile``
+
+        Raises:
+            ValueError: If backend or preset is not recognized
         """
+        if backend not in ("ldpc", "numpy"):
+            raise ValueError(f"Unknown backend '{backend}'. Choose from: ['ldpc', 'numpy']")
+        if preset not in DECODER_PRESETS:
+            raise ValueError(f"Unknown preset '{preset}'. Choose from: {list(DECODER_PRESETS)}")
+
+        config = DECODER_PRESETS[preset]
+        max_iter = config["max_iter"] if max_iter is None else max_iter
+        osd_method = config["osd_method"] if osd_method is None else osd_method
+        osd_order = config["osd_order"] if osd_order is None else osd_order
+
         self.dem = dem
-        self.H, self.L, self.priors = dem_to_matrices(dem)
-        self.latencies: list[float] = []
+        self.H, self.L, self.priors = dem_to_matrices_cached(dem, cache_dir=matrix_cache_dir)
+        self.column_map = None
+        if merge_duplicates:
+            self.H, self.L, self.priors, self.column_map = merge_duplicate_columns(
+                self.H, self.L, self.priors
+            )
+        # Rows of L packed into uint64 words for the batched GF(2) projection
+        self.logical_words = logical_projection_words(self.L)
+        self.latencies = LatencyBuffer()
+        self.last_latencies = np.zeros(0)
+        self.profile = DecodeProfile() if profile else None
+
+        # BP convergence counters (non-converged shots are the ones paying for OSD)
+        self.num_decoded = 0
+        self.num_bp_converged = 0
+        self.last_batch_convergence = 0.0
 
         # Configuration parameters
         self.bp_method = bp_method
         self.max_iter = max_iter
         self.osd_method = osd_method
         self.osd_order = osd_order
+        self.backend = backend
+        self.preset = preset
+        self.adaptive_osd = adaptive_osd
+        self.escalation_margin = escalation_margin
+        self.tier_counts = {"bp": 0, "osd_0": 0, "escalated": 0}
+
+        # With the numpy backend the ldpc decoders only post-process shots
+        # BatchBPDecoder gave up on; they are seeded with its posteriors and
+        # run a single BP iteration before OSD
+        ldpc_iter = 1 if backend == "numpy" else max_iter
+
+        # Initialize the BP+OSD decoder (adaptive OSD uses its own tiers instead)
+        self.bpd = None
+        if not adaptive_osd:
+            self.bpd = BpOsdDecoder(
+                self.H,
+                error_rate=error_rate,
+                channel_probs=self.priors,
+                bp_method=bp_method,
+                max_iter=ldpc_iter,
+                osd_method=osd_method,
+                osd_order=osd_order,
+            )
 
-        # Initialize the BP+OSD decoder
-        self.bpd = BpOsdDecoder(
-            self.H,
-            error_rate=error_rate,
-            channel_probs=self.priors,
-            bp_method=bp_method,
-            max_iter=50,   # FAST: Standard convergence
-            osd_method=osd_method,
-            osd_order=10,  # FAST: Reasonable suppression, <100ms per shot
-        )
+        # Adaptive OSD tiers: full BP + OSD-0, then a warm-started deep OSD
+        self.bpd_osd0 = None
+        self.bpd_escalate = None
+        if adaptive_osd:
+            self.bpd_osd0 = BpOsdDecoder(
+                self.H,
+                error_rate=error_rate,
+                channel_probs=self.priors,
+                bp_method=bp_method,
+                max_iter=ldpc_iter,
+                osd_method="osd_0",
+                osd_order=0,
+            )
+            self.bpd_escalate = BpOsdDecoder(
+                self.H,
+                error_rate=error_rate,
+                channel_probs=self.priors,
+                bp_method=bp_method,
+                max_iter=1,
+                osd_method=osd_method,
+                osd_order=osd_order,
+            )
+        self._decode_one = self._decode_adaptive if adaptive_osd else self.bpd.decode
+        self._bp_stage = self.bpd_osd0 if adaptive_osd else self.bpd
+
+        # Batched BP engine for the numpy backend
+        self.bp = None
+        if backend == "numpy":
+            self.bp = BatchBPDecoder(self.H, self.priors, bp_method=bp_method, max_iter=max_iter)
+
+    def update_priors(self, new_priors: np.ndarray) -> None:
+        """
+        Replace the channel error probabilities in place.
+
+        H, L and the allocated BP+OSD decoders are kept; only their channel
+        probabilities are updated.
+
+        Args:
+            new_priors: Error probabilities, one per column of H, or one per
+                DEM error when duplicate columns were merged
+
+        Raises:
+            ValueError: If the length does not match or a probability is outside [0, 1]
+        """
+        priors = np.asarray(new_priors, dtype=np.float64)
+        if self.column_map is not None and priors.shape == self.column_map.shape:
+            priors = merge_priors(priors, self.column_map)
+        if priors.shape != (self.H.shape[1],):
+            raise ValueError(f"Expected {self.H.shape[1]} priors, got shape {priors.shape}")
+        if not np.all((priors >= 0) & (priors <= 1)):
+            raise ValueError("Priors must be probabilities in [0, 1]")
+
+        self.priors = priors
+        if self.bpd is not None:
+            self.bpd.update_channel_probs(priors)
+        if self.bpd_osd0 is not None:
+            # The escalation tier is re-seeded per shot from BP posteriors
+            self.bpd_osd0.update_channel_probs(priors)
+        if self.bp is not None:
+            self.bp.update_channel_probs(priors)
+
+    def update_from_dem(self, dem: stim.DetectorErrorModel) -> None:
+        """
+        Take new error probabilities from a DEM with the same structure.
+
+        Args:
+            dem: DetectorErrorModel whose errors flip the same detectors and
+                observables, in the same order, as the decoder's DEM
+
+        Raises:
+            ValueError: If the DEM's structure differs from the decoder's
+        """
+        H, L, priors = dem_to_matrices(dem)
+        expected_H, expected_L = self.H, self.L
+        if self.column_map is not None:
+            expected_H, expected_L = self.H[:, self.column_map], self.L[:, self.column_map]
+
+        if (
+            H.shape != expected_H.shape
+            or L.shape != expected_L.shape
+            or (H != expected_H).nnz
+            or (L != expected_L).nnz
+        ):
+            raise ValueError("DEM structure differs from the decoder's; build a new decoder")
+
+        self.update_priors(priors)
+        self.dem = dem
 
     def decode(self, syndrome: np.ndarray) -> np.ndarray:
         """
@@ -94,11 +305,143 @@ class ASRMPDecoder:
         Returns:
             Estimated error array
         """
+        if self.bp is not None:
+            return self.decode_batch(np.asarray(syndrome)[np.newaxis])[0]
+
         t0 = time.perf_counter()
-        estimated_error = self.bpd.decode(syndrome)
-        self.latencies.append(time.perf_counter() - t0)
+        estimated_error = self._decode_one(syndrome)
+        elapsed = time.perf_counter() - t0
+        self.latencies.append(elapsed)
+        converged = bool(self._bp_stage.converge)
+        self._record_convergence(int(converged), 1)
+        if self.profile is not None:
+            self.profile.add_bp_osd([elapsed], [converged], [self._bp_stage.iter])
         return estimated_error
 
+    def decode_batch(self, syndromes: np.ndarray) -> np.ndarray:
+        """
+        Decode a batch of syndromes.
+
+        Dtype conversion, output allocation and latency bookkeeping are done
+        once per batch; only the BP+OSD call itself runs per shot. BP runs on
+        every shot and OSD only on the shots where BP fails to converge.
+
+        Args:
+            syndromes: Binary syndrome array (num_shots, num_detectors)
+
+        Returns:
+            Estimated error array (num_shots, num_errors)
+        """
+        syndromes = np.ascontiguousarray(syndromes, dtype=np.uint8)
+        if self.bp is not None:
+            return self._decode_batch_numpy(syndromes)
+
+        num_shots = syndromes.shape[0]
+        errors = np.empty((num_shots, self.H.shape[1]), dtype=np.uint8)
+        converged = np.empty(num_shots, dtype=bool)
+
+        # ldpc's BpOsdDecoder only enters OSD when its BP stage fails
+        decode = self._decode_one
+        bp_stage = self._bp_stage
+        clock = time.perf_counter
+        stamps = np.empty(num_shots + 1)
+        stamps[0] = clock()
+        if self.profile is None:
+            for i in range(num_shots):
+                errors[i] = decode(syndromes[i])
+                stamps[i + 1] = clock()
+                converged[i] = bp_stage.converge
+        else:
+            iterations = np.empty(num_shots, dtype=np.int64)
+            for i in range(num_shots):
+                errors[i] = decode(syndromes[i])
+                stamps[i + 1] = clock()
+                converged[i] = bp_stage.converge
+                iterations[i] = bp_stage.iter
+            self.profile.add_bp_osd(np.diff(stamps), converged, iterations)
+
+        self.last_latencies = np.diff(stamps)
+        self.latencies.extend(self.last_latencies)
+        self._record_convergence(int(converged.sum()), num_shots)
+        return errors
+
+    def _decode_batch_numpy(self, syndromes: np.ndarray) -> np.ndarray:
+        """Batched BP on all shots, then posterior-seeded OSD on the non-converged subset."""
+        num_shots = syndromes.shape[0]
+        t0 = time.perf_counter()
+
+        errors, converged = self.bp.decode(syndromes)
+        t_bp = time.perf_counter()
+        failed = np.flatnonzero(~converged)
+        posteriors = get_probs_from_llrs(self.bp.failed_llrs)
+        seed = self._bp_stage.update_channel_probs
+        clock = time.perf_counter
+        stamps = np.empty(len(failed) + 1)
+        stamps[0] = clock()
+        for k, i in enumerate(failed):
+            seed(posteriors[k])
+            errors[i] = self._decode_one(syndromes[i])
+            stamps[k + 1] = clock()
+        if self.profile is not None:
+            # The seeded decoder's single BP iteration is counted as OSD here
+            self.profile.add("bp", t_bp - t0, num_shots)
+            self.profile.add("osd", time.perf_counter() - t_bp, len(failed))
+            self.profile.add_iterations(self.bp.iterations)
+        if self.adaptive_osd:
+            self.tier_counts["bp"] += int(converged.sum())
+
+        # Batched BP time is shared evenly; fallback shots add their own time
+        shot_seconds = np.full(num_shots, (t_bp - t0) / max(num_shots, 1))
+        shot_seconds[failed] += np.diff(stamps)
+        self.last_latencies = shot_seconds
+        self.latencies.extend(shot_seconds)
+        self._record_convergence(int(converged.sum()), num_shots)
+        return errors
+
+    def _decode_adaptive(self, syndrome: np.ndarray) -> np.ndarray:
+        """Tiered OSD: keep the OSD-0 answer unless its reliability margin is too large."""
+        error = self.bpd_osd0.decode(syndrome)
+        if self.bpd_osd0.converge:
+            self.tier_counts["bp"] += 1
+            return error
+
+        # Posterior evidence against the OSD-0 solution: |LLR| summed over
+        # the bits where it disagrees with BP's hard decision
+        llrs = np.asarray(self.bpd_osd0.log_prob_ratios)
+        overruled = error.astype(bool) != (llrs < 0)
+        if np.abs(llrs[overruled]).sum() <= self.escalation_margin:
+            self.tier_counts["osd_0"] += 1
+            return error
+
+        # Seed the deep tier with this shot's BP posteriors instead of
+        # re-running BP; one iteration refreshes the OSD reliability order
+        self.tier_counts["escalated"] += 1
+        posteriors = get_probs_from_llrs(llrs)
+        self.bpd_escalate.update_channel_probs(posteriors)
+        return self.bpd_escalate.decode(syndrome)
+
+    @property
+    def tier_fractions(self) -> dict[str, float]:
+        """Fraction of adaptive-OSD shots resolved at each tier."""
+        total = sum(self.tier_counts.values())
+        if not total:
+            return dict.fromkeys(self.tier_counts, 0.0)
+        return {tier: count / total for tier, count in self.tier_counts.items()}
+
+    def _record_convergence(self, num_converged: int, num_shots: int) -> None:
+        """Update the BP convergence counters after a decode call."""
+        self.num_decoded += num_shots
+        self.num_bp_converged += num_converged
+        if num_shots:
+            self.last_batch_convergence = num_converged / num_shots
+
+    @property
+    def bp_convergence_rate(self) -> float:
+        """Fraction of decoded shots resolved by BP alone (no OSD)."""
+        if not self.num_decoded:
+            return 0.0
+        return self.num_bp_converged / self.num_decoded
+
     def get_logical_correction(self, syndrome: np.ndarray) -> np.ndarray:
         """
         Get the logical observable correction for a syndrome.
@@ -109,15 +452,55 @@ class ASRMPDecoder:
         Returns:
             Logical correction array (num_observables,)
         """
-        estimated_error = self.decode(syndrome)
-        correction = (self.L @ estimated_error) % 2
-        return np.asarray(correction, dtype=np.uint8).flatten()
+        estimated_error = np.asarray(self.decode(syndrome), dtype=np.uint8)
+        predictions = self._project(estimated_error[np.newaxis])
+        return np.unpackbits(predictions[0], count=self.L.shape[0], bitorder="little")
+
+    def get_logical_correction_batch(self, syndromes: np.ndarray) -> np.ndarray:
+        """
+        Get the logical observable corrections for a batch of syndromes.
+
+        Args:
+            syndromes: Binary syndrome array (num_shots, num_detectors)
+
+        Returns:
+            Logical correction array (num_shots, num_observables)
+        """
+        predictions = self.get_logical_correction_packed(syndromes)
+        return np.unpackbits(predictions, axis=1, count=self.L.shape[0], bitorder="little")
+
+    def get_logical_correction_packed(self, syndromes: np.ndarray) -> np.ndarray:
+        """
+        Get bit-packed logical observable corrections for a batch of syndromes.
+
+        The estimated errors are packed into uint64 words and projected with
+        one GF(2) product against the packed rows of L, producing sinter's
+        packed observable bytes without a per-shot sparse product.
+
+        Args:
+            syndromes: Binary syndrome array (num_shots, num_detectors)
+
+        Returns:
+            Bit-packed logical corrections (num_shots, ceil(num_observables/8))
+        """
+        return self._project(self.decode_batch(syndromes))
+
+    def _project(self, estimated_errors: np.ndarray) -> np.ndarray:
+        """Pack estimated errors and project them onto the logical observables."""
+        if self.profile is None:
+            return project_packed(pack_bit_rows(estimated_errors), self.logical_words)
+
+        t0 = time.perf_counter()
+        error_words = pack_bit_rows(estimated_errors)
+        t1 = time.perf_counter()
+        predictions = project_packed(error_words, self.logical_words)
+        self.profile.add("pack", t1 - t0, len(predictions))
+        self.profile.add("projection", time.perf_counter() - t1, len(predictions))
+        return predictions
 
     def get_average_latency(self) -> float:
         """Get average decode latency in seconds."""
-        if not self.latencies:
-            return 0.0
-        return sum(self.latencies) / len(self.latencies)
+        return self.latencies.average()
 
     def reset_latencies(self) -> None:
         """Clear latency tracking data."""
@@ -130,17 +513,67 @@ class TesseractCompiledDecoder(sinter.CompiledDecoder):
 
     This class implements the sinter.CompiledDecoder interface for
     integration with sinter's Monte Carlo sampling framework.
+
+    Identical shots within a batch are decoded once and scattered back.
+    An optional LRU cache memoizes predictions keyed by the bit-packed
+    syndrome bytes. The cache belongs to this instance, so each sinter
+    worker keeps its own.
+
+    With ``drift_window`` set, every batch also feeds a DriftEstimator and
+    the decoder's priors are re-estimated every ``drift_update_shots`` shots.
+
+    Shots are decoded in chunks whose unpacked syndromes and error estimates
+    (shots × errors) each fit in ``chunk_bytes``, so peak memory does not
+    grow with the batch size.
+
+    ``latencies`` holds one sample per input shot: each shot is charged the
+    BP+OSD time of its (deduplicated) syndrome, zero for trivial shots and
+    cache hits, plus an even share of the batch's remaining overhead.
     """
 
-    def __init__(self, dem: stim.DetectorErrorModel):
+    def __init__(
+        self,
+        dem: stim.DetectorErrorModel,
+        cache_size: int = 0,
+        cache_bytes: int | None = None,
+        deduplicate: bool = True,
+        drift_window: int = 0,
+        drift_update_shots: int = 10_000,
+        chunk_bytes: int = DEFAULT_UNPACK_CHUNK_BYTES,
+        **decoder_kwargs,
+    ):
         """
         Initialize the compiled decoder.
 
         Args:
             dem: Stim DetectorErrorModel
+            cache_size: Maximum number of cached syndromes (0 disables the cache)
+            cache_bytes: Maximum cache size in bytes (None for no byte limit)
+            deduplicate: Decode each distinct syndrome in a batch only once
+            drift_window: Shots remembered by the drift estimator (0 disables tracking)
+            drift_update_shots: Shots between prior re-estimations
+            chunk_bytes: Size bound in bytes of each chunk's unpacked syndromes
+                and of its error estimates
+            **decoder_kwargs: Forwarded to ASRMPDecoder
         """
         self.dem = dem
-        self.decoder = ASRMPDecoder(dem)
+        self.decoder = ASRMPDecoder(dem, **decoder_kwargs)
+        # Each chunk's (shots × errors) estimate matrix is bounded as well
+        self.unpacker = SyndromeUnpacker(dem.num_detectors, chunk_bytes, self.decoder.H.shape[1])
+        self.cache = LRUCache(cache_size, cache_bytes) if cache_size > 0 else None
+        self.deduplicate = deduplicate
+
+        # Online prior tracking
+        self.drift = DriftEstimator(dem, window=drift_window) if drift_window > 0 else None
+        self.drift_update_shots = drift_update_shots
+        self.num_prior_updates = 0
+        self._shots_since_update = 0
+
+        # Shot counters for the trivial-syndrome fast path and deduplication
+        self.num_shots = 0
+        self.num_trivial_shots = 0
+        self.num_unique_shots = 0
+        self.latencies = LatencyBuffer()
 
     def decode_shots_bit_packed(
         self,
@@ -151,6 +584,10 @@ class TesseractCompiledDecoder(sinter.CompiledDecoder):
         """
         Decode multiple shots from bit-packed syndrome data.
 
+        Shots with no detection events are answered with a zero prediction
+        directly from the packed bytes, without calling BP+OSD. The remaining
+        shots are grouped by syndrome so each distinct pattern is decoded once.
+
         Args:
             bit_packed_detection_event_data: Bit-packed syndrome array
                 Shape: (num_shots, ceil(num_detectors/8))
@@ -159,36 +596,172 @@ class TesseractCompiledDecoder(sinter.CompiledDecoder):
             Bit-packed logical predictions
                 Shape: (num_shots, ceil(num_observables/8))
         """
+        t0 = time.perf_counter()
         num_shots = bit_packed_detection_event_data.shape[0]
-        num_obs = self.dem.num_observables
-        num_obs_bytes = (num_obs + 7) // 8
-
-        shots = np.unpackbits(
-            bit_packed_detection_event_data,
-            axis=1,
-            count=self.dem.num_detectors,
-            bitorder="little",
-        )
+        num_obs_bytes = (self.dem.num_observables + 7) // 8
 
-        # Pre-allocate bit-packed result array
+        # Pre-allocate bit-packed result array (zero prediction by default)
         result = np.zeros((num_shots, num_obs_bytes), dtype=np.uint8)
+        shot_seconds = np.zeros(num_shots)
+
+        nontrivial = np.flatnonzero(bit_packed_detection_event_data.any(axis=1))
+        self.num_shots += num_shots
+        self.num_trivial_shots += num_shots - len(nontrivial)
+
+        if not len(nontrivial):
+            self._track_drift(bit_packed_detection_event_data)
+            self._record_latencies(shot_seconds, 0.0, t0)
+            return result
+
+        packed = bit_packed_detection_event_data[nontrivial]
+        inverse = None
+        if self.deduplicate:
+            packed, inverse = np.unique(packed, axis=0, return_inverse=True)
+        self.num_unique_shots += packed.shape[0]
+
+        if self.cache is None:
+            predictions, row_seconds = self._decode_packed(packed)
+        else:
+            predictions, row_seconds = self._decode_packed_cached(packed)
+
+        if inverse is None:
+            result[nontrivial] = predictions
+            shot_seconds[nontrivial] = row_seconds
+        else:
+            inverse = inverse.reshape(-1)
+            result[nontrivial] = predictions[inverse]
+            shot_seconds[nontrivial] = row_seconds[inverse]
+        self._track_drift(bit_packed_detection_event_data)
+        self._record_latencies(shot_seconds, float(row_seconds.sum()), t0)
+        return result
+
+    def _record_latencies(self, shot_seconds: np.ndarray, decode_seconds: float, t0: float) -> None:
+        """Add one latency sample per shot, sharing the non-decode time evenly."""
+        if not len(shot_seconds):
+            return
+        overhead = time.perf_counter() - t0 - decode_seconds
+        self.latencies.extend(shot_seconds + max(overhead, 0.0) / len(shot_seconds))
+
+    def _track_drift(self, bit_packed_detection_event_data: np.ndarray) -> None:
+        """Feed a decoded batch to the drift estimator and refresh priors when due."""
+        if self.drift is None:
+            return
+        self.drift.update(bit_packed_detection_event_data)
+        self._shots_since_update += bit_packed_detection_event_data.shape[0]
+        if self._shots_since_update >= self.drift_update_shots:
+            self.update_priors(self.drift.estimate_priors())
+            self.num_prior_updates += 1
+            self._shots_since_update = 0
+
+    def update_priors(self, new_priors: np.ndarray) -> None:
+        """
+        Replace the decoder's error probabilities and drop cached predictions.
 
-        for i in range(num_shots):
-            syndrome = shots[i]
-            correction = self.decoder.get_logical_correction(syndrome)
-            # Pack each row individually
-            packed = np.packbits(
-                np.asarray(correction, dtype=np.uint8).flatten()[:num_obs],
-                bitorder="little",
-            )
-            result[i, : len(packed)] = packed
+        Args:
+            new_priors: See ASRMPDecoder.update_priors
+        """
+        self.decoder.update_priors(new_priors)
+        if self.cache is not None:
+            self.cache.clear()
+
+    def update_from_dem(self, dem: stim.DetectorErrorModel) -> None:
+        """
+        Take new error probabilities from a structurally identical DEM.
 
-        return np.ascontiguousarray(result)
+        Args:
+            dem: See ASRMPDecoder.update_from_dem
+        """
+        self.decoder.update_from_dem(dem)
+        self.dem = dem
+        if self.cache is not None:
+            self.cache.clear()
+
+    def _decode_packed(self, packed: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Decode bit-packed syndromes into bit-packed predictions and per-row decode times."""
+        profile = self.decoder.profile
+        num_shots = packed.shape[0]
+        num_obs_bytes = (self.dem.num_observables + 7) // 8
+        predictions = np.empty((num_shots, num_obs_bytes), dtype=np.uint8)
+        row_seconds = np.empty(num_shots)
+
+        chunk = self.unpacker.chunk_shots
+        for start in range(0, num_shots, chunk):
+            stop = min(start + chunk, num_shots)
+            t0 = time.perf_counter()
+            shots = self.unpacker.unpack(packed[start:stop])
+            if profile is not None:
+                profile.add("unpack", time.perf_counter() - t0, len(shots))
+            predictions[start:stop] = self.decoder.get_logical_correction_packed(shots)
+            row_seconds[start:stop] = self.decoder.last_latencies
+        return predictions, row_seconds
+
+    def _decode_packed_cached(self, packed: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Decode bit-packed syndromes, serving repeats from the LRU cache."""
+        num_obs_bytes = (self.dem.num_observables + 7) // 8
+        predictions = np.empty((packed.shape[0], num_obs_bytes), dtype=np.uint8)
+        row_seconds = np.zeros(packed.shape[0])
+
+        keys = [row.tobytes() for row in packed]
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self.cache.get(key)
+            if cached is None:
+                missing.append(i)
+            else:
+                predictions[i] = np.frombuffer(cached, dtype=np.uint8)
+
+        if missing:
+            decoded, row_seconds[missing] = self._decode_packed(packed[missing])
+            predictions[missing] = decoded
+            for i, row in zip(missing, decoded):
+                value = row.tobytes()
+                self.cache.put(keys[i], value, nbytes=len(keys[i]) + len(value))
+
+        return predictions, row_seconds
 
     @property
-    def latencies(self) -> list[float]:
-        """Access decoder latencies for profiling."""
-        return self.decoder.latencies
+    def trivial_fraction(self) -> float:
+        """Fraction of shots answered by the zero-syndrome fast path."""
+        if not self.num_shots:
+            return 0.0
+        return self.num_trivial_shots / self.num_shots
+
+    def get_average_latency(self) -> float:
+        """Get average per-shot latency in seconds, trivial shots included."""
+        return self.latencies.average()
+
+    def reset_latencies(self) -> None:
+        """Clear per-shot and BP+OSD latency tracking data."""
+        self.latencies.clear()
+        self.decoder.reset_latencies()
+
+    def get_stats(self) -> dict:
+        """
+        Summarize shot routing and cache behaviour for profiling.
+
+        Returns:
+            Dictionary of shot counters, plus cache statistics when enabled
+        """
+        stats = {
+            "shots": self.num_shots,
+            "trivial_shots": self.num_trivial_shots,
+            "trivial_fraction": self.trivial_fraction,
+            "unique_shots": self.num_unique_shots,
+            "bp_convergence_rate": self.decoder.bp_convergence_rate,
+            "osd_shots": self.decoder.num_decoded - self.decoder.num_bp_converged,
+            "average_latency": self.get_average_latency(),
+            "latency": self.latencies.summary(),
+            "bp_osd_average_latency": self.decoder.get_average_latency(),
+        }
+        if self.decoder.adaptive_osd:
+            stats["osd_tiers"] = self.decoder.tier_fractions
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        if self.drift is not None:
+            stats["prior_updates"] = self.num_prior_updates
+        if self.decoder.profile is not None:
+            stats["profile"] = self.decoder.profile.to_dict()
+        return stats
 
 
 class TesseractBPOSD(sinter.Decoder):
@@ -203,8 +776,20 @@ class TesseractBPOSD(sinter.Decoder):
             custom_decoders={'tesseract': TesseractBPOSD()},
             ...
         )
+
+    Keyword arguments are forwarded to every compiled decoder, e.g.
+    ``TesseractBPOSD(cache_size=100_000)`` enables the syndrome cache.
     """
 
+    def __init__(self, **compile_kwargs):
+        """
+        Initialize the decoder factory.
+
+        Args:
+            **compile_kwargs: Forwarded to TesseractCompiledDecoder
+        """
+        self.compile_kwargs = compile_kwargs
+
     def compile_decoder_for_dem(
         self,
         *,
@@ -220,7 +805,7 @@ class TesseractBPOSD(sinter.Decoder):
         Returns:
             Compiled decoder instance
         """
-        return TesseractCompiledDecoder(dem)
+        return TesseractCompiledDecoder(dem, **self.compile_kwargs)
 
     def decode_via_files(self, *args, **kwargs):
         """Not implemented - use compile_decoder_for_dem instead."""
@@ -2,14 +2,210 @@
 DEM Utilities: Detector Error Model to Matrix Conversion
 
 Provides utilities for converting Stim's DetectorErrorModel into sparse
-matrices suitable for belief propagation decoding.
+matrices suitable for belief propagation decoding, with an optional
+content-hash keyed cache so repeated decoder compilations skip the parse.
 """
 
+import hashlib
+import os
+import re
 
 import numpy as np
 import scipy.sparse
 import stim
 
+from .cache import LRUCache
+
+# Lines that do not affect the matrices (detector coordinates,
+# logical_observable declarations) are dropped before parsing
+_SKIPPED_LINE = re.compile(
+    rb"^(?![ \t]*(?:error[(\[]|repeat[ \[]|shift_detectors[ (\[]|\})).*\n?", re.MULTILINE
+)
+
+# Instruction heads, each with an optional tag: "error(", "repeat 10 {",
+# "}", "shift_detectors(0, 0, 1)"
+_ERROR_HEAD = re.compile(rb"^[ \t]*error(?:\[[^\]]*\])?\(", re.MULTILINE)
+_REPEAT_HEAD = re.compile(rb"^[ \t]*repeat(?:\[[^\]]*\])? (\d+) \{", re.MULTILINE)
+_BLOCK_END = re.compile(rb"^[ \t]*\}", re.MULTILINE)
+_SHIFT_HEAD = re.compile(rb"^[ \t]*shift_detectors(?:\[[^\]]*\])?(?:\([^)]*\))?", re.MULTILINE)
+
+# Marker values written in place of instruction heads and "^" separators; no
+# target, probability or count can parse to them
+_ERROR_MARK = -1.0e300
+_REPEAT_MARK = -2.0e300
+_END_MARK = -3.0e300
+_SHIFT_MARK = -4.0e300
+_SEPARATOR_MARK = -5.0e300
+
+# ")" becomes a separator; "D" is dropped so detector ids parse as
+# non-negative numbers; "L" becomes "-" so observable ids parse with the
+# sign bit set (including "L0" -> -0.0)
+_TARGET_TABLE = bytes.maketrans(b")DL", b"  -")
+
+
+def _tokenize_dem(dem: stim.DetectorErrorModel) -> np.ndarray:
+    """
+    Rewrite the (unflattened) DEM text as a flat array of numbers.
+
+    Each instruction becomes its marker followed by its numeric argument
+    (probability, repeat count or shift) and, for errors, its targets.
+    """
+    text = _SKIPPED_LINE.sub(b"", str(dem).encode())
+    text = _ERROR_HEAD.sub(b" -1e300 ", text)
+    text = _REPEAT_HEAD.sub(rb" -2e300 \1 ", text)
+    text = _BLOCK_END.sub(b" -3e300 ", text)
+    text = _SHIFT_HEAD.sub(b" -4e300 ", text)
+    text = text.replace(b"^", b" -5e300 ").translate(_TARGET_TABLE)
+    return np.array(text.split(), dtype=np.float64)
+
+
+def _expand_repeats(values: np.ndarray, is_error: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Unroll repeat blocks without materializing the flattened DEM.
+
+    Only the structural instructions (repeat, block end, shift_detectors) are
+    visited in Python; each block body is expanded once and tiled.
+
+    Returns:
+        source: Index into the DEM's error instructions of each emitted column
+        offsets: Detector shift applied to each emitted column
+    """
+    error_count = np.cumsum(is_error) - is_error
+    structural = np.flatnonzero(
+        (values == _REPEAT_MARK) | (values == _END_MARK) | (values == _SHIFT_MARK)
+    )
+
+    # Frames: [sources, offsets, shift, repeat count]
+    stack: list[list] = [[[], [], 0, 1]]
+    next_error = 0
+
+    def emit_run(frame: list, stop: int) -> None:
+        if stop > next_error:
+            frame[0].append(np.arange(next_error, stop))
+            frame[1].append(np.full(stop - next_error, frame[2], dtype=np.int64))
+
+    for pos in structural:
+        frame = stack[-1]
+        stop = int(error_count[pos])
+        emit_run(frame, stop)
+        next_error = max(next_error, stop)
+
+        marker = values[pos]
+        if marker == _SHIFT_MARK:
+            frame[2] += int(values[pos + 1])
+        elif marker == _REPEAT_MARK:
+            stack.append([[], [], 0, int(values[pos + 1])])
+        else:
+            body_sources, body_offsets, body_shift, count = stack.pop()
+            parent = stack[-1]
+            if body_sources:
+                sources = np.concatenate(body_sources)
+                offsets = np.concatenate(body_offsets)
+                parent[0].append(np.tile(sources, count))
+                parent[1].append(
+                    np.tile(offsets, count)
+                    + np.repeat(np.arange(count, dtype=np.int64) * body_shift, len(sources))
+                    + parent[2]
+                )
+            parent[2] += count * body_shift
+
+    emit_run(stack[0], int(np.count_nonzero(is_error)))
+    sources, offsets = stack[0][0], stack[0][1]
+    if not sources:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(sources), np.concatenate(offsets)
+
+
+def _ragged_gather(ptr: np.ndarray, source: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenate the ranges ``ptr[s]:ptr[s + 1]`` for every ``s`` in source.
+
+    Returns:
+        indices: Concatenated range entries
+        owner: Position in ``source`` each entry came from
+    """
+    counts = ptr[source + 1] - ptr[source]
+    owner = np.repeat(np.arange(len(source)), counts)
+    starts = np.cumsum(counts) - counts
+    indices = np.arange(int(counts.sum())) - starts[owner] + ptr[source][owner]
+    return indices, owner
+
+
+def _parse_dem(dem: stim.DetectorErrorModel) -> dict[str, np.ndarray]:
+    """
+    Parse a DEM into per-instruction target arrays plus its repeat expansion.
+
+    Returns:
+        Dictionary with
+            priors: Probability of each error instruction
+            targets: Target values in order; detectors as non-negative ids,
+                observables with the sign bit set
+            target_component: Component (``^``-separated part) of each target
+            component_error: Error instruction owning each component
+            source, offsets: Expansion from _expand_repeats
+    """
+    values = _tokenize_dem(dem)
+    is_error = values == _ERROR_MARK
+    is_separator = values == _SEPARATOR_MARK
+    is_head = is_error | (values == _REPEAT_MARK) | (values == _END_MARK) | (values == _SHIFT_MARK)
+
+    # The value following a head is its argument, not a target
+    is_arg = np.zeros_like(is_head)
+    is_arg[1:] = is_head[:-1] & (values[:-1] != _END_MARK)
+
+    # Targets are the values inside error instructions
+    head_positions = np.flatnonzero(is_head)
+    in_error = is_error[head_positions][np.cumsum(is_head) - 1] if len(values) else is_error
+    is_target = in_error & ~(is_head | is_arg | is_separator)
+
+    is_component_start = is_error | is_separator
+    component_id = np.cumsum(is_component_start) - 1
+    component_error = (np.cumsum(is_error) - 1)[is_component_start]
+
+    source, offsets = _expand_repeats(values, is_error)
+    return {
+        "priors": values[np.flatnonzero(is_error) + 1],
+        "targets": values[is_target],
+        "target_component": component_id[is_target],
+        "component_error": component_error,
+        "source": source,
+        "offsets": offsets,
+    }
+
+
+def _targets_to_matrices(
+    dem: stim.DetectorErrorModel,
+    targets: np.ndarray,
+    target_owner: np.ndarray,
+    num_owners: int,
+    source: np.ndarray,
+    offsets: np.ndarray,
+) -> tuple[scipy.sparse.csc_matrix, scipy.sparse.csc_matrix]:
+    """Build (H, L) with one column per emitted owner, reducing entries mod 2."""
+    ptr = np.searchsorted(target_owner, np.arange(num_owners + 1))
+    indices, cols = _ragged_gather(ptr, source)
+    values = targets[indices]
+    is_obs = np.signbit(values)
+    is_det = ~is_obs
+    shape_cols = len(source)
+
+    matrices = []
+    for mask, rows, num_rows in (
+        (is_det, values[is_det].astype(np.int64) + offsets[cols[is_det]], dem.num_detectors),
+        (is_obs, (-values[is_obs]).astype(np.int64), dem.num_observables),
+    ):
+        matrix = scipy.sparse.csc_matrix(
+            (np.ones(len(rows), dtype=np.uint8), (rows, cols[mask])),
+            shape=(num_rows, shape_cols),
+            dtype=np.uint8,
+        )
+        # Symptoms repeated across "^" components cancel
+        matrix.data %= 2
+        matrix.eliminate_zeros()
+        matrices.append(matrix)
+
+    return matrices[0], matrices[1]
+
 
 def dem_to_matrices(
     dem: stim.DetectorErrorModel,
@@ -22,6 +218,14 @@ def dem_to_matrices(
     - L: The logical observable matrix (observables × errors)
     - priors: The prior error probabilities for each error mechanism
 
+    The DEM text is rewritten with byte-level substitutions into a single
+    stream of numbers and parsed in one pass, so no Python code runs per
+    target. Repeat blocks are expanded by tiling each block body with its
+    detector shift rather than flattening the DEM. The components of a
+    decomposed error (separated by ``^``) are XORed, so detectors shared by
+    two components cancel. Column order matches the error instructions of
+    ``dem.flattened()``.
+
     Args:
         dem: A Stim DetectorErrorModel, typically obtained from
              circuit.detector_error_model(decompose_errors=True)
@@ -37,43 +241,464 @@ def dem_to_matrices(
         >>> H, L, priors = dem_to_matrices(dem)
         >>> print(f"H shape: {H.shape}, L shape: {L.shape}")
     """
-    row_inds_H: list[int] = []
-    col_inds_H: list[int] = []
-    row_inds_L: list[int] = []
-    col_inds_L: list[int] = []
-    priors: list[float] = []
-
-    col_idx = 0
-    for instruction in dem.flattened():
-        if instruction.type == "error":
-            p = instruction.args_copy()[0]
-            targets = instruction.targets_copy()
-            priors.append(p)
-            for t in targets:
-                if t.is_relative_detector_id():
-                    row_inds_H.append(t.val)
-                    col_inds_H.append(col_idx)
-                elif t.is_logical_observable_id():
-                    row_inds_L.append(t.val)
-                    col_inds_L.append(col_idx)
-            col_idx += 1
-
-    num_errors = col_idx
-
-    H = scipy.sparse.csc_matrix(
-        (np.ones(len(row_inds_H), dtype=np.uint8), (row_inds_H, col_inds_H)),
-        shape=(dem.num_detectors, num_errors),
-        dtype=np.uint8,
+    parsed = _parse_dem(dem)
+    num_errors = len(parsed["priors"])
+    target_error = parsed["component_error"][parsed["target_component"]]
+    H, L = _targets_to_matrices(
+        dem, parsed["targets"], target_error, num_errors, parsed["source"], parsed["offsets"]
     )
+    return H, L, parsed["priors"][parsed["source"]]
 
-    # Build L matrix
-    L = scipy.sparse.csc_matrix(
-        (np.ones(len(row_inds_L), dtype=np.uint8), (row_inds_L, col_inds_L)),
-        shape=(dem.num_observables, num_errors),
-        dtype=np.uint8,
+
+def dem_to_graphlike_components(
+    dem: stim.DetectorErrorModel,
+) -> tuple[scipy.sparse.csc_matrix, scipy.sparse.csc_matrix, np.ndarray]:
+    """
+    Split each error of a decomposed DEM into its graphlike components.
+
+    With ``decompose_errors=True`` every error is written as ``^``-separated
+    components that flip at most two detectors, i.e. edges (or boundary
+    edges) of a matching graph. Matching-based decoders can weight each
+    edge with the prior of its parent error.
+
+    Args:
+        dem: A Stim DetectorErrorModel
+
+    Returns:
+        H: Detectors flipped by each component (num_detectors × num_components)
+        L: Observables flipped by each component (num_observables × num_components)
+        error_index: Column of dem_to_matrices' H that each component belongs to
+
+    Example:
+        >>> H_c, L_c, error_index = dem_to_graphlike_components(dem)
+        >>> _, _, priors = dem_to_matrices(dem)
+        >>> edge_priors = priors[error_index]
+    """
+    parsed = _parse_dem(dem)
+    num_errors = len(parsed["priors"])
+    component_error = parsed["component_error"]
+
+    # Components of each emitted error column, then their targets
+    component_ptr = np.searchsorted(component_error, np.arange(num_errors + 1))
+    components, error_index = _ragged_gather(component_ptr, parsed["source"])
+    H, L = _targets_to_matrices(
+        dem,
+        parsed["targets"],
+        parsed["target_component"],
+        len(component_error),
+        components,
+        parsed["offsets"][error_index],
     )
+    return H, L, error_index
+
+
+def detector_layers(dem: stim.DetectorErrorModel) -> np.ndarray:
+    """
+    Time layer of each detector, from its last coordinate.
+
+    Stim's generated circuits put the round index in the last detector
+    coordinate. Distinct values are ranked, so layers run 0, 1, 2, ...
+
+    Args:
+        dem: A Stim DetectorErrorModel with coordinates on every detector
+
+    Returns:
+        Layer index of each detector (num_detectors,)
+
+    Raises:
+        ValueError: If any detector has no coordinates
+    """
+    coords = dem.get_detector_coordinates()
+    if any(not coords.get(i) for i in range(dem.num_detectors)):
+        raise ValueError("Detector layers need time coordinates on every detector")
+    times = np.array([coords[i][-1] for i in range(dem.num_detectors)])
+    return np.searchsorted(np.unique(times), times)
+
+
+def merge_duplicate_columns(
+    H: scipy.sparse.spmatrix,
+    L: scipy.sparse.spmatrix,
+    priors: np.ndarray,
+) -> tuple[scipy.sparse.csc_matrix, scipy.sparse.csc_matrix, np.ndarray, np.ndarray]:
+    """
+    Merge error mechanisms with identical detector and observable supports.
+
+    Decomposed DEMs often list the same support several times. Independent
+    mechanisms that flip the same bits combine into one with probability
+    p = p1(1-p2) + p2(1-p1), i.e. (1 - prod(1 - 2p)) / 2 over the group.
+    Merged columns keep the order of each group's first occurrence.
+
+    Args:
+        H: Parity check matrix (num_detectors × num_errors)
+        L: Logical matrix (num_observables × num_errors)
+        priors: Prior error probabilities for each column
+
+    Returns:
+        H: Merged parity check matrix (num_detectors × num_merged)
+        L: Merged logical matrix (num_observables × num_merged)
+        priors: Combined probability of each merged column
+        column_map: Merged column index of each original column (num_errors,)
+
+    Example:
+        >>> H, L, priors = dem_to_matrices(dem)
+        >>> H_m, L_m, priors_m, column_map = merge_duplicate_columns(H, L, priors)
+        >>> merged_error = np.bincount(column_map, weights=error, minlength=len(priors_m)) % 2
+    """
+    H = scipy.sparse.csc_matrix(H)
+    L = scipy.sparse.csc_matrix(L)
+    priors = np.asarray(priors, dtype=np.float64)
+    num_errors = H.shape[1]
+    if num_errors == 0:
+        return H, L, priors, np.zeros(0, dtype=np.int64)
+
+    # Support of each column as a row of sorted indices, -1 padded; observable
+    # rows are offset past the detectors so the two cannot collide
+    support = scipy.sparse.vstack([H, L], format="csc")
+    support.sum_duplicates()
+    support.sort_indices()
+    weights = np.diff(support.indptr)
+    keys = np.full((num_errors, max(int(weights.max()), 1)), -1, dtype=np.int64)
+    cols = np.repeat(np.arange(num_errors), weights)
+    slots = np.arange(support.nnz) - support.indptr[cols]
+    # Fold entry values into the key so non-binary entries stay distinct
+    num_rows = support.shape[0]
+    keys[cols, slots] = support.indices + num_rows * (support.data.astype(np.int64) - 1)
+
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+
+    # Renumber groups by first occurrence
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    column_map = rank[inverse]
+    representatives = first[order]
+
+    merged_priors = merge_priors(priors, column_map)
+    return H[:, representatives], L[:, representatives], merged_priors, column_map
+
+
+def merge_priors(priors: np.ndarray, column_map: np.ndarray) -> np.ndarray:
+    """
+    Combine per-error probabilities onto merged columns.
+
+    Args:
+        priors: Probability of each original error (num_errors,)
+        column_map: Merged column of each original error, as returned by
+            merge_duplicate_columns
+
+    Returns:
+        XOR-combined probability of each merged column
+    """
+    priors = np.asarray(priors, dtype=np.float64)
+    num_groups = int(column_map.max()) + 1 if len(column_map) else 0
+    if not num_groups:
+        return np.zeros(0)
+
+    by_group = np.argsort(column_map, kind="stable")
+    starts = np.searchsorted(column_map[by_group], np.arange(num_groups))
+    # Accumulate log|1 - 2p| so small probabilities keep full precision
+    grouped = priors[by_group]
+    flipped = grouped > 0.5
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_bias = np.where(flipped, np.log(2.0 * grouped - 1.0), np.log1p(-2.0 * grouped))
+    total = np.add.reduceat(log_bias, starts)
+    negative = np.add.reduceat(flipped, starts, dtype=np.int64) % 2 == 1
+    return np.where(negative, (1.0 + np.exp(total)) / 2.0, -np.expm1(total) / 2.0)
+
+
+def pack_bit_rows(bits: np.ndarray) -> np.ndarray:
+    """
+    Pack the rows of a 0/1 matrix into little-endian uint64 words.
+
+    Args:
+        bits: Binary array (num_rows, num_bits)
+
+    Returns:
+        Words holding bit j of each row at word j // 64, bit j % 64
+            Shape: (num_rows, ceil(num_bits/64))
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    num_rows, num_bits = bits.shape
+    num_words = (num_bits + 63) // 64
+    packed = np.zeros((num_rows, num_words * 8), dtype=np.uint8)
+    packed[:, : (num_bits + 7) // 8] = np.packbits(bits, axis=1, bitorder="little")
+    return packed.view("<u8")
+
+
+# Upper bound on the unpacked (one byte per detector) buffer SyndromeUnpacker
+# holds, and on the per-chunk arrays sized with its row_bytes; the chunk
+# length in shots is derived from it
+DEFAULT_UNPACK_CHUNK_BYTES = 16 * 1024 * 1024
+
+# Bits of every byte value, least significant first
+_BYTE_BITS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1, bitorder="little")
+
+
+class SyndromeUnpacker:
+    """
+    Unpacks bit-packed detection events a bounded chunk at a time.
+
+    ``np.unpackbits`` on a whole batch needs one byte per detector per shot,
+    8x the packed size. The unpacker instead fills one preallocated buffer
+    chunk by chunk, looking up the 8 bits of each packed byte in a table, so
+    peak memory stays at ``chunk_bytes`` whatever the batch size. Callers that
+    allocate a wider per-shot array for each chunk (such as BP+OSD error
+    estimates, one byte per error) pass its width as ``row_bytes`` so that
+    array fits ``chunk_bytes`` too.
+
+    Example:
+        >>> unpacker = SyndromeUnpacker(dem.num_detectors)
+        >>> for start, stop, shots in unpacker.chunks(packed):
+        ...     predictions[start:stop] = decoder.get_logical_correction_packed(shots)
+    """
+
+    def __init__(
+        self,
+        num_detectors: int,
+        chunk_bytes: int = DEFAULT_UNPACK_CHUNK_BYTES,
+        row_bytes: int = 0,
+    ):
+        """
+        Initialize the unpacker.
+
+        Args:
+            num_detectors: Detectors per shot
+            chunk_bytes: Size bound in bytes of the unpacked buffer and of any
+                per-shot array of ``row_bytes`` the caller allocates per chunk
+            row_bytes: Bytes per shot of the widest array allocated per chunk
+
+        Raises:
+            ValueError: If chunk_bytes is not positive
+        """
+        if chunk_bytes < 1:
+            raise ValueError(f"chunk_bytes must be positive, got {chunk_bytes}")
+        self.num_detectors = num_detectors
+        self.num_bytes = (num_detectors + 7) // 8
+        self.chunk_shots = max(1, chunk_bytes // max(8 * self.num_bytes, row_bytes, 1))
+        self._buffer = np.empty((0, self.num_bytes, 8), dtype=np.uint8)
+
+    def unpack(self, packed: np.ndarray) -> np.ndarray:
+        """
+        Unpack at most ``chunk_shots`` shots into the shared buffer.
+
+        The result is a view of the buffer and is overwritten by the next
+        call; copy it if it must outlive that. When num_detectors is not a
+        multiple of 8 the view skips the padding bits, so it is not
+        C-contiguous.
+
+        Args:
+            packed: Bit-packed detection events (num_shots, ceil(num_detectors/8)),
+                little bit order
+
+        Returns:
+            Unpacked detection events (num_shots, num_detectors)
+
+        Raises:
+            ValueError: If the batch is longer than chunk_shots
+        """
+        num_shots = packed.shape[0]
+        if num_shots > self.chunk_shots:
+            raise ValueError(f"Batch of {num_shots} shots exceeds chunk_shots={self.chunk_shots}")
+        if self._buffer.shape[0] < num_shots:
+            self._buffer = np.empty((num_shots, self.num_bytes, 8), dtype=np.uint8)
+
+        bits = self._buffer[:num_shots]
+        np.take(_BYTE_BITS, packed, axis=0, out=bits, mode="clip")
+        return bits.reshape(num_shots, 8 * self.num_bytes)[:, : self.num_detectors]
+
+    def chunks(self, packed: np.ndarray):
+        """
+        Iterate over a packed batch as unpacked chunks.
+
+        Args:
+            packed: Bit-packed detection events (num_shots, ceil(num_detectors/8))
+
+        Yields:
+            (start, stop, shots) with shots the unpacked rows start:stop, a
+                view of the shared buffer valid until the next chunk
+        """
+        for start in range(0, packed.shape[0], self.chunk_shots):
+            stop = min(start + self.chunk_shots, packed.shape[0])
+            yield start, stop, self.unpack(packed[start:stop])
+
+
+def logical_projection_words(L: scipy.sparse.spmatrix) -> np.ndarray:
+    """
+    Dense bit-packed form of the logical matrix for project_packed.
+
+    Args:
+        L: Logical matrix (num_observables × num_errors)
+
+    Returns:
+        Packed rows of L (num_observables, ceil(num_errors/64))
+    """
+    return pack_bit_rows(scipy.sparse.csr_matrix(L).toarray() % 2)
+
+
+def project_packed(error_words: np.ndarray, logical_words: np.ndarray) -> np.ndarray:
+    """
+    Logical observable flips of bit-packed error estimates, bit-packed.
+
+    The GF(2) product L @ e is computed per observable as the parity of
+    (e AND row) over the packed words: the words are XOR-reduced and the
+    resulting 64-bit word is folded down to its parity bit.
+
+    Args:
+        error_words: Packed error estimates from pack_bit_rows (num_shots, num_words)
+        logical_words: Packed logical rows from logical_projection_words
+            (num_observables, num_words)
+
+    Returns:
+        Bit-packed observable flips (num_shots, ceil(num_observables/8)),
+        in the little-endian bit order sinter uses
+    """
+    num_shots = error_words.shape[0]
+    num_observables = logical_words.shape[0]
+    predictions = np.zeros((num_shots, (num_observables + 7) // 8), dtype=np.uint8)
+    for k in range(num_observables):
+        parity = np.bitwise_xor.reduce(error_words & logical_words[k], axis=1)
+        for shift in (32, 16, 8, 4, 2, 1):
+            parity ^= parity >> np.uint64(shift)
+        predictions[:, k // 8] |= (parity & np.uint64(1)).astype(np.uint8) << (k % 8)
+    return predictions
+
+
+# Bump when the matrix layout produced by dem_to_matrices changes, so stale
+# on-disk entries are never reused
+_MATRIX_CACHE_VERSION = 2
+
+# Per-process cache of converted DEMs, keyed by content hash
+_MATRIX_CACHE = LRUCache(max_entries=64, max_bytes=512 * 1024 * 1024)
+
+
+def _dem_hash(dem: stim.DetectorErrorModel) -> str:
+    """Content hash of a DEM (repeat blocks are hashed unexpanded)."""
+    text = f"v{_MATRIX_CACHE_VERSION}\n{dem}"
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _matrices_nbytes(
+    H: scipy.sparse.csc_matrix, L: scipy.sparse.csc_matrix, priors: np.ndarray
+) -> int:
+    """Memory footprint of a cached (H, L, priors) entry."""
+    return sum(m.data.nbytes + m.indices.nbytes + m.indptr.nbytes for m in (H, L)) + priors.nbytes
 
-    return H, L, np.array(priors)
+
+def _load_matrices(
+    path: str,
+) -> tuple[scipy.sparse.csc_matrix, scipy.sparse.csc_matrix, np.ndarray]:
+    """Load an (H, L, priors) entry written by _save_matrices."""
+    with np.load(path) as f:
+        H = scipy.sparse.csc_matrix(
+            (f["H_data"], f["H_indices"], f["H_indptr"]), shape=tuple(f["H_shape"])
+        )
+        L = scipy.sparse.csc_matrix(
+            (f["L_data"], f["L_indices"], f["L_indptr"]), shape=tuple(f["L_shape"])
+        )
+        priors = f["priors"]
+    return H, L, priors
+
+
+def _save_matrices(
+    path: str,
+    H: scipy.sparse.csc_matrix,
+    L: scipy.sparse.csc_matrix,
+    priors: np.ndarray,
+) -> None:
+    """Atomically write an (H, L, priors) entry so concurrent workers never see partial files."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(
+            f,
+            H_data=H.data,
+            H_indices=H.indices,
+            H_indptr=H.indptr,
+            H_shape=np.array(H.shape),
+            L_data=L.data,
+            L_indices=L.indices,
+            L_indptr=L.indptr,
+            L_shape=np.array(L.shape),
+            priors=priors,
+        )
+    os.replace(tmp_path, path)
+
+
+def _evict_disk_cache(cache_dir: str, max_bytes: int) -> None:
+    """Delete least recently used .npz entries until the directory fits in max_bytes."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".npz"):
+            try:
+                st = os.stat(os.path.join(cache_dir, name))
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def dem_to_matrices_cached(
+    dem: stim.DetectorErrorModel,
+    cache_dir: str | None = None,
+    max_disk_bytes: int = 2 * 1024**3,
+) -> tuple[scipy.sparse.csc_matrix, scipy.sparse.csc_matrix, np.ndarray]:
+    """
+    Cached version of dem_to_matrices.
+
+    Results are keyed by a SHA-256 hash of the DEM text. Lookups go to a
+    per-process LRU cache first, then to ``<cache_dir>/<hash>.npz`` if a cache
+    directory is configured, and only then to the DEM parser. The disk cache
+    lets sinter workers share one conversion per task.
+
+    The returned H and L may be shared with other callers and must be treated
+    as read-only; priors is always a fresh copy.
+
+    Args:
+        dem: A Stim DetectorErrorModel
+        cache_dir: Directory for on-disk entries (default: $ASR_MP_CACHE_DIR,
+            or memory-only if unset)
+        max_disk_bytes: Size limit for the cache directory; least recently
+            used entries are evicted beyond it
+
+    Returns:
+        H, L, priors as returned by dem_to_matrices
+    """
+    key = _dem_hash(dem)
+    entry = _MATRIX_CACHE.get(key)
+    if entry is not None:
+        H, L, priors = entry
+        return H, L, priors.copy()
+
+    if cache_dir is None:
+        cache_dir = os.environ.get("ASR_MP_CACHE_DIR")
+
+    path = os.path.join(cache_dir, f"{key}.npz") if cache_dir else None
+    if path is not None and os.path.exists(path):
+        H, L, priors = _load_matrices(path)
+        os.utime(path)  # Mark as recently used for eviction
+    else:
+        H, L, priors = dem_to_matrices(dem)
+        if path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            _save_matrices(path, H, L, priors)
+            _evict_disk_cache(cache_dir, max_disk_bytes)
+
+    _MATRIX_CACHE.put(key, (H, L, priors), nbytes=_matrices_nbytes(H, L, priors))
+    return H, L, priors.copy()
+
+
+def clear_matrix_cache() -> None:
+    """Drop all in-memory cached DEM conversions (on-disk entries are kept)."""
+    _MATRIX_CACHE.clear()
 
 
 def get_channel_llrs(priors: np.ndarray, clip_min: float = 1e-10) -> np.ndarray:
@@ -92,3 +717,20 @@ def get_channel_llrs(priors: np.ndarray, clip_min: float = 1e-10) -> np.ndarray:
     """
     p_clipped = np.clip(priors, clip_min, 1 - clip_min)
     return np.log((1 - p_clipped) / p_clipped)
+
+
+def get_probs_from_llrs(llrs: np.ndarray, clip_min: float = 1e-10) -> np.ndarray:
+    """
+    Convert Log-Likelihood Ratios back to error probabilities.
+
+    Inverse of get_channel_llrs: p = 1 / (1 + exp(LLR)).
+
+    Args:
+        llrs: Array of LLR values (positive means error-free is more likely)
+        clip_min: Minimum probability, keeps the result strictly inside (0, 1)
+
+    Returns:
+        Array of error probabilities
+    """
+    probs = 1.0 / (1.0 + np.exp(np.clip(llrs, -700, 700)))
+    return np.clip(probs, clip_min, 1 - clip_min)
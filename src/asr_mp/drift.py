@@ -0,0 +1,209 @@
+"""
+Drift Estimation: Streaming Error-Rate Tracking from Detection Events
+
+Maintains exponentially decayed detector firing rates and pairwise
+co-firing rates over the edges of the DEM's matching graph, and inverts
+them into per-mechanism error probabilities. Statistics are accumulated
+straight from bit-packed detection events with bitwise popcounts, so
+tracking adds little to decoding cost.
+"""
+
+import numpy as np
+import stim
+
+from .dem_utils import (
+    SyndromeUnpacker,
+    dem_to_graphlike_components,
+    dem_to_matrices,
+    merge_priors,
+)
+
+# Number of set bits in each byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class DriftEstimator:
+    """
+    Streaming estimator of DEM error probabilities under drift.
+
+    Every graphlike component of the decomposed DEM is an edge between two
+    detectors or a boundary edge at one detector. For an edge (i, j) the
+    firing rates x_i, x_j and co-firing rate x_ij give its probability
+
+        p_ij = 1/2 - 1/2 sqrt(1 - 4 (x_ij - x_i x_j) / (1 - 2 x_i - 2 x_j + 4 x_ij))
+
+    and a boundary edge at i accounts for whatever of x_i the pair edges do
+    not: 1 - 2 x_i = (1 - 2 p_i) prod_j (1 - 2 p_ij). Each mechanism's prior
+    is rescaled by the geometric mean, over its components, of estimated to
+    modelled edge probability. Mechanisms without a graphlike component
+    keep their prior.
+
+    Counts decay by ``(1 - 1/window)`` per shot, applied once per batch.
+
+    Attributes:
+        priors: Prior error probabilities from the DEM (num_errors,)
+        window: Effective number of shots remembered
+        num_shots: Total shots consumed
+        weight: Decayed number of shots behind the current statistics
+
+    Example:
+        >>> estimator = DriftEstimator(dem, window=20_000)
+        >>> estimator.update(bit_packed_shots)
+        >>> decoder.update_priors(estimator.estimate_priors())
+    """
+
+    def __init__(
+        self,
+        dem: stim.DetectorErrorModel,
+        window: int = 20_000,
+        prior_floor: float = 1e-7,
+    ):
+        """
+        Initialize the estimator.
+
+        Args:
+            dem: Decomposed DetectorErrorModel (decompose_errors=True)
+            window: Effective number of shots remembered by the exponential decay
+            prior_floor: Smallest probability returned for any mechanism
+
+        Raises:
+            ValueError: If window is not positive
+        """
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+
+        self.num_detectors = dem.num_detectors
+        self._unpacker = SyndromeUnpacker(self.num_detectors)
+        self.window = window
+        self.prior_floor = prior_floor
+        _, _, self.priors = dem_to_matrices(dem)
+
+        # Edges of the matching graph: (i, j) with i < j, or (i, -1) at the boundary
+        H_c, _, error_index = dem_to_graphlike_components(dem)
+        starts = H_c.indptr[:-1]
+        degree = np.diff(H_c.indptr)
+        graphlike = (degree == 1) | (degree == 2)
+        first = H_c.indices[starts[graphlike]]
+        second = np.full(len(first), -1, dtype=np.int64)
+        is_pair = degree[graphlike] == 2
+        second[is_pair] = H_c.indices[starts[graphlike][is_pair] + 1]
+        low = np.where(is_pair, np.minimum(first, second), first)
+        high = np.where(is_pair, np.maximum(first, second), -1)
+        edges, edge_id = np.unique(np.stack([low, high], axis=1), axis=0, return_inverse=True)
+
+        self._component_error = error_index[graphlike]
+        self._component_edge = edge_id.ravel()
+        edge_is_pair = edges[:, 1] >= 0
+        self._pair_edges = np.flatnonzero(edge_is_pair)
+        self._pair_i = edges[edge_is_pair, 0]
+        self._pair_j = edges[edge_is_pair, 1]
+        self._boundary_edges = np.flatnonzero(~edge_is_pair)
+        self._boundary_det = edges[~edge_is_pair, 0]
+        self._num_edges = len(edges)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all accumulated statistics."""
+        self.num_shots = 0
+        self.weight = 0.0
+        self._det_counts = np.zeros(self.num_detectors)
+        self._pair_counts = np.zeros(len(self._pair_i))
+
+    def update(self, bit_packed_detection_event_data: np.ndarray) -> None:
+        """
+        Fold a batch of shots into the decayed statistics.
+
+        Args:
+            bit_packed_detection_event_data: Bit-packed detection events
+                Shape: (num_shots, ceil(num_detectors/8)), little bit order
+        """
+        packed = np.asarray(bit_packed_detection_event_data, dtype=np.uint8)
+        num_shots = packed.shape[0]
+        if not num_shots:
+            return
+
+        # Re-pack along shots so each byte holds one detector for 8 shots,
+        # one bounded chunk at a time
+        det_counts = np.zeros(self.num_detectors, dtype=np.int64)
+        pair_counts = np.zeros(len(self._pair_i), dtype=np.int64)
+        for _, _, shots in self._unpacker.chunks(packed):
+            by_shot = np.packbits(shots, axis=0)
+            det_counts += _POPCOUNT[by_shot].sum(axis=0, dtype=np.int64)
+            coincidences = by_shot[:, self._pair_i] & by_shot[:, self._pair_j]
+            pair_counts += _POPCOUNT[coincidences].sum(axis=0, dtype=np.int64)
+
+        decay = (1.0 - 1.0 / self.window) ** num_shots
+        self._det_counts = self._det_counts * decay + det_counts
+        self._pair_counts = self._pair_counts * decay + pair_counts
+        self.weight = self.weight * decay + num_shots
+        self.num_shots += num_shots
+
+    def firing_rates(self) -> np.ndarray:
+        """Decayed firing rate of each detector."""
+        if not self.weight:
+            return np.zeros(self.num_detectors)
+        return self._det_counts / self.weight
+
+    def edge_probabilities(self) -> np.ndarray:
+        """
+        Estimate the probability of every matching-graph edge.
+
+        Returns:
+            Edge probabilities, in the order of the estimator's edge list,
+            or the DEM's modelled values before any shots were consumed
+        """
+        if not self.weight:
+            return self._modelled_edge_probabilities()
+
+        x = self.firing_rates()
+        x_i = x[self._pair_i]
+        x_j = x[self._pair_j]
+        x_ij = self._pair_counts / self.weight
+
+        denominator = 1.0 - 2.0 * x_i - 2.0 * x_j + 4.0 * x_ij
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inner = 1.0 - 4.0 * (x_ij - x_i * x_j) / denominator
+        inner = np.clip(np.nan_to_num(inner, nan=1.0), 0.0, 1.0)
+        pair_probs = (1.0 - np.sqrt(inner)) / 2.0
+
+        # Fraction of each detector's firing not explained by its pair edges
+        log_bias = np.log1p(-2.0 * np.minimum(pair_probs, 0.5 - 1e-12))
+        explained = np.exp(
+            np.bincount(self._pair_i, weights=log_bias, minlength=self.num_detectors)
+            + np.bincount(self._pair_j, weights=log_bias, minlength=self.num_detectors)
+        )
+        det = self._boundary_det
+        boundary_probs = (1.0 - (1.0 - 2.0 * x[det]) / explained[det]) / 2.0
+
+        probs = np.empty(self._num_edges)
+        probs[self._pair_edges] = pair_probs
+        probs[self._boundary_edges] = np.clip(boundary_probs, 0.0, 0.5)
+        return probs
+
+    def _modelled_edge_probabilities(self) -> np.ndarray:
+        """Edge probabilities implied by the DEM priors."""
+        return merge_priors(self.priors[self._component_error], self._component_edge)
+
+    def estimate_priors(self) -> np.ndarray:
+        """
+        Re-estimate the probability of every DEM error mechanism.
+
+        Returns:
+            Probabilities in dem_to_matrices column order, suitable for
+            ASRMPDecoder.update_priors
+        """
+        if not self.weight:
+            return self.priors.copy()
+
+        modelled = self._modelled_edge_probabilities()
+        estimated = self.edge_probabilities()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(modelled > 0, estimated / modelled, 1.0)
+        log_ratio = np.log(np.maximum(ratio, 1e-12))[self._component_edge]
+
+        num_errors = len(self.priors)
+        total = np.bincount(self._component_error, weights=log_ratio, minlength=num_errors)
+        count = np.bincount(self._component_error, minlength=num_errors)
+        scale = np.exp(total / np.maximum(count, 1))
+        return np.clip(self.priors * scale, self.prior_floor, 0.5)
@@ -0,0 +1,212 @@
+"""
+Hierarchical Decoding: Union-Find Pre-Decoder with BP+OSD Fallback
+
+Most shots at practical error rates contain only a few small, isolated
+clusters of detection events, and the cheap Union-Find decoder gets those
+right. Union-Find runs first, its answer is kept when the shot looks
+simple, and only the remaining shots are sent to the high-precision
+ASR-MP (BP+OSD) decoder. Mean latency then follows the Union-Find cost.
+"""
+
+import time
+
+import numpy as np
+import sinter
+import stim
+
+from .decoder import ASRMPDecoder
+from .dem_utils import DEFAULT_UNPACK_CHUNK_BYTES, SyndromeUnpacker
+from .latency import LatencyBuffer
+from .union_find_decoder import UnionFindDecoder
+
+STAGES = ("trivial", "union_find", "bp_osd")
+
+
+class HierarchicalCompiledDecoder(sinter.CompiledDecoder):
+    """
+    Sinter-compatible two-stage decoder: Union-Find, then ASR-MP.
+
+    Each shot is routed by these rules, in order:
+        - no detection events: zero prediction ("trivial")
+        - more than ``max_syndrome_weight`` detection events: BP+OSD
+        - Union-Find left an odd cluster unresolved, or its largest cluster
+          has more than ``max_cluster_size`` vertices: BP+OSD
+        - otherwise the Union-Find prediction is kept ("union_find")
+
+    Cluster size is the better signal: isolated small clusters are
+    decoded the same way by both stages, while large merged clusters are
+    where Union-Find makes its mistakes.
+
+    Attributes:
+        union_find: Native UnionFindDecoder used as the first stage
+        decoder: ASRMPDecoder used as the fallback stage
+        stage_counts: Shots resolved by each stage ("trivial", "union_find", "bp_osd")
+        latencies: Ring buffer of per-shot decode times: each shot's Union-Find
+            and BP+OSD time plus an even share of the batch overhead
+    """
+
+    def __init__(
+        self,
+        dem: stim.DetectorErrorModel,
+        max_cluster_size: int = 4,
+        max_syndrome_weight: int | None = None,
+        chunk_bytes: int = DEFAULT_UNPACK_CHUNK_BYTES,
+        **decoder_kwargs,
+    ):
+        """
+        Initialize the compiled decoder.
+
+        Args:
+            dem: Stim DetectorErrorModel
+            max_cluster_size: Largest Union-Find cluster (in vertices) whose
+                answer is accepted
+            max_syndrome_weight: Shots with more detection events skip
+                Union-Find and go straight to BP+OSD (None for no limit)
+            chunk_bytes: Size bound in bytes of each chunk's unpacked syndromes
+                and of its error estimates
+            **decoder_kwargs: Forwarded to ASRMPDecoder
+
+        Raises:
+            ValueError: If a routing threshold is negative
+        """
+        if max_cluster_size < 0 or (max_syndrome_weight is not None and max_syndrome_weight < 0):
+            raise ValueError("Routing thresholds must be non-negative")
+
+        self.dem = dem
+        self.max_cluster_size = max_cluster_size
+        self.max_syndrome_weight = max_syndrome_weight
+        self.union_find = UnionFindDecoder(dem)
+        self.decoder = ASRMPDecoder(dem, **decoder_kwargs)
+        # Each chunk's (shots × errors) estimate matrix is bounded as well
+        self.unpacker = SyndromeUnpacker(dem.num_detectors, chunk_bytes, self.decoder.H.shape[1])
+        self.stage_counts = dict.fromkeys(STAGES, 0)
+        self.latencies = LatencyBuffer()
+
+    def decode_shots_bit_packed(
+        self,
+        *,
+        bit_packed_detection_event_data: np.ndarray,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Decode multiple shots from bit-packed syndrome data.
+
+        Args:
+            bit_packed_detection_event_data: Bit-packed syndrome array
+                Shape: (num_shots, ceil(num_detectors/8))
+
+        Returns:
+            Bit-packed logical predictions
+                Shape: (num_shots, ceil(num_observables/8))
+        """
+        t0 = time.perf_counter()
+        num_shots = bit_packed_detection_event_data.shape[0]
+        predictions = np.empty((num_shots, (self.dem.num_observables + 7) // 8), dtype=np.uint8)
+        shot_seconds = np.zeros(num_shots)
+        for start, stop, shots in self.unpacker.chunks(bit_packed_detection_event_data):
+            corrections = self._decode_chunk(shots, shot_seconds[start:stop])
+            predictions[start:stop] = np.packbits(corrections, axis=1, bitorder="little")
+
+        if num_shots:
+            overhead = time.perf_counter() - t0 - shot_seconds.sum()
+            shot_seconds += max(overhead, 0.0) / num_shots
+            self.latencies.extend(shot_seconds)
+        return predictions
+
+    def _decode_chunk(self, shots: np.ndarray, shot_seconds: np.ndarray) -> np.ndarray:
+        """Route one chunk of unpacked shots through the two stages.
+
+        Each stage's per-shot decode time is added to ``shot_seconds`` in place.
+        """
+        num_shots = shots.shape[0]
+        corrections = np.zeros((num_shots, self.dem.num_observables), dtype=np.uint8)
+
+        weights = shots.sum(axis=1)
+        nontrivial = weights > 0
+        fallback = nontrivial.copy()
+
+        candidates = nontrivial
+        if self.max_syndrome_weight is not None:
+            candidates = candidates & (weights <= self.max_syndrome_weight)
+        candidates = np.flatnonzero(candidates)
+        if len(candidates):
+            uf_corrections = self.union_find.decode_batch(shots[candidates])
+            accepted = self.union_find.last_resolved & (
+                self.union_find.last_cluster_sizes <= self.max_cluster_size
+            )
+            corrections[candidates[accepted]] = uf_corrections[accepted]
+            fallback[candidates[accepted]] = False
+            shot_seconds[candidates] += self.union_find.last_latencies
+
+        fallback = np.flatnonzero(fallback)
+        if len(fallback):
+            corrections[fallback] = self.decoder.get_logical_correction_batch(shots[fallback])
+            shot_seconds[fallback] += self.decoder.last_latencies
+
+        self.stage_counts["trivial"] += num_shots - int(nontrivial.sum())
+        self.stage_counts["bp_osd"] += len(fallback)
+        self.stage_counts["union_find"] += int(nontrivial.sum()) - len(fallback)
+        return corrections
+
+    @property
+    def stage_fractions(self) -> dict[str, float]:
+        """Fraction of decoded shots resolved by each stage."""
+        total = sum(self.stage_counts.values())
+        if not total:
+            return dict.fromkeys(self.stage_counts, 0.0)
+        return {stage: count / total for stage, count in self.stage_counts.items()}
+
+    def get_stats(self) -> dict:
+        """
+        Summarize shot routing for profiling.
+
+        Returns:
+            Dictionary of per-stage shot counts and fractions, and latencies
+        """
+        return {
+            "shots": sum(self.stage_counts.values()),
+            "stage_counts": dict(self.stage_counts),
+            "stage_fractions": self.stage_fractions,
+            "average_latency": self.get_average_latency(),
+            "latency": self.latencies.summary(),
+            "bp_osd_average_latency": self.decoder.get_average_latency(),
+        }
+
+    def get_average_latency(self) -> float:
+        """Get average per-shot decode latency in seconds."""
+        return self.latencies.average()
+
+
+class HierarchicalDecoder(sinter.Decoder):
+    """
+    Sinter Decoder factory for Union-Find pre-decoding with BP+OSD fallback.
+
+    Example:
+        >>> sinter.collect(
+        ...     tasks=tasks,
+        ...     decoders=["hierarchical"],
+        ...     custom_decoders={"hierarchical": HierarchicalDecoder(max_cluster_size=4)},
+        ... )
+    """
+
+    def __init__(self, **compile_kwargs):
+        """
+        Initialize the factory.
+
+        Args:
+            **compile_kwargs: Forwarded to HierarchicalCompiledDecoder
+        """
+        self.compile_kwargs = compile_kwargs
+
+    def compile_decoder_for_dem(
+        self,
+        *,
+        dem: stim.DetectorErrorModel,
+        **kwargs,
+    ) -> sinter.CompiledDecoder:
+        """Compile a decoder for the given DEM."""
+        return HierarchicalCompiledDecoder(dem, **self.compile_kwargs)
+
+    def decode_via_files(self, *args, **kwargs):
+        """Not implemented - use compile_decoder_for_dem instead."""
+        raise NotImplementedError("Use compile_decoder_for_dem for this decoder")
@@ -0,0 +1,433 @@
+"""
+Latency Tracking: Fixed-Size Ring Buffer with Percentile Summaries
+
+Decoders record one latency per shot. Keeping them in a Python list grows
+without bound over a long sinter run, and averaging it walks the whole
+list. LatencyBuffer stores the most recent samples in a preallocated NumPy
+array, keeps running totals for O(1) averages, and answers percentile queries
+over the retained window. Every sample also lands in a LatencyHistogram
+with fixed log-scale buckets, which can be merged across processes to
+report tail latency over a whole run. LatencySampler does that for sinter,
+writing each worker's histogram into the task's custom_counts.
+"""
+
+import math
+import time
+from collections import Counter
+
+import numpy as np
+import sinter
+
+# Samples retained per buffer (8 bytes each)
+DEFAULT_LATENCY_CAPACITY = 100_000
+
+# Percentiles reported by LatencyBuffer.summary
+SUMMARY_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+# Log-scale histogram layout, shared by every process so counts can be summed:
+# bucket 0 holds samples below HISTOGRAM_MIN_SECONDS, the last bucket those at
+# or above HISTOGRAM_MAX_SECONDS, and each decade in between is split evenly
+HISTOGRAM_MIN_SECONDS = 1e-7
+HISTOGRAM_MAX_SECONDS = 1e2
+HISTOGRAM_BUCKETS_PER_DECADE = 20
+_HISTOGRAM_DECADES = round(math.log10(HISTOGRAM_MAX_SECONDS / HISTOGRAM_MIN_SECONDS))
+HISTOGRAM_NUM_BUCKETS = _HISTOGRAM_DECADES * HISTOGRAM_BUCKETS_PER_DECADE + 2
+
+# Prefix of the sinter custom_counts keys holding histogram buckets
+HISTOGRAM_COUNT_PREFIX = "latency_bucket_"
+
+
+class LatencyHistogram:
+    """
+    Fixed log-bucketed latency histogram (HDR style).
+
+    Buckets are 1/20 of a decade wide (about 12%), from 100 ns to 100 s,
+    so percentiles keep a bounded relative error regardless of how many
+    samples were recorded. The layout is a module constant, so histograms
+    from different processes merge by adding their counts.
+
+    Attributes:
+        counts: Samples per bucket (HISTOGRAM_NUM_BUCKETS,)
+
+    Example:
+        >>> total = LatencyHistogram.from_custom_counts(stats.custom_counts)
+        >>> total.percentile(99.9)
+    """
+
+    def __init__(self, counts: np.ndarray | None = None):
+        """
+        Initialize the histogram.
+
+        Args:
+            counts: Initial bucket counts (default: empty)
+        """
+        self.counts = np.zeros(HISTOGRAM_NUM_BUCKETS, dtype=np.int64)
+        if counts is not None:
+            self.counts += np.asarray(counts, dtype=np.int64)
+
+    @staticmethod
+    def bucket_of(values) -> np.ndarray:
+        """Bucket index of each latency in seconds."""
+        values = np.asarray(values, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            scaled = np.log10(values / HISTOGRAM_MIN_SECONDS) * HISTOGRAM_BUCKETS_PER_DECADE
+        scaled = np.nan_to_num(scaled, nan=-1.0, neginf=-1.0)
+        return np.clip(np.floor(scaled).astype(np.int64) + 1, 0, HISTOGRAM_NUM_BUCKETS - 1)
+
+    @staticmethod
+    def bucket_bounds(index: int) -> tuple[float, float]:
+        """Lower and upper latency bound of a bucket in seconds."""
+        if index <= 0:
+            return 0.0, HISTOGRAM_MIN_SECONDS
+        if index >= HISTOGRAM_NUM_BUCKETS - 1:
+            return HISTOGRAM_MAX_SECONDS, math.inf
+        step = 1.0 / HISTOGRAM_BUCKETS_PER_DECADE
+        return (
+            HISTOGRAM_MIN_SECONDS * 10 ** ((index - 1) * step),
+            HISTOGRAM_MIN_SECONDS * 10 ** (index * step),
+        )
+
+    def add(self, value: float) -> None:
+        """Record one latency sample."""
+        if value < HISTOGRAM_MIN_SECONDS:
+            index = 0
+        else:
+            scaled = math.log10(value / HISTOGRAM_MIN_SECONDS) * HISTOGRAM_BUCKETS_PER_DECADE
+            index = min(int(scaled) + 1, HISTOGRAM_NUM_BUCKETS - 1)
+        self.counts[index] += 1
+
+    def add_many(self, values) -> None:
+        """Record a batch of latency samples."""
+        self.counts += np.bincount(self.bucket_of(values), minlength=HISTOGRAM_NUM_BUCKETS)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts into this one."""
+        self.counts += other.counts
+
+    def clear(self) -> None:
+        """Drop all counts."""
+        self.counts[:] = 0
+
+    @property
+    def count(self) -> int:
+        """Total number of samples."""
+        return int(self.counts.sum())
+
+    def percentile(self, q: float) -> float:
+        """
+        Approximate percentile in seconds.
+
+        Returns the geometric middle of the bucket holding the q-th
+        percentile (the lower bound for the overflow bucket), or 0.0 when
+        the histogram is empty.
+        """
+        total = self.count
+        if not total:
+            return 0.0
+        rank = max(math.ceil(q / 100.0 * total), 1)
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        low, high = self.bucket_bounds(index)
+        if index == 0:
+            return high
+        if math.isinf(high):
+            return low
+        return math.sqrt(low * high)
+
+    def summary(self) -> dict[str, float]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            Dictionary with count, p50, p90, p99 and p99.9 (seconds)
+        """
+        stats: dict[str, float] = {"count": self.count}
+        for q in SUMMARY_PERCENTILES:
+            stats[f"p{q:g}"] = self.percentile(q)
+        return stats
+
+    def to_custom_counts(self, prefix: str = HISTOGRAM_COUNT_PREFIX) -> dict[str, int]:
+        """Non-empty buckets as ``{prefix + index: count}``, for sinter's custom_counts."""
+        return {f"{prefix}{i}": int(self.counts[i]) for i in np.flatnonzero(self.counts)}
+
+    @classmethod
+    def from_custom_counts(
+        cls, custom_counts, prefix: str = HISTOGRAM_COUNT_PREFIX
+    ) -> "LatencyHistogram":
+        """
+        Rebuild a histogram from sinter custom_counts, ignoring other keys.
+
+        Args:
+            custom_counts: Mapping such as sinter.TaskStats.custom_counts
+            prefix: Key prefix written by to_custom_counts
+
+        Returns:
+            Histogram with the summed bucket counts
+        """
+        histogram = cls()
+        for key, count in custom_counts.items():
+            if key.startswith(prefix):
+                histogram.counts[int(key[len(prefix) :])] += count
+        return histogram
+
+
+class LatencyBuffer:
+    """
+    Preallocated ring buffer of per-shot latencies in seconds.
+
+    Appends are O(1) and batches are written with one or two slice copies.
+    ``count``, ``average()`` and ``peak`` cover every sample since the last
+    ``clear()``; percentiles cover the ``capacity`` most recent samples.
+    The buffer behaves like a read-only sequence of the retained samples,
+    oldest first, so ``len()``, indexing, iteration and ``np.mean`` work as
+    they did on the old latency lists.
+
+    Attributes:
+        capacity: Number of samples retained
+        histogram: Log-bucketed histogram of every sample since the last clear
+        count: Samples recorded since the last clear
+        total: Sum of all samples recorded since the last clear
+        peak: Largest sample recorded since the last clear
+
+    Example:
+        >>> latencies = LatencyBuffer(capacity=10_000)
+        >>> latencies.extend(batch_times)
+        >>> latencies.summary()["p99"]
+    """
+
+    def __init__(self, capacity: int = DEFAULT_LATENCY_CAPACITY):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            capacity: Number of most recent samples kept for percentiles
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self.histogram = LatencyHistogram()
+        self._next = 0
+        self._held = 0
+        self.count = 0
+        self.total = 0.0
+        self.peak = 0.0
+
+    def append(self, value: float) -> None:
+        """Record one latency sample."""
+        value = float(value)
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        if self._held < self.capacity:
+            self._held += 1
+        self.count += 1
+        self.total += value
+        if value > self.peak:
+            self.peak = value
+        self.histogram.add(value)
+
+    def extend(self, values) -> None:
+        """Record a batch of latency samples."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        n = len(values)
+        if not n:
+            return
+        self.count += n
+        self.total += float(values.sum())
+        self.peak = max(self.peak, float(values.max()))
+        self.histogram.add_many(values)
+
+        if n >= self.capacity:
+            self._values[:] = values[-self.capacity :]
+            self._next = 0
+            self._held = self.capacity
+            return
+
+        end = self._next + n
+        if end <= self.capacity:
+            self._values[self._next : end] = values
+        else:
+            split = self.capacity - self._next
+            self._values[self._next :] = values[:split]
+            self._values[: n - split] = values[split:]
+        self._next = end % self.capacity
+        self._held = min(self._held + n, self.capacity)
+
+    def clear(self) -> None:
+        """Drop all samples and reset the running totals."""
+        self._next = 0
+        self._held = 0
+        self.count = 0
+        self.total = 0.0
+        self.peak = 0.0
+        self.histogram.clear()
+
+    def average(self) -> float:
+        """Mean of all samples since the last clear (0.0 when empty)."""
+        if not self.count:
+            return 0.0
+        return self.total / self.count
+
+    def percentile(self, q):
+        """
+        Percentile(s) of the retained samples.
+
+        Args:
+            q: Percentile or sequence of percentiles in [0, 100]
+
+        Returns:
+            Matching latency value(s) in seconds (0.0 when empty)
+        """
+        if not self._held:
+            return np.zeros_like(np.asarray(q, dtype=np.float64))[()]
+        # Order does not matter for percentiles, so the raw slots are used
+        return np.percentile(self._values[: self._held], q)
+
+    def summary(self) -> dict[str, float]:
+        """
+        Summarize the latency distribution.
+
+        Returns:
+            Dictionary with count, mean, p50, p90, p99, p99.9 and max (seconds)
+        """
+        stats: dict[str, float] = {"count": self.count, "mean": self.average()}
+        percentiles = np.atleast_1d(self.percentile(SUMMARY_PERCENTILES))
+        for q, value in zip(SUMMARY_PERCENTILES, percentiles):
+            stats[f"p{q:g}"] = float(value)
+        stats["max"] = self.peak
+        return stats
+
+    def to_array(self) -> np.ndarray:
+        """Copy of the retained samples, oldest first."""
+        if self._held < self.capacity:
+            return self._values[: self._held].copy()
+        return np.concatenate([self._values[self._next :], self._values[: self._next]])
+
+    def __len__(self) -> int:
+        return self._held
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_array()[index]
+        if not -self._held <= index < self._held:
+            raise IndexError("latency index out of range")
+        oldest = self._next if self._held == self.capacity else 0
+        return float(self._values[(oldest + index % self._held) % self.capacity])
+
+    def __iter__(self):
+        return iter(self.to_array().tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.to_array()
+        return values if dtype is None else values.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f"LatencyBuffer(count={self.count}, held={self._held}, capacity={self.capacity})"
+
+
+class LatencySampler(sinter.Sampler):
+    """
+    Sinter Sampler that records a latency histogram next to the error counts.
+
+    Sinter keeps only the AnonTaskStats returned by each worker, so anything
+    stored on a compiled decoder is lost when the worker exits. This sampler
+    samples with stim, decodes with the wrapped decoder and writes the
+    batch's histogram buckets into ``custom_counts``, which sinter sums
+    across workers and saves in its CSV output.
+
+    Decoders whose compiled form has a ``latencies`` LatencyBuffer holding
+    one sample per input shot contribute those samples; all of this
+    package's compiled decoders do, trivial and deduplicated shots included.
+    Third-party decoders such as pymatching are timed per batch and each
+    shot gets the amortized time. All decoders are compared over the same
+    shots.
+
+    Example:
+        >>> sinter.collect(
+        ...     tasks=tasks,
+        ...     decoders=["tesseract"],
+        ...     custom_decoders={"tesseract": LatencySampler(TesseractBPOSD())},
+        ... )
+    """
+
+    def __init__(self, decoder: sinter.Decoder):
+        """
+        Initialize the sampler.
+
+        Args:
+            decoder: Sinter decoder to sample with
+        """
+        self.decoder = decoder
+
+    def compiled_sampler_for_task(self, task: sinter.Task) -> sinter.CompiledSampler:
+        """Compile the wrapped decoder for the task's DEM."""
+        return LatencyCompiledSampler(self.decoder, task)
+
+
+class LatencyCompiledSampler(sinter.CompiledSampler):
+    """
+    Sampler compiled for one task by LatencySampler.
+
+    Attributes:
+        compiled_decoder: Wrapped decoder compiled for the task's DEM
+    """
+
+    def __init__(self, decoder: sinter.Decoder, task: sinter.Task):
+        """
+        Initialize the compiled sampler.
+
+        Args:
+            decoder: Sinter decoder to compile
+            task: Sinter task with a circuit and detector error model
+
+        Raises:
+            ValueError: If the task uses postselection
+        """
+        if task.postselection_mask is not None or task.postselected_observables_mask is not None:
+            raise ValueError("LatencySampler does not support postselection")
+        dem = task.detector_error_model
+        if dem is None:
+            dem = task.circuit.detector_error_model(decompose_errors=True)
+        self.compiled_decoder = decoder.compile_decoder_for_dem(dem=dem)
+        self._stim_sampler = task.circuit.compile_detector_sampler()
+
+    def sample(self, suggested_shots: int) -> sinter.AnonTaskStats:
+        """
+        Sample and decode one batch.
+
+        Args:
+            suggested_shots: Number of shots to sample
+
+        Returns:
+            Shot and error counts, with histogram buckets in custom_counts
+        """
+        t0 = time.perf_counter()
+        dets, actual_obs = self._stim_sampler.sample(
+            shots=suggested_shots, bit_packed=True, separate_observables=True
+        )
+
+        buffer = getattr(self.compiled_decoder, "latencies", None)
+        if isinstance(buffer, LatencyBuffer):
+            before = buffer.histogram.counts.copy()
+        t_decode = time.perf_counter()
+        predictions = self.compiled_decoder.decode_shots_bit_packed(
+            bit_packed_detection_event_data=dets
+        )
+        decode_seconds = time.perf_counter() - t_decode
+
+        histogram = None
+        if isinstance(buffer, LatencyBuffer):
+            histogram = LatencyHistogram(buffer.histogram.counts - before)
+        if histogram is None or histogram.count != suggested_shots:
+            histogram = LatencyHistogram()
+            histogram.add_many(np.full(suggested_shots, decode_seconds / suggested_shots))
+
+        errors = int(np.count_nonzero(np.any(predictions != actual_obs, axis=1)))
+        return sinter.AnonTaskStats(
+            shots=suggested_shots,
+            errors=errors,
+            seconds=time.perf_counter() - t0,
+            custom_counts=Counter(histogram.to_custom_counts()),
+        )
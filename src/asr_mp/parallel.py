@@ -0,0 +1,197 @@
+"""
+Parallel Decoding: Process-Pool Sharding for Offline Batches
+
+Provides a compiled decoder that shards large bit-packed syndrome batches
+across a pool of worker processes. Each worker compiles its BP+OSD decoder
+once from the DEM; syndromes and predictions are exchanged through shared
+memory so the arrays are never pickled.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import sinter
+import stim
+
+from .decoder import TesseractCompiledDecoder
+from .latency import LatencyBuffer
+
+# Per-process decoder, built once by the pool initializer
+_WORKER_DECODER: TesseractCompiledDecoder | None = None
+
+
+def _init_worker(dem_text: str, decoder_kwargs: dict) -> None:
+    """Compile the worker's decoder from the DEM text."""
+    global _WORKER_DECODER
+    _WORKER_DECODER = TesseractCompiledDecoder(
+        stim.DetectorErrorModel(dem_text),
+        **decoder_kwargs,
+    )
+
+
+def _decode_shard(
+    input_name: str,
+    output_name: str,
+    input_shape: tuple[int, int],
+    output_shape: tuple[int, int],
+    start: int,
+    stop: int,
+) -> np.ndarray:
+    """
+    Decode rows ``start:stop`` of the shared input into the shared output.
+
+    Returns:
+        Per-shot latencies recorded by the worker for this shard
+    """
+    shm_in = SharedMemory(name=input_name)
+    shm_out = SharedMemory(name=output_name)
+    try:
+        shots = np.ndarray(input_shape, dtype=np.uint8, buffer=shm_in.buf)
+        predictions = np.ndarray(output_shape, dtype=np.uint8, buffer=shm_out.buf)
+        predictions[start:stop] = _WORKER_DECODER.decode_shots_bit_packed(
+            bit_packed_detection_event_data=shots[start:stop],
+        )
+        # Release the buffer exports before closing the mappings
+        del shots, predictions
+    finally:
+        shm_in.close()
+        shm_out.close()
+
+    latencies = _WORKER_DECODER.latencies.to_array()
+    _WORKER_DECODER.reset_latencies()
+    return latencies
+
+
+class ParallelTesseractDecoder(sinter.CompiledDecoder):
+    """
+    Multi-process compiled decoder for offline decoding of recorded data.
+
+    Batches are split into contiguous shards and decoded by a persistent
+    ``ProcessPoolExecutor``. Use as a context manager (or call ``close()``)
+    to shut the pool down.
+
+    Example:
+        >>> with ParallelTesseractDecoder(dem, num_workers=8) as decoder:
+        ...     predictions = decoder.decode_shots_bit_packed(
+        ...         bit_packed_detection_event_data=packed_shots
+        ...     )
+    """
+
+    def __init__(
+        self,
+        dem: stim.DetectorErrorModel,
+        num_workers: int | None = None,
+        shards_per_worker: int = 4,
+        mp_context: str | None = None,
+        **decoder_kwargs,
+    ):
+        """
+        Initialize the parallel decoder.
+
+        Args:
+            dem: Stim DetectorErrorModel
+            num_workers: Number of worker processes (default: CPU count)
+            shards_per_worker: Shards submitted per worker per batch, for load balancing
+            mp_context: Multiprocessing start method (default: platform default)
+            **decoder_kwargs: Forwarded to each worker's TesseractCompiledDecoder
+        """
+        self.dem = dem
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.shards_per_worker = shards_per_worker
+        self.mp_context = mp_context
+        self.decoder_kwargs = decoder_kwargs
+        self.latencies = LatencyBuffer()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=get_context(self.mp_context),
+                initializer=_init_worker,
+                initargs=(str(self.dem), self.decoder_kwargs),
+            )
+        return self._executor
+
+    def decode_shots_bit_packed(
+        self,
+        *,
+        bit_packed_detection_event_data: np.ndarray,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Decode multiple shots from bit-packed syndrome data in parallel.
+
+        Args:
+            bit_packed_detection_event_data: Bit-packed syndrome array
+                Shape: (num_shots, ceil(num_detectors/8))
+
+        Returns:
+            Bit-packed logical predictions
+                Shape: (num_shots, ceil(num_observables/8))
+        """
+        shots = np.ascontiguousarray(bit_packed_detection_event_data, dtype=np.uint8)
+        num_shots = shots.shape[0]
+        output_shape = (num_shots, (self.dem.num_observables + 7) // 8)
+        if num_shots == 0:
+            return np.zeros(output_shape, dtype=np.uint8)
+
+        # Zero-size segments are not allowed, so always map at least one byte
+        shm_in = SharedMemory(create=True, size=max(shots.nbytes, 1))
+        shm_out = SharedMemory(create=True, size=max(output_shape[0] * output_shape[1], 1))
+        try:
+            shared_shots = np.ndarray(shots.shape, dtype=np.uint8, buffer=shm_in.buf)
+            shared_shots[:] = shots
+            del shared_shots
+
+            num_shards = min(num_shots, self.num_workers * self.shards_per_worker)
+            bounds = np.linspace(0, num_shots, num_shards + 1).astype(int)
+
+            executor = self._get_executor()
+            futures = [
+                executor.submit(
+                    _decode_shard,
+                    shm_in.name,
+                    shm_out.name,
+                    shots.shape,
+                    output_shape,
+                    int(start),
+                    int(stop),
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                self.latencies.extend(future.result())
+
+            result = np.ndarray(output_shape, dtype=np.uint8, buffer=shm_out.buf).copy()
+        finally:
+            shm_in.close()
+            shm_in.unlink()
+            shm_out.close()
+            shm_out.unlink()
+
+        return result
+
+    def get_average_latency(self) -> float:
+        """Get average per-shot decode latency in seconds, across workers."""
+        return self.latencies.average()
+
+    def reset_latencies(self) -> None:
+        """Clear latency tracking data."""
+        self.latencies.clear()
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ParallelTesseractDecoder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
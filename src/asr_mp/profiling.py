@@ -0,0 +1,172 @@
+"""
+Decode Profiling: Per-Stage Timing Breakdown
+
+Aggregates wall time spent in each stage of the bit-packed decode path
+(unpacking, BP, OSD, packing the error estimates, logical projection)
+together with the distribution of BP iterations per shot. Profiling is opt-in; decoders
+without a DecodeProfile skip all of the bookkeeping.
+"""
+
+import csv
+import json
+
+import numpy as np
+
+# Stages in the order a bit-packed batch passes through them
+STAGES = ("unpack", "bp", "osd", "pack", "projection")
+
+
+class DecodeProfile:
+    """
+    Accumulated per-stage timings for a decoder.
+
+    Every stage records total seconds and the number of shots that passed
+    through it. BP iteration counts are kept as a histogram indexed by the
+    iteration count, so memory does not grow with the number of shots.
+
+    ldpc runs BP and OSD inside one call. For shots that needed OSD, the BP
+    share is estimated as their iteration count times the mean per-iteration
+    BP time measured on shots where BP converged, and the rest of the call
+    is attributed to OSD.
+
+    Attributes:
+        seconds: Total seconds per stage
+        shots: Shots that passed through each stage
+        iteration_counts: Shots per BP iteration count
+
+    Example:
+        >>> decoder = ASRMPDecoder(dem, profile=True)
+        >>> decoder.get_logical_correction_batch(syndromes)
+        >>> decoder.profile.to_json("profile.json")
+    """
+
+    def __init__(self):
+        """Initialize an empty profile."""
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self.shots = dict.fromkeys(STAGES, 0)
+        self.iteration_counts = np.zeros(0, dtype=np.int64)
+        self._converged_seconds = 0.0
+        self._converged_iterations = 0
+
+    def add(self, stage: str, seconds: float, num_shots: int) -> None:
+        """
+        Add time spent in one stage.
+
+        Args:
+            stage: One of STAGES
+            seconds: Wall time spent
+            num_shots: Shots processed in that time
+        """
+        self.seconds[stage] += seconds
+        self.shots[stage] += num_shots
+
+    def add_iterations(self, iterations: np.ndarray) -> None:
+        """Add BP iteration counts, one per shot."""
+        iterations = np.asarray(iterations, dtype=np.int64)
+        if not len(iterations):
+            return
+        counts = np.bincount(iterations)
+        if len(counts) > len(self.iteration_counts):
+            counts[: len(self.iteration_counts)] += self.iteration_counts
+            self.iteration_counts = counts
+        else:
+            self.iteration_counts[: len(counts)] += counts
+
+    def add_bp_osd(
+        self,
+        durations: np.ndarray,
+        converged: np.ndarray,
+        iterations: np.ndarray,
+    ) -> None:
+        """
+        Split per-shot BP+OSD call times into BP and OSD.
+
+        Args:
+            durations: Wall time of each shot's BP+OSD call
+            converged: Whether BP converged (OSD skipped) for each shot
+            iterations: BP iterations used by each shot
+        """
+        durations = np.asarray(durations, dtype=np.float64)
+        converged = np.asarray(converged, dtype=bool)
+        iterations = np.asarray(iterations, dtype=np.int64)
+
+        self._converged_seconds += float(durations[converged].sum())
+        self._converged_iterations += int(iterations[converged].sum())
+        per_iteration = (
+            self._converged_seconds / self._converged_iterations
+            if self._converged_iterations
+            else 0.0
+        )
+
+        failed = ~converged
+        bp_failed = np.minimum(durations[failed], iterations[failed] * per_iteration)
+        self.add("bp", float(durations[converged].sum() + bp_failed.sum()), len(durations))
+        self.add("osd", float((durations[failed] - bp_failed).sum()), int(failed.sum()))
+        self.add_iterations(iterations)
+
+    def reset(self) -> None:
+        """Clear all accumulated timings."""
+        self.__init__()
+
+    @property
+    def mean_iterations(self) -> float:
+        """Mean BP iterations per shot."""
+        total = int(self.iteration_counts.sum())
+        if not total:
+            return 0.0
+        return float(np.arange(len(self.iteration_counts)) @ self.iteration_counts) / total
+
+    def to_dict(self) -> dict:
+        """
+        Summarize the profile.
+
+        Returns:
+            Per-stage seconds, shots and mean microseconds per shot, plus the
+            BP iteration histogram
+        """
+        stages = {}
+        for stage in STAGES:
+            shots = self.shots[stage]
+            stages[stage] = {
+                "seconds": self.seconds[stage],
+                "shots": shots,
+                "us_per_shot": 1e6 * self.seconds[stage] / shots if shots else 0.0,
+            }
+        return {
+            "stages": stages,
+            "total_seconds": sum(self.seconds.values()),
+            "bp_iterations": {
+                "mean": self.mean_iterations,
+                "histogram": self.iteration_counts.tolist(),
+            },
+        }
+
+    def to_json(self, path: str | None = None) -> str:
+        """
+        Serialize the profile as JSON.
+
+        Args:
+            path: File to write (optional)
+
+        Returns:
+            JSON text
+        """
+        text = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def to_csv(self, path: str) -> None:
+        """
+        Write one row per stage to a CSV file.
+
+        Args:
+            path: File to write
+        """
+        stages = self.to_dict()["stages"]
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["stage", "seconds", "shots", "us_per_shot"])
+            for stage, row in stages.items():
+                writer.writerow([stage, row["seconds"], row["shots"], row["us_per_shot"]])
@@ -0,0 +1,355 @@
+"""
+Sliding-Window Decoding: Overlapping Time Windows for Long Memory Experiments
+
+Decodes the spacetime parity check matrix in overlapping windows of
+``window`` detector layers (rounds). After each window the errors that
+start in its oldest ``commit`` layers are committed, their effect is
+removed from the remaining syndrome, and the window slides forward. Each
+BP+OSD problem is window-sized, and windows with the same structure share
+one decoder, so cost per window no longer grows with the number of rounds.
+"""
+
+import time
+import warnings
+
+import numpy as np
+import scipy.sparse
+import sinter
+import stim
+
+from .decoder import DECODER_PRESETS
+from .dem_utils import (
+    DEFAULT_UNPACK_CHUNK_BYTES,
+    SyndromeUnpacker,
+    dem_to_matrices_cached,
+    detector_layers,
+)
+from .latency import LatencyBuffer
+
+# Silence ldpc's import-time warnings without touching the global filters
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    try:
+        from ldpc import BpOsdDecoder
+    except ImportError:
+        from ldpc import bposd_decoder as BpOsdDecoder
+
+
+class _Window:
+    """Row/column selection and commit data for one window position."""
+
+    __slots__ = ("rows", "cols", "commit", "key", "priors", "flip_rows", "flips", "logicals")
+
+    def __init__(
+        self,
+        H: scipy.sparse.csc_matrix,
+        L: scipy.sparse.csc_matrix,
+        priors: np.ndarray,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        commit: np.ndarray,
+    ):
+        self.rows = rows
+        self.cols = cols
+        self.commit = commit
+        self.priors = priors[cols]
+
+        window_H = H[rows][:, cols]
+        self.key = (window_H.shape, window_H.indptr.tobytes(), window_H.indices.tobytes())
+
+        # Detectors flipped and observables toggled by the committed errors
+        committed_H = H[:, cols[commit]]
+        self.flip_rows = np.unique(committed_H.indices)
+        self.flips = committed_H[self.flip_rows].T.tocsr()
+        self.logicals = L[:, cols[commit]].T.tocsr()
+
+    def window_matrix(self, H: scipy.sparse.csc_matrix) -> scipy.sparse.csc_matrix:
+        """Parity check matrix restricted to this window."""
+        return H[self.rows][:, self.cols]
+
+
+class SlidingWindowDecoder:
+    """
+    Overlapping-window BP+OSD decoder.
+
+    Detector layers are taken from the last detector coordinate (the round
+    index in Stim's generated circuits). An error belongs to the layer of
+    its earliest detector. Window k covers layers
+    ``[k*commit, k*commit + window)``. Its errors are decoded against its
+    detectors only, and those in the first ``commit`` layers are kept. The
+    final window commits everything that remains.
+
+    Attributes:
+        H: Full parity check matrix (sparse)
+        L: Full logical observable matrix (sparse)
+        priors: Prior error probabilities
+        window: Layers per window
+        commit: Layers committed per window
+        num_layers: Number of detector layers in the DEM
+        latencies: Ring buffer of per-shot decode times: each shot's BP+OSD time
+            summed over windows plus an even share of the batch overhead
+
+    Example:
+        >>> decoder = SlidingWindowDecoder(dem, window=10, commit=5)
+        >>> corrections = decoder.get_logical_correction_batch(syndromes)
+    """
+
+    def __init__(
+        self,
+        dem: stim.DetectorErrorModel,
+        window: int = 10,
+        commit: int | None = None,
+        bp_method: str = "product_sum",
+        max_iter: int | None = None,
+        osd_method: str | None = None,
+        osd_order: int | None = None,
+        error_rate: float = 0.001,
+        preset: str = "balanced",
+    ):
+        """
+        Initialize the sliding-window decoder.
+
+        Args:
+            dem: Stim DetectorErrorModel with detector time coordinates
+            window: Detector layers (rounds) decoded together
+            commit: Layers committed per window (default: window // 2)
+            bp_method: BP algorithm variant
+            max_iter: Maximum BP iterations (default from preset)
+            osd_method: OSD variant (default from preset)
+            osd_order: OSD search depth (default from preset)
+            error_rate: Base error rate for channel initialization
+            preset: Speed/accuracy preset, see DECODER_PRESETS
+
+        Raises:
+            ValueError: If the window sizes or preset are invalid, or the DEM
+                has detectors without coordinates
+        """
+        commit = max(window // 2, 1) if commit is None else commit
+        if window < 1 or not 1 <= commit <= window:
+            raise ValueError(f"Need 1 <= commit <= window, got commit={commit}, window={window}")
+        if preset not in DECODER_PRESETS:
+            raise ValueError(f"Unknown preset '{preset}'. Choose from: {list(DECODER_PRESETS)}")
+
+        config = DECODER_PRESETS[preset]
+        self.bp_method = bp_method
+        self.max_iter = config["max_iter"] if max_iter is None else max_iter
+        self.osd_method = config["osd_method"] if osd_method is None else osd_method
+        self.osd_order = config["osd_order"] if osd_order is None else osd_order
+        self.error_rate = error_rate
+
+        self.dem = dem
+        self.window = window
+        self.commit = commit
+        self.H, self.L, self.priors = dem_to_matrices_cached(dem)
+        self.latencies = LatencyBuffer()
+
+        layers = detector_layers(dem)
+        self.num_layers = int(layers.max()) + 1 if len(layers) else 0
+        self._windows = self._build_windows(layers)
+
+        # One BP+OSD decoder per distinct window structure; priors are swapped
+        # in when consecutive windows share a decoder but not their noise
+        self._decoders: dict[tuple, BpOsdDecoder] = {}
+        self._decoder_priors: dict[tuple, np.ndarray] = {}
+        for win in self._windows:
+            if win.key in self._decoders:
+                # Share the array so identical noise is recognized by identity
+                if np.array_equal(win.priors, self._decoder_priors[win.key]):
+                    win.priors = self._decoder_priors[win.key]
+            else:
+                self._decoders[win.key] = BpOsdDecoder(
+                    win.window_matrix(self.H),
+                    error_rate=error_rate,
+                    channel_probs=win.priors,
+                    bp_method=self.bp_method,
+                    max_iter=self.max_iter,
+                    osd_method=self.osd_method,
+                    osd_order=self.osd_order,
+                )
+                self._decoder_priors[win.key] = win.priors
+
+    def _build_windows(self, layers: np.ndarray) -> list[_Window]:
+        """Split the matrices into overlapping window positions."""
+        H = self.H
+        first_layer = np.full(H.shape[1], -1, dtype=np.int64)
+        nonempty = np.flatnonzero(np.diff(H.indptr))
+        if len(nonempty):
+            first_layer[nonempty] = np.minimum.reduceat(layers[H.indices], H.indptr[:-1][nonempty])
+
+        windows = []
+        start = 0
+        while start < self.num_layers:
+            end = start + self.window
+            final = end >= self.num_layers
+            commit_end = self.num_layers if final else start + self.commit
+
+            rows = np.flatnonzero((layers >= start) & (layers < end))
+            cols = np.flatnonzero((first_layer >= start) & (first_layer < end))
+            if len(cols):
+                commit = first_layer[cols] < commit_end
+                windows.append(_Window(H, self.L, self.priors, rows, cols, commit))
+            if final:
+                break
+            start += self.commit
+        return windows
+
+    @property
+    def num_windows(self) -> int:
+        """Number of window positions per shot."""
+        return len(self._windows)
+
+    def get_logical_correction_batch(self, syndromes: np.ndarray) -> np.ndarray:
+        """
+        Decode a batch of syndromes window by window.
+
+        All shots advance through window k before window k+1, so each
+        decoder's priors are swapped at most once per window per batch.
+
+        Args:
+            syndromes: Binary syndrome array (num_shots, num_detectors)
+
+        Returns:
+            Logical correction array (num_shots, num_observables)
+        """
+        syndromes = np.array(syndromes, dtype=np.uint8)
+        num_shots = syndromes.shape[0]
+        corrections = np.zeros((num_shots, self.L.shape[0]), dtype=np.uint8)
+        shot_seconds = np.zeros(num_shots)
+        clock = time.perf_counter
+        t0 = clock()
+
+        for win in self._windows:
+            decoder = self._decoders[win.key]
+            if self._decoder_priors[win.key] is not win.priors:
+                decoder.update_channel_probs(win.priors)
+                self._decoder_priors[win.key] = win.priors
+
+            window_syndromes = syndromes[:, win.rows]
+            active = np.flatnonzero(window_syndromes.any(axis=1))
+            if not len(active):
+                continue
+
+            committed = np.empty((len(active), int(win.commit.sum())), dtype=np.uint8)
+            stamps = np.empty(len(active) + 1)
+            stamps[0] = clock()
+            for k, shot in enumerate(active):
+                committed[k] = decoder.decode(window_syndromes[shot])[win.commit]
+                stamps[k + 1] = clock()
+            shot_seconds[active] += np.diff(stamps)
+
+            # Pass the residual syndrome forward and accumulate observables
+            flips = (committed @ win.flips) % 2
+            syndromes[np.ix_(active, win.flip_rows)] ^= flips.astype(np.uint8)
+            corrections[active] ^= ((committed @ win.logicals) % 2).astype(np.uint8)
+
+        if num_shots:
+            overhead = clock() - t0 - shot_seconds.sum()
+            shot_seconds += max(overhead, 0.0) / num_shots
+            self.latencies.extend(shot_seconds)
+        return corrections
+
+    def get_logical_correction(self, syndrome: np.ndarray) -> np.ndarray:
+        """
+        Decode a single syndrome.
+
+        Args:
+            syndrome: Binary syndrome array (num_detectors,)
+
+        Returns:
+            Logical correction array (num_observables,)
+        """
+        return self.get_logical_correction_batch(np.asarray(syndrome)[np.newaxis])[0]
+
+    def get_average_latency(self) -> float:
+        """Get average per-shot decode latency in seconds."""
+        return self.latencies.average()
+
+    def reset_latencies(self) -> None:
+        """Clear latency tracking data."""
+        self.latencies.clear()
+
+
+class SlidingWindowCompiledDecoder(sinter.CompiledDecoder):
+    """Sinter-compatible compiled decoder wrapper for sliding-window BP+OSD."""
+
+    def __init__(
+        self,
+        dem: stim.DetectorErrorModel,
+        chunk_bytes: int = DEFAULT_UNPACK_CHUNK_BYTES,
+        **decoder_kwargs,
+    ):
+        """
+        Initialize the compiled decoder.
+
+        Args:
+            dem: Stim DetectorErrorModel
+            chunk_bytes: Size bound of the unpacked syndrome buffer in bytes
+            **decoder_kwargs: Forwarded to SlidingWindowDecoder
+        """
+        self.dem = dem
+        self.decoder = SlidingWindowDecoder(dem, **decoder_kwargs)
+        self.unpacker = SyndromeUnpacker(dem.num_detectors, chunk_bytes)
+
+    def decode_shots_bit_packed(
+        self,
+        *,
+        bit_packed_detection_event_data: np.ndarray,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Decode multiple shots from bit-packed syndrome data, one bounded chunk at a time.
+
+        Args:
+            bit_packed_detection_event_data: Bit-packed syndrome array
+                Shape: (num_shots, ceil(num_detectors/8))
+
+        Returns:
+            Bit-packed logical predictions
+                Shape: (num_shots, ceil(num_observables/8))
+        """
+        num_shots = bit_packed_detection_event_data.shape[0]
+        predictions = np.empty((num_shots, (self.dem.num_observables + 7) // 8), dtype=np.uint8)
+        for start, stop, shots in self.unpacker.chunks(bit_packed_detection_event_data):
+            corrections = self.decoder.get_logical_correction_batch(shots)
+            predictions[start:stop] = np.packbits(corrections, axis=1, bitorder="little")
+        return predictions
+
+    @property
+    def latencies(self) -> LatencyBuffer:
+        """Access decoder latencies for profiling."""
+        return self.decoder.latencies
+
+
+class SlidingWindowBPOSD(sinter.Decoder):
+    """
+    Sinter Decoder factory for sliding-window BP+OSD.
+
+    Example:
+        >>> sinter.collect(
+        ...     tasks=tasks,
+        ...     decoders=["windowed"],
+        ...     custom_decoders={"windowed": SlidingWindowBPOSD(window=10, commit=5)},
+        ... )
+    """
+
+    def __init__(self, **decoder_kwargs):
+        """
+        Initialize the factory.
+
+        Args:
+            **decoder_kwargs: Forwarded to SlidingWindowDecoder
+        """
+        self.decoder_kwargs = decoder_kwargs
+
+    def compile_decoder_for_dem(
+        self,
+        *,
+        dem: stim.DetectorErrorModel,
+        **kwargs,
+    ) -> sinter.CompiledDecoder:
+        """Compile a decoder for the given DEM."""
+        return SlidingWindowCompiledDecoder(dem, **self.decoder_kwargs)
+
+    def decode_via_files(self, *args, **kwargs):
+        """Not implemented - use compile_decoder_for_dem instead."""
+        raise NotImplementedError("Use compile_decoder_for_dem for this decoder")
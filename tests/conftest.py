@@ -16,10 +16,11 @@ except ImportError:
     ASR_MP_AVAILABLE = False
 
 try:
-    from asr_mp.union_find_decoder import UnionFindDecoder
+    from asr_mp.union_find_decoder import FUSION_BLOSSOM_AVAILABLE, UnionFindDecoder
 
     UNION_FIND_AVAILABLE = True
 except ImportError:
+    FUSION_BLOSSOM_AVAILABLE = False
     UNION_FIND_AVAILABLE = False
 
 
@@ -27,7 +28,11 @@ except ImportError:
 requires_asr_mp = pytest.mark.skipif(not ASR_MP_AVAILABLE, reason="asr_mp package not available")
 
 requires_union_find = pytest.mark.skipif(
-    not UNION_FIND_AVAILABLE, reason="fusion-blossom not available"
+    not UNION_FIND_AVAILABLE, reason="union_find_decoder not available"
+)
+
+requires_fusion_blossom = pytest.mark.skipif(
+    not FUSION_BLOSSOM_AVAILABLE, reason="fusion-blossom not available"
 )
 
 
@@ -93,5 +98,5 @@ def asr_mp_decoder(small_dem: stim.DetectorErrorModel):
 def union_find_decoder(small_dem: stim.DetectorErrorModel):
     """Create a Union-Find decoder instance."""
     if not UNION_FIND_AVAILABLE:
-        pytest.skip("fusion-blossom not available")
+        pytest.skip("union_find_decoder not available")
     return UnionFindDecoder(small_dem)
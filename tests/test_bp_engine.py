@@ -0,0 +1,128 @@
+"""
+Unit tests for the batched NumPy BP engine.
+"""
+
+import numpy as np
+import pytest
+from conftest import requires_asr_mp
+
+
+@pytest.fixture
+def noisy_syndromes(small_circuit) -> np.ndarray:
+    """Sample detection events from the small circuit."""
+    sampler = small_circuit.compile_detector_sampler()
+    return sampler.sample(shots=100).astype(np.uint8)
+
+
+@requires_asr_mp
+class TestBatchBPDecoder:
+    """Tests for the BatchBPDecoder class."""
+
+    def test_output_shapes(self, small_dem, noisy_syndromes):
+        """Test that decode returns per-shot errors and convergence flags."""
+        from asr_mp.bp_engine import BatchBPDecoder
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(small_dem)
+        errors, converged = BatchBPDecoder(H, priors).decode(noisy_syndromes)
+
+        assert errors.shape == (100, H.shape[1])
+        assert errors.dtype == np.uint8
+        assert converged.shape == (100,)
+
+    def test_zero_syndrome_converges_immediately(self, small_dem, zero_syndrome):
+        """Test that a zero syndrome converges to the zero error in one iteration."""
+        from asr_mp.bp_engine import BatchBPDecoder
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(small_dem)
+        bp = BatchBPDecoder(H, priors)
+        errors, converged = bp.decode(zero_syndrome[np.newaxis])
+
+        assert converged[0]
+        assert not errors.any()
+        assert bp.iterations[0] == 1
+
+    @pytest.mark.parametrize("bp_method", ["product_sum", "minimum_sum"])
+    def test_converged_shots_satisfy_syndrome(self, small_dem, noisy_syndromes, bp_method):
+        """Test that shots flagged as converged reproduce their syndrome."""
+        from asr_mp.bp_engine import BatchBPDecoder
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(small_dem)
+        errors, converged = BatchBPDecoder(H, priors, bp_method=bp_method).decode(noisy_syndromes)
+
+        assert converged.any()
+        recomputed = (errors[converged] @ H.T.toarray()) % 2
+        np.testing.assert_array_equal(recomputed, noisy_syndromes[converged])
+
+    def test_product_sum_matches_ldpc(self, small_dem, noisy_syndromes):
+        """Test that product-sum BP agrees with ldpc's flooding BP."""
+        from ldpc import BpDecoder
+
+        from asr_mp.bp_engine import BatchBPDecoder
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(small_dem)
+        reference = BpDecoder(H, error_channel=priors, max_iter=30, bp_method="product_sum")
+        errors, converged = BatchBPDecoder(H, priors, max_iter=30).decode(noisy_syndromes)
+
+        for i, syndrome in enumerate(noisy_syndromes):
+            np.testing.assert_array_equal(errors[i], reference.decode(syndrome))
+            assert converged[i] == reference.converge
+
+    def test_batch_size_does_not_change_results(self, small_dem, noisy_syndromes):
+        """Test that chunking the batch gives identical results."""
+        from asr_mp.bp_engine import BatchBPDecoder
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(small_dem)
+        whole = BatchBPDecoder(H, priors, batch_size=1000).decode(noisy_syndromes)
+        chunked = BatchBPDecoder(H, priors, batch_size=7).decode(noisy_syndromes)
+
+        np.testing.assert_array_equal(whole[0], chunked[0])
+        np.testing.assert_array_equal(whole[1], chunked[1])
+
+    def test_failed_llrs_follow_shot_order(self, small_dem, noisy_syndromes):
+        """Test that non-converged shots keep their posteriors, in shot order."""
+        from asr_mp.bp_engine import BatchBPDecoder
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(small_dem)
+        bp = BatchBPDecoder(H, priors, max_iter=2, batch_size=7)
+        errors, converged = bp.decode(noisy_syndromes)
+
+        assert (~converged).any()
+        assert bp.failed_llrs.shape == (int((~converged).sum()), H.shape[1])
+        hard = (bp.failed_llrs < 0).astype(np.uint8)
+        np.testing.assert_array_equal(hard, errors[~converged])
+
+    def test_offset_min_sum(self, small_dem, noisy_syndromes):
+        """Test normalized/offset min-sum runs and converges on most shots."""
+        from asr_mp.bp_engine import BatchBPDecoder
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(small_dem)
+        bp = BatchBPDecoder(H, priors, bp_method="ms", ms_scaling_factor=0.75, ms_offset=0.1)
+        errors, converged = bp.decode(noisy_syndromes)
+
+        assert converged.mean() > 0.5
+
+    def test_invalid_bp_method(self, small_dem):
+        """Test that an unknown BP method is rejected."""
+        from asr_mp.bp_engine import BatchBPDecoder
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(small_dem)
+        with pytest.raises(ValueError):
+            BatchBPDecoder(H, priors, bp_method="belief")
+
+    def test_update_channel_probs_validates_shape(self, small_dem):
+        """Test that priors of the wrong length are rejected."""
+        from asr_mp.bp_engine import BatchBPDecoder
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(small_dem)
+        bp = BatchBPDecoder(H, priors)
+        with pytest.raises(ValueError):
+            bp.update_channel_probs(priors[:-1])
@@ -0,0 +1,113 @@
+"""
+Unit tests for the LRU cache.
+"""
+
+import pytest
+from conftest import requires_asr_mp
+
+
+@requires_asr_mp
+class TestLRUCache:
+    """Tests for the LRUCache class."""
+
+    def test_put_and_get(self):
+        """Test basic insertion and lookup."""
+        from asr_mp.cache import LRUCache
+
+        cache = LRUCache(max_entries=4)
+        cache.put(b"a", b"1", nbytes=2)
+
+        assert cache.get(b"a") == b"1"
+        assert b"a" in cache
+        assert len(cache) == 1
+
+    def test_miss_returns_default(self):
+        """Test that a missing key returns the default."""
+        from asr_mp.cache import LRUCache
+
+        cache = LRUCache(max_entries=4)
+
+        assert cache.get(b"missing") is None
+        assert cache.get(b"missing", default=b"") == b""
+
+    def test_hit_miss_counters(self):
+        """Test hit and miss accounting."""
+        from asr_mp.cache import LRUCache
+
+        cache = LRUCache(max_entries=4)
+        cache.put(b"a", b"1")
+        cache.get(b"a")
+        cache.get(b"a")
+        cache.get(b"b")
+
+        assert cache.hits == 2
+        assert cache.misses == 1
+        assert cache.hit_rate == pytest.approx(2 / 3)
+
+    def test_entry_limit_evicts_least_recent(self):
+        """Test that the least recently used entry is evicted first."""
+        from asr_mp.cache import LRUCache
+
+        cache = LRUCache(max_entries=2)
+        cache.put(b"a", 1)
+        cache.put(b"b", 2)
+        cache.get(b"a")
+        cache.put(b"c", 3)
+
+        assert b"a" in cache
+        assert b"b" not in cache
+        assert b"c" in cache
+        assert cache.evictions == 1
+
+    def test_byte_limit(self):
+        """Test that the byte limit bounds total size."""
+        from asr_mp.cache import LRUCache
+
+        cache = LRUCache(max_entries=100, max_bytes=10)
+        for i in range(5):
+            cache.put(i, i, nbytes=4)
+
+        assert cache.nbytes <= 10
+        assert len(cache) == 2
+
+    def test_oversized_entry_not_stored(self):
+        """Test that an entry larger than the byte limit is skipped."""
+        from asr_mp.cache import LRUCache
+
+        cache = LRUCache(max_entries=10, max_bytes=8)
+        cache.put(b"big", b"x", nbytes=16)
+
+        assert len(cache) == 0
+
+    def test_replace_updates_size(self):
+        """Test that replacing an entry does not double-count its size."""
+        from asr_mp.cache import LRUCache
+
+        cache = LRUCache(max_entries=10)
+        cache.put(b"a", b"1", nbytes=5)
+        cache.put(b"a", b"2", nbytes=3)
+
+        assert cache.nbytes == 3
+        assert cache.get(b"a") == b"2"
+
+    def test_clear(self):
+        """Test that clear empties the cache and resets counters."""
+        from asr_mp.cache import LRUCache
+
+        cache = LRUCache(max_entries=10)
+        cache.put(b"a", b"1", nbytes=2)
+        cache.get(b"a")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+        assert cache.hits == 0
+
+    def test_invalid_limits(self):
+        """Test that non-positive limits are rejected."""
+        from asr_mp.cache import LRUCache
+
+        with pytest.raises(ValueError):
+            LRUCache(max_entries=0)
+        with pytest.raises(ValueError):
+            LRUCache(max_entries=10, max_bytes=0)
@@ -3,6 +3,7 @@ Unit tests for the ASR-MP decoder.
 """
 
 import numpy as np
+import pytest
 from conftest import requires_asr_mp
 
 
@@ -100,6 +101,298 @@ class TestASRMPDecoder:
         assert decoder_precise.max_iter == 50
         assert decoder_precise.osd_order == 10
 
+    def test_configuration_reaches_ldpc(self, small_dem):
+        """Test that max_iter and osd_order drive the underlying ldpc decoder."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        decoder = ASRMPDecoder(small_dem, max_iter=7, osd_order=3)
+
+        assert decoder.bpd.max_iter == 7
+        assert decoder.bpd.osd_order == 3
+
+    @pytest.mark.parametrize("preset", ["fast", "balanced", "deep"])
+    def test_presets(self, small_dem, preset):
+        """Test that presets set the decoder configuration."""
+        from asr_mp.decoder import DECODER_PRESETS, ASRMPDecoder
+
+        decoder = ASRMPDecoder(small_dem, preset=preset)
+        config = DECODER_PRESETS[preset]
+
+        assert decoder.preset == preset
+        assert decoder.max_iter == config["max_iter"]
+        assert decoder.osd_method == config["osd_method"]
+        assert decoder.osd_order == config["osd_order"]
+        assert decoder.bpd.max_iter == config["max_iter"]
+
+    def test_explicit_arguments_override_preset(self, small_dem):
+        """Test that explicit keyword arguments take precedence over the preset."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        decoder = ASRMPDecoder(small_dem, preset="deep", osd_order=2)
+
+        assert decoder.max_iter == 100
+        assert decoder.osd_order == 2
+
+    def test_invalid_preset(self, small_dem):
+        """Test that an unknown preset is rejected."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        with pytest.raises(ValueError):
+            ASRMPDecoder(small_dem, preset="turbo")
+
+    def test_decode_batch_matches_single_shot(self, asr_mp_decoder, small_circuit):
+        """Test that batch decoding agrees with per-shot decoding."""
+        sampler = small_circuit.compile_detector_sampler()
+        syndromes = sampler.sample(shots=20).astype(np.uint8)
+
+        errors = asr_mp_decoder.decode_batch(syndromes)
+
+        assert errors.shape == (20, asr_mp_decoder.H.shape[1])
+        for i in range(20):
+            np.testing.assert_array_equal(errors[i], asr_mp_decoder.decode(syndromes[i]))
+
+    def test_decode_batch_records_latencies(self, asr_mp_decoder, sample_syndrome):
+        """Test that batch decoding records one latency per shot."""
+        asr_mp_decoder.reset_latencies()
+
+        asr_mp_decoder.decode_batch(np.tile(sample_syndrome, (4, 1)))
+
+        assert len(asr_mp_decoder.latencies) == 4
+        assert all(t > 0 for t in asr_mp_decoder.latencies)
+
+    def test_logical_correction_batch(self, asr_mp_decoder, small_circuit):
+        """Test batch logical corrections against the single-shot path."""
+        sampler = small_circuit.compile_detector_sampler()
+        syndromes = sampler.sample(shots=20).astype(np.uint8)
+
+        corrections = asr_mp_decoder.get_logical_correction_batch(syndromes)
+
+        assert corrections.shape == (20, asr_mp_decoder.dem.num_observables)
+        for i in range(20):
+            expected = asr_mp_decoder.get_logical_correction(syndromes[i])
+            np.testing.assert_array_equal(corrections[i], expected)
+
+    def test_logical_correction_packed(self, asr_mp_decoder, small_circuit):
+        """Test that packed corrections match the sparse logical projection."""
+        sampler = small_circuit.compile_detector_sampler()
+        syndromes = sampler.sample(shots=20).astype(np.uint8)
+
+        predictions = asr_mp_decoder.get_logical_correction_packed(syndromes)
+
+        errors = asr_mp_decoder.decode_batch(syndromes)
+        expected = np.asarray((asr_mp_decoder.L @ errors.T) % 2, dtype=np.uint8).T
+        np.testing.assert_array_equal(predictions, np.packbits(expected, axis=1, bitorder="little"))
+
+    def test_numpy_backend_matches_ldpc(self, small_dem, small_circuit):
+        """Test that the numpy BP backend agrees with ldpc wherever BP converges."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        sampler = small_circuit.compile_detector_sampler()
+        syndromes = sampler.sample(shots=50).astype(np.uint8)
+
+        ldpc_decoder = ASRMPDecoder(small_dem, osd_order=0)
+        numpy_decoder = ASRMPDecoder(small_dem, osd_order=0, backend="numpy")
+        errors = numpy_decoder.decode_batch(syndromes)
+        expected = ldpc_decoder.decode_batch(syndromes)
+
+        # Non-converged shots go to OSD from seeded reliabilities, so only
+        # the BP answers must match exactly
+        _, converged = numpy_decoder.bp.decode(syndromes)
+        assert numpy_decoder.num_bp_converged == ldpc_decoder.num_bp_converged
+        np.testing.assert_array_equal(errors[converged], expected[converged])
+        np.testing.assert_array_equal((errors @ numpy_decoder.H.T.toarray()) % 2, syndromes)
+        assert len(numpy_decoder.latencies) == 50
+
+    def test_numpy_backend_seeds_osd_with_posteriors(self):
+        """Test that non-converged numpy-BP shots get one seeded BP iteration, then OSD."""
+        import stim
+
+        from asr_mp.decoder import ASRMPDecoder
+
+        circuit = stim.Circuit.generated(
+            "surface_code:rotated_memory_z",
+            distance=3,
+            rounds=3,
+            after_clifford_depolarization=0.01,
+            before_measure_flip_probability=0.01,
+        )
+        dem = circuit.detector_error_model(decompose_errors=True)
+        syndromes = circuit.compile_detector_sampler(seed=3).sample(shots=200).astype(np.uint8)
+
+        decoder = ASRMPDecoder(dem, osd_order=0, backend="numpy")
+        errors = decoder.decode_batch(syndromes)
+
+        assert decoder.bpd.max_iter == 1
+        assert decoder.num_bp_converged < 200
+        np.testing.assert_array_equal((errors @ decoder.H.T.toarray()) % 2, syndromes)
+
+    def test_numpy_backend_single_shot(self, small_dem, sample_syndrome):
+        """Test single-shot decoding through the numpy backend."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        decoder = ASRMPDecoder(small_dem, osd_order=0, backend="numpy")
+        error = decoder.decode(sample_syndrome)
+
+        assert error.shape == (decoder.H.shape[1],)
+        assert len(decoder.latencies) == 1
+
+    @pytest.mark.parametrize("backend", ["ldpc", "numpy"])
+    def test_bp_convergence_counters(self, small_dem, small_circuit, backend):
+        """Test that BP convergence is counted per batch and cumulatively."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        sampler = small_circuit.compile_detector_sampler()
+        syndromes = sampler.sample(shots=40).astype(np.uint8)
+
+        decoder = ASRMPDecoder(small_dem, osd_order=0, backend=backend)
+        decoder.decode_batch(syndromes)
+        decoder.decode_batch(np.zeros_like(syndromes[:10]))
+
+        assert decoder.num_decoded == 50
+        assert decoder.last_batch_convergence == 1.0
+        assert 0 < decoder.bp_convergence_rate <= 1.0
+        assert decoder.num_bp_converged >= 10
+
+    @pytest.mark.parametrize("backend", ["ldpc", "numpy"])
+    def test_adaptive_osd_tiers(self, small_dem, small_circuit, backend):
+        """Test that adaptive OSD accounts every shot to exactly one tier."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        sampler = small_circuit.compile_detector_sampler()
+        syndromes = sampler.sample(shots=40).astype(np.uint8)
+
+        decoder = ASRMPDecoder(small_dem, preset="deep", adaptive_osd=True, backend=backend)
+        errors = decoder.decode_batch(syndromes)
+
+        assert sum(decoder.tier_counts.values()) == 40
+        assert decoder.tier_counts["bp"] >= decoder.num_bp_converged
+        assert sum(decoder.tier_fractions.values()) == pytest.approx(1.0)
+
+        # Every tier returns an estimate that reproduces the syndrome
+        np.testing.assert_array_equal((errors @ decoder.H.T.toarray()) % 2, syndromes)
+
+    def test_adaptive_osd_escalates_unreliable_shots(self, small_dem):
+        """Test that an OSD-0 solution beyond the reliability margin is escalated."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        decoder = ASRMPDecoder(small_dem, osd_order=4, adaptive_osd=True, escalation_margin=-1.0)
+        syndrome = np.zeros(small_dem.num_detectors, dtype=np.uint8)
+        syndrome[::3] = 1
+        decoder.decode(syndrome)
+
+        assert decoder.tier_counts["escalated"] + decoder.tier_counts["bp"] == 1
+        assert decoder.tier_counts["osd_0"] == 0
+        assert decoder.bpd is None
+
+    def test_adaptive_osd_escalates_a_minority(self):
+        """Test that few shots reach the deep tier at a realistic error rate."""
+        import stim
+
+        from asr_mp.decoder import ASRMPDecoder
+
+        p = 0.002
+        circuit = stim.Circuit.generated(
+            "surface_code:rotated_memory_z",
+            distance=5,
+            rounds=5,
+            after_clifford_depolarization=p,
+            before_round_data_depolarization=p,
+            before_measure_flip_probability=p,
+            after_reset_flip_probability=p,
+        )
+        dem = circuit.detector_error_model(decompose_errors=True)
+        syndromes = circuit.compile_detector_sampler(seed=1).sample(shots=1000).astype(np.uint8)
+
+        decoder = ASRMPDecoder(dem, preset="deep", adaptive_osd=True)
+        decoder.decode_batch(syndromes)
+
+        assert decoder.tier_counts["osd_0"] + decoder.tier_counts["escalated"] > 0
+        assert decoder.tier_counts["escalated"] < decoder.tier_counts["osd_0"]
+        assert decoder.tier_fractions["escalated"] < 0.06
+
+    def test_merge_duplicates(self, small_dem, small_circuit):
+        """Test decoding over merged duplicate columns."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        syndromes = small_circuit.compile_detector_sampler().sample(shots=50).astype(np.uint8)
+
+        decoder = ASRMPDecoder(small_dem, merge_duplicates=True)
+        errors = decoder.decode_batch(syndromes)
+
+        assert decoder.H.shape[1] == decoder.column_map.max() + 1
+        assert decoder.H.shape[1] < len(decoder.column_map)
+        np.testing.assert_array_equal((decoder.H @ errors.T).T % 2, syndromes)
+        assert decoder.get_logical_correction_batch(syndromes).shape == (50, 1)
+
+    @pytest.mark.parametrize("backend", ["ldpc", "numpy"])
+    def test_update_from_dem_matches_fresh_decoder(self, small_dem, backend):
+        """Test that refreshed priors decode like a decoder built from the new DEM."""
+        import stim
+
+        from asr_mp.decoder import ASRMPDecoder
+
+        drifted_circuit = stim.Circuit.generated(
+            "surface_code:rotated_memory_z",
+            distance=3,
+            rounds=3,
+            after_clifford_depolarization=0.01,
+            before_round_data_depolarization=0.002,
+            before_measure_flip_probability=0.02,
+            after_reset_flip_probability=0.001,
+        )
+        drifted_dem = drifted_circuit.detector_error_model(decompose_errors=True)
+        syndromes = drifted_circuit.compile_detector_sampler().sample(shots=50).astype(np.uint8)
+
+        decoder = ASRMPDecoder(small_dem, backend=backend)
+        bpd = decoder.bpd
+        decoder.update_from_dem(drifted_dem)
+        fresh = ASRMPDecoder(drifted_dem, backend=backend)
+
+        assert decoder.bpd is bpd
+        np.testing.assert_allclose(decoder.bpd.channel_probs, fresh.priors)
+        np.testing.assert_array_equal(
+            decoder.decode_batch(syndromes), fresh.decode_batch(syndromes)
+        )
+
+    def test_update_from_dem_rejects_other_structure(self, small_dem, stress_dem):
+        """Test that a DEM with a different structure is rejected."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        decoder = ASRMPDecoder(small_dem)
+
+        with pytest.raises(ValueError):
+            decoder.update_from_dem(stress_dem)
+
+    def test_update_priors_validation(self, asr_mp_decoder):
+        """Test that priors of the wrong length or range are rejected."""
+        num_errors = asr_mp_decoder.H.shape[1]
+
+        with pytest.raises(ValueError):
+            asr_mp_decoder.update_priors(np.full(num_errors - 1, 0.01))
+        with pytest.raises(ValueError):
+            asr_mp_decoder.update_priors(np.full(num_errors, 1.5))
+
+    def test_update_priors_with_merged_columns(self, small_dem):
+        """Test that per-DEM-error priors are combined onto merged columns."""
+        from asr_mp.decoder import ASRMPDecoder
+        from asr_mp.dem_utils import merge_priors
+
+        decoder = ASRMPDecoder(small_dem, merge_duplicates=True)
+        dem_priors = np.full(len(decoder.column_map), 0.01)
+
+        decoder.update_priors(dem_priors)
+        np.testing.assert_allclose(decoder.priors, merge_priors(dem_priors, decoder.column_map))
+
+        decoder.update_priors(np.full(decoder.H.shape[1], 0.02))
+        np.testing.assert_allclose(decoder.priors, 0.02)
+
+    def test_invalid_backend(self, small_dem):
+        """Test that an unknown backend is rejected."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        with pytest.raises(ValueError):
+            ASRMPDecoder(small_dem, backend="cuda")
+
 
 @requires_asr_mp
 class TestTesseractBPOSD:
@@ -152,3 +445,146 @@ class TestTesseractBPOSD:
 
         num_obs_bytes = (small_dem.num_observables + 7) // 8
         assert result.shape == (num_shots, num_obs_bytes)
+
+    def test_decode_shots_matches_per_shot(self, small_circuit, small_dem):
+        """Test bit-packed batch decoding against per-shot corrections."""
+        from asr_mp.decoder import ASRMPDecoder, TesseractBPOSD
+
+        compiled = TesseractBPOSD().compile_decoder_for_dem(dem=small_dem)
+        reference = ASRMPDecoder(small_dem)
+
+        sampler = small_circuit.compile_detector_sampler()
+        shots = sampler.sample(shots=50, bit_packed=True)
+
+        result = compiled.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+
+        unpacked = np.unpackbits(shots, axis=1, count=small_dem.num_detectors, bitorder="little")
+        for i in range(50):
+            expected = np.packbits(reference.get_logical_correction(unpacked[i]), bitorder="little")
+            np.testing.assert_array_equal(result[i], expected)
+
+    def test_zero_syndromes_skip_decoder(self, small_dem):
+        """Test that all-zero shots bypass BP+OSD and are counted."""
+        from asr_mp.decoder import TesseractBPOSD
+
+        compiled = TesseractBPOSD().compile_decoder_for_dem(dem=small_dem)
+
+        num_det_bytes = (small_dem.num_detectors + 7) // 8
+        bit_packed = np.zeros((8, num_det_bytes), dtype=np.uint8)
+        bit_packed[3, 0] = 0b101
+
+        result = compiled.decode_shots_bit_packed(bit_packed_detection_event_data=bit_packed)
+
+        assert result.shape[0] == 8
+        assert not result[[0, 1, 2, 4, 5, 6, 7]].any()
+        assert len(compiled.decoder.latencies) == 1
+        assert len(compiled.latencies) == 8
+        assert compiled.num_shots == 8
+        assert compiled.num_trivial_shots == 7
+        assert compiled.trivial_fraction == 7 / 8
+
+    def test_syndrome_cache(self, small_circuit, small_dem):
+        """Test that repeated syndromes are served from the cache."""
+        from asr_mp.decoder import TesseractBPOSD
+
+        cached = TesseractBPOSD(cache_size=1000).compile_decoder_for_dem(dem=small_dem)
+        uncached = TesseractBPOSD().compile_decoder_for_dem(dem=small_dem)
+
+        sampler = small_circuit.compile_detector_sampler()
+        shots = sampler.sample(shots=50, bit_packed=True)
+        expected = uncached.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+
+        first = cached.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+        second = cached.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+
+        np.testing.assert_array_equal(first, expected)
+        np.testing.assert_array_equal(second, expected)
+        unique = cached.num_unique_shots // 2
+        stats = cached.get_stats()["cache"]
+        assert stats["hits"] == unique
+        assert stats["misses"] == unique
+
+    def test_deduplicate_matches_plain_decoding(self, small_circuit, small_dem):
+        """Test that deduplicated decoding gives byte-identical output."""
+        from asr_mp.decoder import TesseractBPOSD
+
+        dedup = TesseractBPOSD().compile_decoder_for_dem(dem=small_dem)
+        plain = TesseractBPOSD(deduplicate=False).compile_decoder_for_dem(dem=small_dem)
+
+        sampler = small_circuit.compile_detector_sampler()
+        shots = sampler.sample(shots=50, bit_packed=True)
+        shots = np.concatenate([shots, shots[::-1]])
+
+        result = dedup.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+        expected = plain.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+
+        np.testing.assert_array_equal(result, expected)
+        assert dedup.num_unique_shots <= (100 - dedup.num_trivial_shots) // 2
+        assert len(dedup.decoder.latencies) == dedup.num_unique_shots
+        assert len(dedup.latencies) == 100
+
+    def test_chunked_unpacking_matches_single_chunk(self, small_circuit, small_dem):
+        """Test that tiny unpack chunks give the same predictions."""
+        from asr_mp.decoder import TesseractBPOSD
+
+        chunked = TesseractBPOSD(chunk_bytes=1, osd_order=0).compile_decoder_for_dem(dem=small_dem)
+        whole = TesseractBPOSD(osd_order=0).compile_decoder_for_dem(dem=small_dem)
+
+        shots = small_circuit.compile_detector_sampler(seed=2).sample(shots=50, bit_packed=True)
+        result = chunked.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+        expected = whole.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+
+        assert chunked.unpacker.chunk_shots == 1
+        np.testing.assert_array_equal(result, expected)
+
+    def test_chunks_bound_error_estimates(self, small_dem):
+        """Test that chunks are sized by the error count, not only the detector count."""
+        from asr_mp.decoder import TesseractBPOSD
+
+        compiled = TesseractBPOSD(chunk_bytes=10_000).compile_decoder_for_dem(dem=small_dem)
+        num_errors = compiled.decoder.H.shape[1]
+
+        assert num_errors > small_dem.num_detectors
+        assert compiled.unpacker.chunk_shots == 10_000 // num_errors
+
+    def test_update_priors_clears_cache(self, small_circuit, small_dem):
+        """Test that updating priors invalidates cached predictions."""
+        from asr_mp.decoder import TesseractBPOSD
+
+        compiled = TesseractBPOSD(cache_size=1000).compile_decoder_for_dem(dem=small_dem)
+        shots = small_circuit.compile_detector_sampler().sample(shots=50, bit_packed=True)
+        compiled.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+        assert len(compiled.cache) > 0
+
+        compiled.update_priors(compiled.decoder.priors * 2)
+
+        assert len(compiled.cache) == 0
+        np.testing.assert_allclose(compiled.decoder.bpd.channel_probs, compiled.decoder.priors)
+
+    def test_drift_tracking_updates_priors(self, small_circuit, small_dem):
+        """Test that drift tracking re-estimates priors every update interval."""
+        from asr_mp.decoder import TesseractBPOSD
+
+        compiled = TesseractBPOSD(
+            drift_window=5000, drift_update_shots=300
+        ).compile_decoder_for_dem(dem=small_dem)
+        initial = compiled.decoder.priors.copy()
+        shots = small_circuit.compile_detector_sampler().sample(shots=200, bit_packed=True)
+
+        compiled.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+        assert compiled.num_prior_updates == 0
+        compiled.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+
+        assert compiled.num_prior_updates == 1
+        assert compiled.get_stats()["prior_updates"] == 1
+        assert compiled.drift.num_shots == 400
+        assert not np.array_equal(compiled.decoder.priors, initial)
+
+    def test_cache_disabled_by_default(self, small_dem):
+        """Test that the cache is off unless requested."""
+        from asr_mp.decoder import TesseractBPOSD
+
+        compiled = TesseractBPOSD().compile_decoder_for_dem(dem=small_dem)
+
+        assert compiled.cache is None
+        assert "cache" not in compiled.get_stats()
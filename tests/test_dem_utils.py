@@ -3,6 +3,7 @@ Unit tests for DEM utilities.
 """
 
 import numpy as np
+import pytest
 import scipy.sparse
 from conftest import requires_asr_mp
 
@@ -92,6 +93,338 @@ class TestDemToMatrices:
         # H and L should have same number of columns
         assert H.shape[1] == L.shape[1]
 
+    def test_matches_instruction_walk(self, stress_dem):
+        """Test that the text parser agrees with walking DEM instructions."""
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(stress_dem)
+
+        errors = [inst for inst in stress_dem.flattened() if inst.type == "error"]
+        np.testing.assert_array_equal(priors, [inst.args_copy()[0] for inst in errors])
+        for col, inst in enumerate(errors):
+            targets = inst.targets_copy()
+            dets = [t.val for t in targets if t.is_relative_detector_id()]
+            obs = [t.val for t in targets if t.is_logical_observable_id()]
+            np.testing.assert_array_equal(
+                H[:, [col]].toarray().ravel(), np.bincount(dets, minlength=H.shape[0]) % 2
+            )
+            np.testing.assert_array_equal(
+                L[:, [col]].toarray().ravel(), np.bincount(obs, minlength=L.shape[0]) % 2
+            )
+
+    def test_parses_tags_coordinates_and_repeats(self):
+        """Test tagged errors, detector coordinates and repeat blocks."""
+        import stim
+
+        from asr_mp.dem_utils import dem_to_matrices
+
+        dem = stim.DetectorErrorModel("""
+            error[tag](0.1) D0 L0
+            error(1e-05) D1 D2
+            detector(1, 2, 0) D3
+            logical_observable L1
+            repeat 2 {
+                error(0.01) D0 L1
+                shift_detectors 1
+            }
+            """)
+
+        H, L, priors = dem_to_matrices(dem)
+
+        np.testing.assert_array_equal(priors, [0.1, 1e-05, 0.01, 0.01])
+        np.testing.assert_array_equal(
+            H.toarray(), [[1, 0, 1, 0], [0, 1, 0, 1], [0, 1, 0, 0], [0, 0, 0, 0]]
+        )
+        np.testing.assert_array_equal(L.toarray(), [[1, 0, 0, 0], [0, 0, 1, 1]])
+
+    def test_nested_repeat_blocks(self):
+        """Test that repeat blocks with detector shifts match the flattened DEM."""
+        import stim
+
+        from asr_mp.dem_utils import dem_to_matrices
+
+        dem = stim.DetectorErrorModel("""
+            error(0.1) D0 L0
+            repeat 3 {
+                error(0.01) D0 D1
+                repeat 2 {
+                    error(0.2) D0 L1
+                    shift_detectors(0, 1) 1
+                }
+                shift_detectors 2
+            }
+            error(0.3) D1
+            """)
+
+        H, L, priors = dem_to_matrices(dem)
+        H_flat, L_flat, priors_flat = dem_to_matrices(dem.flattened())
+
+        assert H.shape == (14, 11)
+        assert (H != H_flat).nnz == 0
+        assert (L != L_flat).nnz == 0
+        np.testing.assert_array_equal(priors, priors_flat)
+
+    def test_separator_symptoms_cancel(self):
+        """Test that detectors shared by "^" components cancel mod 2."""
+        import stim
+
+        from asr_mp.dem_utils import dem_to_matrices
+
+        dem = stim.DetectorErrorModel("error(0.1) D0 D1 ^ D1 D2 L0 ^ L0")
+
+        H, L, _ = dem_to_matrices(dem)
+
+        np.testing.assert_array_equal(H.toarray(), [[1], [0], [1]])
+        assert L.nnz == 0
+
+    def test_empty_dem(self):
+        """Test that a DEM without errors gives empty matrices."""
+        import stim
+
+        from asr_mp.dem_utils import dem_to_matrices
+
+        H, L, priors = dem_to_matrices(stim.DetectorErrorModel("detector D0"))
+
+        assert H.shape == (1, 0)
+        assert L.shape == (0, 0)
+        assert len(priors) == 0
+
+
+@requires_asr_mp
+class TestDemToGraphlikeComponents:
+    """Tests for splitting decomposed errors into graphlike components."""
+
+    def test_components_are_graphlike(self, small_dem):
+        """Test that every component flips at most two detectors."""
+        from asr_mp.dem_utils import dem_to_graphlike_components, dem_to_matrices
+
+        H_c, L_c, error_index = dem_to_graphlike_components(small_dem)
+        H, _, _ = dem_to_matrices(small_dem)
+
+        assert H_c.shape[1] == L_c.shape[1] == len(error_index)
+        assert np.diff(H_c.indptr).max() <= 2
+        np.testing.assert_array_equal(np.unique(error_index), np.arange(H.shape[1]))
+
+    def test_components_xor_to_errors(self, small_dem):
+        """Test that the components of each error XOR to its column of H and L."""
+        from asr_mp.dem_utils import dem_to_graphlike_components, dem_to_matrices
+
+        H_c, L_c, error_index = dem_to_graphlike_components(small_dem)
+        H, L, _ = dem_to_matrices(small_dem)
+
+        owner = scipy.sparse.csc_matrix(
+            (np.ones(len(error_index)), (np.arange(len(error_index)), error_index)),
+            shape=(len(error_index), H.shape[1]),
+        )
+        np.testing.assert_array_equal((H_c @ owner).toarray() % 2, H.toarray())
+        np.testing.assert_array_equal((L_c @ owner).toarray() % 2, L.toarray())
+
+
+@requires_asr_mp
+class TestDemToMatricesCached:
+    """Tests for the cached DEM-to-matrix conversion."""
+
+    def test_matches_uncached(self, small_dem):
+        """Test that cached matrices equal a fresh conversion."""
+        from asr_mp.dem_utils import clear_matrix_cache, dem_to_matrices, dem_to_matrices_cached
+
+        clear_matrix_cache()
+        H, L, priors = dem_to_matrices(small_dem)
+        for _ in range(2):
+            H_c, L_c, priors_c = dem_to_matrices_cached(small_dem)
+            assert (H != H_c).nnz == 0
+            assert (L != L_c).nnz == 0
+            np.testing.assert_array_equal(priors, priors_c)
+
+    def test_memory_cache_hit(self, small_dem):
+        """Test that a second lookup reuses the in-memory entry."""
+        from asr_mp import dem_utils
+
+        dem_utils.clear_matrix_cache()
+        H1, _, priors1 = dem_utils.dem_to_matrices_cached(small_dem)
+        H2, _, priors2 = dem_utils.dem_to_matrices_cached(small_dem)
+
+        assert H1 is H2
+        assert priors1 is not priors2
+        assert dem_utils._MATRIX_CACHE.hits == 1
+
+    def test_disk_cache_roundtrip(self, small_dem, tmp_path):
+        """Test that entries written to disk are reloaded after a memory flush."""
+        from asr_mp.dem_utils import clear_matrix_cache, dem_to_matrices, dem_to_matrices_cached
+
+        clear_matrix_cache()
+        dem_to_matrices_cached(small_dem, cache_dir=str(tmp_path))
+        assert len(list(tmp_path.glob("*.npz"))) == 1
+
+        clear_matrix_cache()
+        H, L, priors = dem_to_matrices_cached(small_dem, cache_dir=str(tmp_path))
+        H_ref, L_ref, priors_ref = dem_to_matrices(small_dem)
+
+        assert (H != H_ref).nnz == 0
+        assert (L != L_ref).nnz == 0
+        np.testing.assert_array_equal(priors, priors_ref)
+
+    def test_disk_cache_eviction(self, small_dem, stress_dem, tmp_path):
+        """Test that the cache directory is kept under its size limit."""
+        from asr_mp.dem_utils import clear_matrix_cache, dem_to_matrices_cached
+
+        clear_matrix_cache()
+        dem_to_matrices_cached(small_dem, cache_dir=str(tmp_path), max_disk_bytes=1)
+        dem_to_matrices_cached(stress_dem, cache_dir=str(tmp_path), max_disk_bytes=1)
+
+        assert len(list(tmp_path.glob("*.npz"))) == 0
+
+    def test_different_dems_different_entries(self, small_dem, stress_dem):
+        """Test that distinct DEMs do not collide."""
+        from asr_mp.dem_utils import clear_matrix_cache, dem_to_matrices_cached
+
+        clear_matrix_cache()
+        H1, _, _ = dem_to_matrices_cached(small_dem)
+        H2, _, _ = dem_to_matrices_cached(stress_dem)
+
+        assert H1 is not H2
+
+
+@requires_asr_mp
+class TestMergeDuplicateColumns:
+    """Tests for merging error mechanisms with identical supports."""
+
+    def test_merges_identical_supports(self):
+        """Test that identical columns merge with XOR-combined probabilities."""
+        import stim
+
+        from asr_mp.dem_utils import dem_to_matrices, merge_duplicate_columns
+
+        dem = stim.DetectorErrorModel("""
+            error(0.1) D0 D1
+            error(0.2) D1 L0
+            error(0.3) D0 D1
+            error(0.4) D1
+            """)
+
+        H, L, priors, column_map = merge_duplicate_columns(*dem_to_matrices(dem))
+
+        np.testing.assert_array_equal(column_map, [0, 1, 0, 2])
+        np.testing.assert_allclose(priors, [0.1 * 0.7 + 0.3 * 0.9, 0.2, 0.4])
+        np.testing.assert_array_equal(H.toarray(), [[1, 0, 0], [1, 1, 1]])
+        np.testing.assert_array_equal(L.toarray(), [[0, 1, 0]])
+
+    def test_preserves_columns_through_map(self, stress_dem):
+        """Test that every original column equals its merged column."""
+        from asr_mp.dem_utils import dem_to_matrices, merge_duplicate_columns
+
+        H, L, priors = dem_to_matrices(stress_dem)
+        H_m, L_m, priors_m, column_map = merge_duplicate_columns(H, L, priors)
+
+        assert H_m.shape[1] < H.shape[1]
+        assert (H != H_m[:, column_map]).nnz == 0
+        assert (L != L_m[:, column_map]).nnz == 0
+
+        survival = np.ones(len(priors_m))
+        np.multiply.at(survival, column_map, 1 - 2 * priors)
+        np.testing.assert_allclose(priors_m, (1 - survival) / 2)
+
+    def test_no_duplicates_is_identity(self):
+        """Test that a DEM without duplicates is returned unchanged."""
+        import stim
+
+        from asr_mp.dem_utils import dem_to_matrices, merge_duplicate_columns
+
+        dem = stim.DetectorErrorModel("error(0.1) D0\nerror(0.2) D1\nerror(0.3) D0 L0")
+        H, L, priors = dem_to_matrices(dem)
+
+        H_m, L_m, priors_m, column_map = merge_duplicate_columns(H, L, priors)
+
+        np.testing.assert_array_equal(column_map, [0, 1, 2])
+        np.testing.assert_allclose(priors_m, priors)
+        assert (H != H_m).nnz == 0
+
+
+@requires_asr_mp
+class TestPackedProjection:
+    """Tests for the bit-packed logical projection."""
+
+    def test_pack_bit_rows_layout(self):
+        """Test that bit j lands in word j // 64 at position j % 64."""
+        from asr_mp.dem_utils import pack_bit_rows
+
+        bits = np.zeros((2, 70), dtype=np.uint8)
+        bits[0, 0] = 1
+        bits[0, 65] = 1
+        bits[1, 63] = 1
+        words = pack_bit_rows(bits)
+
+        assert words.shape == (2, 2)
+        assert words[0, 0] == 1 and words[0, 1] == 2
+        assert words[1, 0] == 1 << 63 and words[1, 1] == 0
+
+    def test_matches_sparse_product(self):
+        """Test the packed GF(2) product against the sparse one, over many observables."""
+        from asr_mp.dem_utils import logical_projection_words, pack_bit_rows, project_packed
+
+        rng = np.random.default_rng(3)
+        L = scipy.sparse.random(11, 150, density=0.1, random_state=4, format="csr")
+        L.data[:] = 1
+        errors = (rng.random((40, 150)) < 0.2).astype(np.uint8)
+
+        predictions = project_packed(pack_bit_rows(errors), logical_projection_words(L))
+        expected = np.asarray((L @ errors.T) % 2, dtype=np.uint8).T
+
+        assert predictions.shape == (40, 2)
+        np.testing.assert_array_equal(
+            np.unpackbits(predictions, axis=1, count=11, bitorder="little"), expected
+        )
+
+
+@requires_asr_mp
+class TestSyndromeUnpacker:
+    """Tests for the SyndromeUnpacker class."""
+
+    def test_chunks_match_unpackbits(self):
+        """Test chunked unpacking against np.unpackbits for several widths."""
+        from asr_mp.dem_utils import SyndromeUnpacker
+
+        rng = np.random.default_rng(5)
+        for num_detectors in (1, 8, 13, 100):
+            packed = rng.integers(0, 256, (50, (num_detectors + 7) // 8), dtype=np.uint8)
+            expected = np.unpackbits(packed, axis=1, count=num_detectors, bitorder="little")
+
+            unpacker = SyndromeUnpacker(num_detectors, chunk_bytes=100)
+            unpacked = np.empty_like(expected)
+            for start, stop, shots in unpacker.chunks(packed):
+                assert stop - start <= unpacker.chunk_shots
+                unpacked[start:stop] = shots
+
+            np.testing.assert_array_equal(unpacked, expected)
+
+    def test_buffer_is_bounded_and_reused(self):
+        """Test that the buffer never exceeds one chunk."""
+        from asr_mp.dem_utils import SyndromeUnpacker
+
+        unpacker = SyndromeUnpacker(64, chunk_bytes=640)
+        packed = np.zeros((1000, 8), dtype=np.uint8)
+        views = [shots for _, _, shots in unpacker.chunks(packed)]
+
+        assert unpacker.chunk_shots == 10
+        assert len(views) == 100
+        assert all(np.shares_memory(view, views[0]) for view in views)
+
+    def test_row_bytes_bounds_chunk(self):
+        """Test that a per-shot array wider than the syndrome shrinks the chunk."""
+        from asr_mp.dem_utils import SyndromeUnpacker
+
+        assert SyndromeUnpacker(64, chunk_bytes=640, row_bytes=32).chunk_shots == 10
+        assert SyndromeUnpacker(64, chunk_bytes=640, row_bytes=128).chunk_shots == 5
+
+    def test_invalid_arguments(self):
+        """Test that bad chunk sizes and oversized batches are rejected."""
+        from asr_mp.dem_utils import SyndromeUnpacker
+
+        with pytest.raises(ValueError):
+            SyndromeUnpacker(10, chunk_bytes=0)
+        with pytest.raises(ValueError):
+            SyndromeUnpacker(64, chunk_bytes=64).unpack(np.zeros((2, 8), dtype=np.uint8))
+
 
 @requires_asr_mp
 class TestGetChannelLlrs:
@@ -155,3 +488,21 @@ class TestGetChannelLlrs:
         # LLR should be monotonically decreasing
         for i in range(len(llrs) - 1):
             assert llrs[i] > llrs[i + 1]
+
+    def test_probs_from_llrs_roundtrip(self):
+        """Test that get_probs_from_llrs inverts get_channel_llrs."""
+        from asr_mp.dem_utils import get_channel_llrs, get_probs_from_llrs
+
+        priors = np.array([0.001, 0.01, 0.1, 0.3, 0.5, 0.9])
+        recovered = get_probs_from_llrs(get_channel_llrs(priors))
+
+        np.testing.assert_allclose(recovered, priors)
+
+    def test_probs_from_llrs_clipped(self):
+        """Test that extreme LLRs map to probabilities strictly inside (0, 1)."""
+        from asr_mp.dem_utils import get_probs_from_llrs
+
+        probs = get_probs_from_llrs(np.array([-1e4, 1e4]))
+
+        assert np.all(probs > 0)
+        assert np.all(probs < 1)
@@ -0,0 +1,84 @@
+"""
+Unit tests for online drift estimation.
+"""
+
+import numpy as np
+import pytest
+from conftest import requires_asr_mp
+
+
+def _memory_circuit(p: float):
+    """d=3 rotated memory circuit with uniform noise strength p."""
+    import stim
+
+    return stim.Circuit.generated(
+        "surface_code:rotated_memory_z",
+        distance=3,
+        rounds=3,
+        after_clifford_depolarization=p,
+        before_round_data_depolarization=p,
+        before_measure_flip_probability=p,
+        after_reset_flip_probability=p,
+    )
+
+
+@requires_asr_mp
+class TestDriftEstimator:
+    """Tests for the DriftEstimator class."""
+
+    def test_invalid_window(self, small_dem):
+        """Test that a non-positive window is rejected."""
+        from asr_mp.drift import DriftEstimator
+
+        with pytest.raises(ValueError):
+            DriftEstimator(small_dem, window=0)
+
+    def test_no_shots_returns_dem_priors(self, small_dem):
+        """Test that priors are unchanged before any shots are consumed."""
+        from asr_mp.dem_utils import dem_to_matrices
+        from asr_mp.drift import DriftEstimator
+
+        estimator = DriftEstimator(small_dem)
+
+        np.testing.assert_array_equal(estimator.estimate_priors(), dem_to_matrices(small_dem)[2])
+
+    def test_firing_rates_match_sample_mean(self, small_circuit, small_dem):
+        """Test firing rates against the unpacked sample mean."""
+        from asr_mp.drift import DriftEstimator
+
+        shots = small_circuit.compile_detector_sampler().sample(shots=1001, bit_packed=True)
+        unpacked = np.unpackbits(shots, axis=1, count=small_dem.num_detectors, bitorder="little")
+
+        estimator = DriftEstimator(small_dem, window=10**12)
+        estimator.update(shots)
+
+        assert estimator.num_shots == 1001
+        np.testing.assert_allclose(estimator.firing_rates(), unpacked.mean(axis=0), rtol=1e-6)
+
+    def test_window_bounds_weight(self, small_circuit, small_dem):
+        """Test that the exponential decay caps the effective sample size."""
+        from asr_mp.drift import DriftEstimator
+
+        sampler = small_circuit.compile_detector_sampler()
+        estimator = DriftEstimator(small_dem, window=500)
+        for _ in range(20):
+            estimator.update(sampler.sample(shots=500, bit_packed=True))
+
+        assert estimator.num_shots == 10_000
+        assert estimator.weight < 1000
+
+    def test_tracks_increased_noise(self):
+        """Test that priors move from a stale DEM towards the true noise."""
+        from asr_mp.dem_utils import dem_to_matrices
+        from asr_mp.drift import DriftEstimator
+
+        stale_dem = _memory_circuit(0.002).detector_error_model(decompose_errors=True)
+        true_circuit = _memory_circuit(0.005)
+        true_priors = dem_to_matrices(true_circuit.detector_error_model(decompose_errors=True))[2]
+
+        estimator = DriftEstimator(stale_dem, window=10**9)
+        estimator.update(true_circuit.compile_detector_sampler().sample(200_000, bit_packed=True))
+        ratio = estimator.estimate_priors() / true_priors
+
+        assert 0.8 < np.median(ratio) < 1.2
+        assert np.median(estimator.priors / true_priors) < 0.5
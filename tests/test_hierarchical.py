@@ -0,0 +1,129 @@
+"""
+Unit tests for hierarchical Union-Find + BP+OSD decoding.
+"""
+
+import numpy as np
+import pytest
+from conftest import requires_asr_mp
+
+
+def _packed_shots(circuit, shots: int, seed: int):
+    """Sample bit-packed detection events and observable flips."""
+    sampler = circuit.compile_detector_sampler(seed=seed)
+    return sampler.sample(shots=shots, separate_observables=True, bit_packed=True)
+
+
+@requires_asr_mp
+class TestHierarchicalDecoder:
+    """Tests for the HierarchicalCompiledDecoder class."""
+
+    def test_invalid_thresholds(self, small_dem):
+        """Test that negative routing thresholds are rejected."""
+        from asr_mp.hierarchical import HierarchicalCompiledDecoder
+
+        with pytest.raises(ValueError):
+            HierarchicalCompiledDecoder(small_dem, max_cluster_size=-1)
+
+    def test_stage_counts_cover_all_shots(self, small_circuit, small_dem):
+        """Test that every shot is counted by exactly one stage."""
+        from asr_mp.hierarchical import HierarchicalCompiledDecoder
+
+        dets, _ = _packed_shots(small_circuit, shots=200, seed=1)
+        decoder = HierarchicalCompiledDecoder(small_dem, osd_order=0)
+        result = decoder.decode_shots_bit_packed(bit_packed_detection_event_data=dets)
+
+        assert result.shape == (200, (small_dem.num_observables + 7) // 8)
+        assert sum(decoder.stage_counts.values()) == 200
+        assert decoder.stage_counts["trivial"] == int((~dets.any(axis=1)).sum())
+        assert sum(decoder.stage_fractions.values()) == pytest.approx(1.0)
+        assert len(decoder.latencies) == 200
+
+        chunked = HierarchicalCompiledDecoder(small_dem, chunk_bytes=1, osd_order=0)
+        np.testing.assert_array_equal(
+            chunked.decode_shots_bit_packed(bit_packed_detection_event_data=dets), result
+        )
+        assert chunked.stage_counts == decoder.stage_counts
+
+    def test_zero_cluster_size_routes_to_bp_osd(self, small_circuit, small_dem):
+        """Test that a zero cluster limit reproduces plain BP+OSD."""
+        from asr_mp.decoder import TesseractCompiledDecoder
+        from asr_mp.hierarchical import HierarchicalCompiledDecoder
+
+        dets, _ = _packed_shots(small_circuit, shots=100, seed=2)
+        decoder = HierarchicalCompiledDecoder(small_dem, max_cluster_size=0, osd_order=0)
+        result = decoder.decode_shots_bit_packed(bit_packed_detection_event_data=dets)
+        expected = TesseractCompiledDecoder(small_dem, osd_order=0).decode_shots_bit_packed(
+            bit_packed_detection_event_data=dets
+        )
+
+        np.testing.assert_array_equal(result, expected)
+        assert decoder.stage_counts["union_find"] == 0
+
+    def test_syndrome_weight_limit(self, small_circuit, small_dem):
+        """Test that heavy syndromes bypass Union-Find."""
+        from asr_mp.hierarchical import HierarchicalCompiledDecoder
+
+        dets, _ = _packed_shots(small_circuit, shots=100, seed=3)
+        decoder = HierarchicalCompiledDecoder(
+            small_dem, max_cluster_size=10**6, max_syndrome_weight=0, osd_order=0
+        )
+        decoder.decode_shots_bit_packed(bit_packed_detection_event_data=dets)
+
+        assert decoder.stage_counts["union_find"] == 0
+
+    def test_accuracy_matches_bp_osd(self):
+        """Test that routing keeps the BP+OSD logical error rate at d=5."""
+        import stim
+
+        from asr_mp.decoder import TesseractCompiledDecoder
+        from asr_mp.hierarchical import HierarchicalCompiledDecoder
+
+        circuit = stim.Circuit.generated(
+            "surface_code:rotated_memory_z",
+            distance=5,
+            rounds=5,
+            after_clifford_depolarization=0.005,
+            before_round_data_depolarization=0.005,
+            before_measure_flip_probability=0.005,
+            after_reset_flip_probability=0.005,
+        )
+        dem = circuit.detector_error_model(decompose_errors=True)
+        dets, obs = _packed_shots(circuit, shots=300, seed=4)
+
+        hierarchical = HierarchicalCompiledDecoder(dem, preset="fast")
+        reference = TesseractCompiledDecoder(dem, preset="fast")
+        h_fail = np.any(
+            hierarchical.decode_shots_bit_packed(bit_packed_detection_event_data=dets) != obs,
+            axis=1,
+        ).sum()
+        r_fail = np.any(
+            reference.decode_shots_bit_packed(bit_packed_detection_event_data=dets) != obs,
+            axis=1,
+        ).sum()
+
+        assert h_fail <= r_fail + 3
+        assert hierarchical.stage_counts["union_find"] > 0
+
+    def test_in_sinter(self, small_circuit, small_dem):
+        """Test that HierarchicalDecoder works with sinter.collect."""
+        import sinter
+
+        from asr_mp.hierarchical import HierarchicalDecoder
+
+        task = sinter.Task(
+            circuit=small_circuit,
+            json_metadata={"d": 3, "p": 0.001},
+            detector_error_model=small_dem,
+        )
+        samples = sinter.collect(
+            num_workers=1,
+            max_shots=10,
+            max_errors=5,
+            tasks=[task],
+            decoders=["hierarchical"],
+            custom_decoders={"hierarchical": HierarchicalDecoder(osd_order=0)},
+            print_progress=False,
+        )
+
+        assert len(samples) == 1
+        assert samples[0].shots > 0
@@ -0,0 +1,244 @@
+"""
+Unit tests for the latency ring buffer, histogram and sinter sampler.
+"""
+
+import numpy as np
+import pytest
+from conftest import requires_asr_mp
+
+
+@requires_asr_mp
+class TestLatencyBuffer:
+    """Tests for the LatencyBuffer class."""
+
+    def test_invalid_capacity(self):
+        """Test that a non-positive capacity is rejected."""
+        from asr_mp.latency import LatencyBuffer
+
+        with pytest.raises(ValueError):
+            LatencyBuffer(capacity=0)
+
+    def test_empty(self):
+        """Test queries on an empty buffer."""
+        from asr_mp.latency import LatencyBuffer
+
+        buffer = LatencyBuffer(capacity=8)
+
+        assert len(buffer) == 0
+        assert buffer.average() == 0.0
+        assert buffer.percentile(99) == 0.0
+        assert buffer.summary()["count"] == 0
+
+    def test_append_and_extend_wrap(self):
+        """Test that the buffer keeps the most recent samples in order."""
+        from asr_mp.latency import LatencyBuffer
+
+        buffer = LatencyBuffer(capacity=5)
+        buffer.append(1.0)
+        buffer.extend([2.0, 3.0, 4.0])
+        buffer.extend(np.array([5.0, 6.0, 7.0]))
+
+        assert len(buffer) == 5
+        assert buffer.count == 7
+        np.testing.assert_array_equal(buffer.to_array(), [3.0, 4.0, 5.0, 6.0, 7.0])
+        assert buffer[0] == 3.0
+        assert buffer[-1] == 7.0
+        assert list(buffer) == [3.0, 4.0, 5.0, 6.0, 7.0]
+
+    def test_extend_longer_than_capacity(self):
+        """Test that an oversized batch keeps only its tail."""
+        from asr_mp.latency import LatencyBuffer
+
+        buffer = LatencyBuffer(capacity=4)
+        buffer.extend(np.arange(10, dtype=float))
+
+        np.testing.assert_array_equal(buffer.to_array(), [6.0, 7.0, 8.0, 9.0])
+        assert buffer.average() == pytest.approx(4.5)
+        assert buffer.peak == 9.0
+
+    def test_running_totals_cover_all_samples(self):
+        """Test that mean and max include samples evicted from the ring."""
+        from asr_mp.latency import LatencyBuffer
+
+        buffer = LatencyBuffer(capacity=3)
+        for value in [10.0, 1.0, 1.0, 1.0]:
+            buffer.append(value)
+
+        assert buffer.average() == pytest.approx(13.0 / 4)
+        assert buffer.peak == 10.0
+        assert np.mean(buffer) == pytest.approx(1.0)
+        assert np.max(buffer) == 1.0
+
+    def test_summary_percentiles(self):
+        """Test the percentile summary against NumPy."""
+        from asr_mp.latency import LatencyBuffer
+
+        values = np.random.default_rng(0).exponential(size=1000)
+        buffer = LatencyBuffer(capacity=1000)
+        buffer.extend(values)
+        summary = buffer.summary()
+
+        assert set(summary) == {"count", "mean", "p50", "p90", "p99", "p99.9", "max"}
+        assert summary["p99"] == pytest.approx(np.percentile(values, 99))
+        assert summary["max"] == pytest.approx(values.max())
+
+    def test_clear(self):
+        """Test that clear resets samples and totals."""
+        from asr_mp.latency import LatencyBuffer
+
+        buffer = LatencyBuffer(capacity=4)
+        buffer.extend([1.0, 2.0])
+        buffer.clear()
+
+        assert len(buffer) == 0
+        assert buffer.count == 0
+        assert buffer.peak == 0.0
+        assert buffer.histogram.count == 0
+
+    def test_used_by_decoders(self, small_dem, sample_syndrome):
+        """Test that decoders record into a LatencyBuffer."""
+        from asr_mp.decoder import ASRMPDecoder
+        from asr_mp.latency import LatencyBuffer
+        from asr_mp.union_find_decoder import UnionFindDecoder
+
+        for decoder in (ASRMPDecoder(small_dem, osd_order=0), UnionFindDecoder(small_dem)):
+            decoder.decode(sample_syndrome)
+
+            assert isinstance(decoder.latencies, LatencyBuffer)
+            assert decoder.get_average_latency() == decoder.latencies.average()
+
+
+@requires_asr_mp
+class TestLatencyHistogram:
+    """Tests for the LatencyHistogram class."""
+
+    def test_scalar_and_batch_buckets_agree(self):
+        """Test that add and add_many bucket samples identically."""
+        from asr_mp.latency import LatencyHistogram
+
+        values = [0.0, 5e-8, 1e-7, 3.3e-6, 1e-3, 0.5, 1e2, 1e4]
+        one, many = LatencyHistogram(), LatencyHistogram()
+        for value in values:
+            one.add(value)
+        many.add_many(values)
+
+        np.testing.assert_array_equal(one.counts, many.counts)
+        assert many.count == len(values)
+        assert many.counts[0] == 2
+        assert many.counts[-1] == 2
+
+    def test_percentile_relative_error(self):
+        """Test that percentiles land within one bucket of the exact value."""
+        from asr_mp.latency import LatencyHistogram
+
+        values = np.random.default_rng(0).lognormal(mean=-9.0, sigma=1.0, size=50_000)
+        histogram = LatencyHistogram()
+        histogram.add_many(values)
+
+        for q in (50, 99, 99.9):
+            exact = np.percentile(values, q)
+            assert abs(histogram.percentile(q) / exact - 1) < 0.15
+
+        assert LatencyHistogram().percentile(99) == 0.0
+
+    def test_merge_and_custom_counts_round_trip(self):
+        """Test that histograms merge by summing sinter custom_counts."""
+        from collections import Counter
+
+        from asr_mp.latency import LatencyHistogram
+
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.add_many([1e-6, 2e-6])
+        b.add_many([1e-3])
+        merged = Counter(a.to_custom_counts()) + Counter(b.to_custom_counts())
+        merged["other_key"] = 7
+
+        total = LatencyHistogram.from_custom_counts(merged)
+        a.merge(b)
+
+        np.testing.assert_array_equal(total.counts, a.counts)
+        assert total.count == 3
+
+    def test_buffer_feeds_histogram(self):
+        """Test that LatencyBuffer records every sample, not only retained ones."""
+        from asr_mp.latency import LatencyBuffer
+
+        buffer = LatencyBuffer(capacity=2)
+        buffer.append(1e-5)
+        buffer.extend([1e-5, 2e-5, 3e-5])
+
+        assert len(buffer) == 2
+        assert buffer.histogram.count == 4
+
+
+@requires_asr_mp
+class TestLatencySampler:
+    """Tests for the LatencySampler class."""
+
+    def test_rejects_postselection(self, small_circuit, small_dem):
+        """Test that postselected tasks are refused."""
+        import sinter
+
+        from asr_mp.latency import LatencySampler
+        from asr_mp.union_find_decoder import UnionFindSinterDecoder
+
+        task = sinter.Task(
+            circuit=small_circuit,
+            detector_error_model=small_dem,
+            postselected_observables_mask=np.array([1], dtype=np.uint8),
+        )
+        with pytest.raises(ValueError):
+            LatencySampler(UnionFindSinterDecoder()).compiled_sampler_for_task(task)
+
+    def test_sample_reports_histogram(self, small_circuit, small_dem):
+        """Test that one batch reports a histogram bucket count per shot."""
+        import sinter
+
+        from asr_mp.latency import LatencyHistogram, LatencySampler
+        from asr_mp.union_find_decoder import UnionFindSinterDecoder
+
+        task = sinter.Task(circuit=small_circuit, detector_error_model=small_dem)
+        for decoder in (UnionFindSinterDecoder(), sinter.BUILT_IN_DECODERS["pymatching"]):
+            stats = LatencySampler(decoder).compiled_sampler_for_task(task).sample(100)
+
+            assert stats.shots == 100
+            assert LatencyHistogram.from_custom_counts(stats.custom_counts).count == 100
+
+    def test_compiled_decoders_record_per_shot_samples(self, small_circuit, small_dem):
+        """Test that the package's decoders fill more than one histogram bucket."""
+        import sinter
+
+        from asr_mp.decoder import TesseractBPOSD
+        from asr_mp.latency import LatencyHistogram, LatencySampler
+        from asr_mp.union_find_decoder import UnionFindSinterDecoder
+
+        task = sinter.Task(circuit=small_circuit, detector_error_model=small_dem)
+        for decoder in (TesseractBPOSD(osd_order=0), UnionFindSinterDecoder()):
+            compiled = LatencySampler(decoder).compiled_sampler_for_task(task)
+            stats = compiled.sample(500)
+
+            # Trivial and duplicate shots are recorded too, not only decoded ones
+            assert len(compiled.compiled_decoder.latencies) == 500
+            histogram = LatencyHistogram.from_custom_counts(stats.custom_counts)
+            assert histogram.count == stats.shots
+            assert np.count_nonzero(histogram.counts) > 1
+
+    def test_collect_merges_workers(self, small_circuit, small_dem):
+        """Test that sinter.collect sums histograms into the task stats."""
+        import sinter
+
+        from asr_mp.latency import LatencyHistogram, LatencySampler
+        from asr_mp.union_find_decoder import UnionFindSinterDecoder
+
+        stats = sinter.collect(
+            num_workers=2,
+            tasks=[sinter.Task(circuit=small_circuit, detector_error_model=small_dem)],
+            decoders=["union_find"],
+            custom_decoders={"union_find": LatencySampler(UnionFindSinterDecoder())},
+            max_shots=2_000,
+        )
+
+        assert len(stats) == 1
+        histogram = LatencyHistogram.from_custom_counts(stats[0].custom_counts)
+        assert histogram.count == stats[0].shots
+        assert histogram.percentile(99) > 0
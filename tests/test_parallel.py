@@ -0,0 +1,56 @@
+"""
+Unit tests for the process-pool parallel decoder.
+"""
+
+import numpy as np
+from conftest import requires_asr_mp
+
+
+@requires_asr_mp
+class TestParallelTesseractDecoder:
+    """Tests for the ParallelTesseractDecoder class."""
+
+    def test_matches_serial_decoder(self, small_circuit, small_dem):
+        """Test that parallel decoding matches the single-process decoder."""
+        from asr_mp.decoder import TesseractCompiledDecoder
+        from asr_mp.parallel import ParallelTesseractDecoder
+
+        sampler = small_circuit.compile_detector_sampler()
+        shots = sampler.sample(shots=200, bit_packed=True)
+
+        expected = TesseractCompiledDecoder(small_dem).decode_shots_bit_packed(
+            bit_packed_detection_event_data=shots
+        )
+        with ParallelTesseractDecoder(small_dem, num_workers=2) as decoder:
+            result = decoder.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+
+        np.testing.assert_array_equal(result, expected)
+
+    def test_pool_reused_across_batches(self, small_circuit, small_dem):
+        """Test that repeated calls reuse the worker pool and collect latencies."""
+        from asr_mp.parallel import ParallelTesseractDecoder
+
+        sampler = small_circuit.compile_detector_sampler()
+        shots = sampler.sample(shots=50, bit_packed=True)
+
+        with ParallelTesseractDecoder(small_dem, num_workers=2) as decoder:
+            decoder.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+            executor = decoder._executor
+            decoder.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+
+            assert decoder._executor is executor
+            assert len(decoder.latencies) > 0
+
+        assert decoder._executor is None
+
+    def test_empty_batch(self, small_dem):
+        """Test that an empty batch returns an empty prediction array."""
+        from asr_mp.parallel import ParallelTesseractDecoder
+
+        num_det_bytes = (small_dem.num_detectors + 7) // 8
+        shots = np.zeros((0, num_det_bytes), dtype=np.uint8)
+
+        with ParallelTesseractDecoder(small_dem, num_workers=2) as decoder:
+            result = decoder.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+
+        assert result.shape == (0, (small_dem.num_observables + 7) // 8)
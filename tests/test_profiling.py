@@ -0,0 +1,92 @@
+"""
+Unit tests for per-stage decode profiling.
+"""
+
+import csv
+import json
+
+import numpy as np
+import pytest
+from conftest import requires_asr_mp
+
+
+@requires_asr_mp
+class TestDecodeProfile:
+    """Tests for the DecodeProfile class and decoder instrumentation."""
+
+    def test_off_by_default(self, asr_mp_decoder):
+        """Test that decoders do not profile unless asked."""
+        assert asr_mp_decoder.profile is None
+
+    def test_bp_osd_split(self):
+        """Test the BP/OSD split of per-shot call times."""
+        from asr_mp.profiling import DecodeProfile
+
+        profile = DecodeProfile()
+        profile.add_bp_osd(
+            durations=[1.0, 2.0, 10.0],
+            converged=[True, True, False],
+            iterations=[1, 2, 4],
+        )
+
+        # 3 s over 3 converged iterations gives 1 s per iteration
+        assert profile.seconds["bp"] == pytest.approx(7.0)
+        assert profile.seconds["osd"] == pytest.approx(6.0)
+        assert profile.shots["bp"] == 3
+        assert profile.shots["osd"] == 1
+        np.testing.assert_array_equal(profile.iteration_counts, [0, 1, 1, 0, 1])
+        assert profile.mean_iterations == pytest.approx(7 / 3)
+
+    def test_compiled_decoder_records_all_stages(self, small_circuit, small_dem):
+        """Test that the bit-packed path times every stage."""
+        from asr_mp.decoder import TesseractCompiledDecoder
+        from asr_mp.profiling import STAGES
+
+        shots = small_circuit.compile_detector_sampler(seed=1).sample(shots=200, bit_packed=True)
+        compiled = TesseractCompiledDecoder(small_dem, profile=True, osd_order=0)
+        compiled.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+        summary = compiled.get_stats()["profile"]
+
+        nontrivial = compiled.num_unique_shots
+        for stage in ("unpack", "bp", "projection", "pack"):
+            assert summary["stages"][stage]["shots"] == nontrivial
+        assert set(summary["stages"]) == set(STAGES)
+        assert sum(summary["bp_iterations"]["histogram"]) == nontrivial
+
+    def test_numpy_backend_profile(self, small_dem, sample_syndrome):
+        """Test that the numpy backend times its BP stage exactly."""
+        from asr_mp.decoder import ASRMPDecoder
+
+        decoder = ASRMPDecoder(small_dem, backend="numpy", osd_order=0, profile=True)
+        decoder.get_logical_correction_batch(np.stack([sample_syndrome] * 4))
+
+        assert decoder.profile.shots["bp"] == 4
+        assert decoder.profile.shots["projection"] == 4
+        assert decoder.profile.iteration_counts.sum() == 4
+
+    def test_export(self, tmp_path):
+        """Test JSON and CSV export."""
+        from asr_mp.profiling import STAGES, DecodeProfile
+
+        profile = DecodeProfile()
+        profile.add("unpack", 0.5, 10)
+
+        data = json.loads(profile.to_json(str(tmp_path / "profile.json")))
+        assert data["stages"]["unpack"]["us_per_shot"] == pytest.approx(5e4)
+        assert json.loads((tmp_path / "profile.json").read_text()) == data
+
+        profile.to_csv(str(tmp_path / "profile.csv"))
+        with open(tmp_path / "profile.csv") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["stage"] for row in rows] == list(STAGES)
+
+    def test_reset(self):
+        """Test that reset clears timings and iterations."""
+        from asr_mp.profiling import DecodeProfile
+
+        profile = DecodeProfile()
+        profile.add_bp_osd([1.0], [True], [3])
+        profile.reset()
+
+        assert profile.seconds["bp"] == 0.0
+        assert profile.mean_iterations == 0.0
@@ -0,0 +1,206 @@
+"""
+Unit tests for the weighted Union-Find decoder.
+"""
+
+import numpy as np
+import pytest
+from conftest import requires_fusion_blossom, requires_union_find
+
+
+def _memory_circuit(distance: int, p: float = 0.005):
+    """Rotated memory circuit with ``distance`` rounds and uniform noise p."""
+    import stim
+
+    return stim.Circuit.generated(
+        "surface_code:rotated_memory_z",
+        distance=distance,
+        rounds=distance,
+        after_clifford_depolarization=p,
+        before_round_data_depolarization=p,
+        before_measure_flip_probability=p,
+        after_reset_flip_probability=p,
+    )
+
+
+@requires_union_find
+class TestUnionFindDecoder:
+    """Tests for the UnionFindDecoder class."""
+
+    def test_graph_has_merged_edges(self, union_find_decoder):
+        """Test that parallel edges are merged and weights are positive."""
+        pairs = set(zip(union_find_decoder.edge_u.tolist(), union_find_decoder.edge_v.tolist()))
+
+        assert len(pairs) == len(union_find_decoder.edge_u)
+        assert np.all(union_find_decoder.edge_weights > 0)
+        assert np.all(union_find_decoder.edge_u < union_find_decoder.edge_v)
+
+    def test_zero_syndrome(self, union_find_decoder, zero_syndrome, small_dem):
+        """Test that an empty syndrome gives no correction."""
+        correction = union_find_decoder.decode(zero_syndrome)
+
+        assert correction.shape == (small_dem.num_observables,)
+        assert not correction.any()
+
+    def test_single_edge_syndrome(self, union_find_decoder, small_dem):
+        """Test that the syndrome of one edge is explained exactly."""
+        decoder = union_find_decoder
+        for e in range(0, len(decoder.edge_u), 7):
+            syndrome = np.zeros(small_dem.num_detectors, dtype=np.uint8)
+            for node in (decoder.edge_u[e], decoder.edge_v[e]):
+                if node != decoder.boundary:
+                    syndrome[node] ^= 1
+
+            edges = decoder.decode_to_edges(syndrome)
+            flipped = np.zeros(decoder.num_nodes, dtype=np.uint8)
+            np.add.at(flipped, decoder.edge_u[edges], 1)
+            np.add.at(flipped, decoder.edge_v[edges], 1)
+
+            np.testing.assert_array_equal(flipped[: decoder.boundary] % 2, syndrome)
+
+    def test_correction_matches_syndrome(self, union_find_decoder, small_circuit):
+        """Test that selected edges always reproduce the sampled syndrome."""
+        decoder = union_find_decoder
+        dets = small_circuit.compile_detector_sampler(seed=3).sample(shots=50)
+
+        for syndrome in dets.astype(np.uint8):
+            edges = decoder.decode_to_edges(syndrome)
+            flipped = np.zeros(decoder.num_nodes, dtype=np.int64)
+            np.add.at(flipped, decoder.edge_u[edges], 1)
+            np.add.at(flipped, decoder.edge_v[edges], 1)
+
+            np.testing.assert_array_equal(flipped[: decoder.boundary] % 2, syndrome)
+
+    def test_accuracy_close_to_matching(self):
+        """Test that the logical error rate is close to MWPM at d=5."""
+        import pymatching
+
+        from asr_mp.union_find_decoder import UnionFindDecoder
+
+        circuit = _memory_circuit(distance=5)
+        dem = circuit.detector_error_model(decompose_errors=True)
+        dets, obs = circuit.compile_detector_sampler(seed=11).sample(
+            shots=500, separate_observables=True
+        )
+
+        decoder = UnionFindDecoder(dem)
+        predictions = np.array([decoder.decode(s) for s in dets.astype(np.uint8)])
+        matching = pymatching.Matching.from_detector_error_model(dem).decode_batch(dets)
+
+        uf_failures = np.any(predictions != obs, axis=1).sum()
+        mwpm_failures = np.any(matching != obs, axis=1).sum()
+        assert uf_failures <= 2 * mwpm_failures + 5
+        assert len(decoder.latencies) == 500
+
+    def test_batch_matches_single_shots(self):
+        """Test that batch decoding agrees with shot-by-shot decoding."""
+        from asr_mp.union_find_decoder import UnionFindDecoder
+
+        circuit = _memory_circuit(distance=5)
+        dem = circuit.detector_error_model(decompose_errors=True)
+        dets = circuit.compile_detector_sampler(seed=4).sample(shots=100).astype(np.uint8)
+
+        decoder = UnionFindDecoder(dem)
+        batch = decoder.decode_batch(dets)
+        single = np.array([decoder.decode(s) for s in dets])
+
+        np.testing.assert_array_equal(batch, single)
+        assert len(decoder.latencies) == 200
+
+    def test_state_reset_between_shots(self, union_find_decoder):
+        """Test that per-shot scratch arrays are restored after decoding."""
+        decoder = union_find_decoder
+        syndrome = np.zeros(decoder.num_detectors, dtype=np.uint8)
+        syndrome[[0, 3, 7]] = 1
+        decoder.decode(syndrome)
+
+        assert decoder._parent == list(range(decoder.num_nodes))
+        assert not any(decoder._parity)
+        assert not any(decoder._growth)
+        assert decoder._on_boundary[decoder.boundary] == 1
+        assert sum(decoder._on_boundary) == 1
+
+    def test_boundary_does_not_join_clusters(self):
+        """Test that clusters reaching the boundary at both ends stay separate."""
+        import stim
+
+        from asr_mp.union_find_decoder import UnionFindDecoder
+
+        dem = stim.DetectorErrorModel("""
+            error(0.2) D0 L0
+            error(0.01) D0 D1
+            error(0.01) D1 D2
+            error(0.01) D2 D3
+            error(0.2) D3
+        """)
+        decoder = UnionFindDecoder(dem)
+        corrections = decoder.decode_batch(np.array([[1, 0, 0, 1]], dtype=np.uint8))
+
+        np.testing.assert_array_equal(corrections, [[1]])
+        assert decoder.last_cluster_sizes.tolist() == [1]
+        assert decoder.last_resolved.tolist() == [True]
+
+    def test_invalid_backend(self, small_dem):
+        """Test that unknown backends and partition counts are rejected."""
+        from asr_mp.union_find_decoder import UnionFindDecoder
+
+        with pytest.raises(ValueError):
+            UnionFindDecoder(small_dem, backend="blossom_v")
+        with pytest.raises(ValueError):
+            UnionFindDecoder(small_dem, num_partitions=0)
+
+
+@requires_fusion_blossom
+class TestFusionBlossomBackend:
+    """Tests for the fusion-blossom backend of UnionFindDecoder."""
+
+    @pytest.mark.parametrize("num_partitions", [1, 2])
+    def test_matches_matching(self, num_partitions):
+        """Test that serial and parallel solvers agree with MWPM."""
+        import pymatching
+
+        from asr_mp.union_find_decoder import UnionFindDecoder
+
+        circuit = _memory_circuit(distance=5)
+        dem = circuit.detector_error_model(decompose_errors=True)
+        dets, obs = circuit.compile_detector_sampler(seed=5).sample(
+            shots=300, separate_observables=True
+        )
+
+        decoder = UnionFindDecoder(dem, backend="fusion_blossom", num_partitions=num_partitions)
+        predictions = decoder.decode_batch(dets.astype(np.uint8))
+        matching = pymatching.Matching.from_detector_error_model(dem).decode_batch(dets)
+
+        fb_failures = np.any(predictions != obs, axis=1).sum()
+        mwpm_failures = np.any(matching != obs, axis=1).sum()
+        assert predictions.shape == obs.shape
+        assert fb_failures <= mwpm_failures + 3
+
+    def test_solver_reused_across_shots(self, small_circuit, small_dem):
+        """Test that one solver decodes every shot in a batch."""
+        from asr_mp.union_find_decoder import UnionFindDecoder
+
+        decoder = UnionFindDecoder(small_dem, backend="fusion_blossom")
+        solver = decoder._solver
+        dets = small_circuit.compile_detector_sampler(seed=2).sample(shots=20)
+        first = decoder.decode_batch(dets.astype(np.uint8))
+        second = decoder.decode_batch(dets.astype(np.uint8))
+
+        assert decoder._solver is solver
+        np.testing.assert_array_equal(first, second)
+
+    def test_too_many_partitions(self, small_dem):
+        """Test that partitions need enough time layers."""
+        from asr_mp.union_find_decoder import UnionFindDecoder
+
+        with pytest.raises(ValueError):
+            UnionFindDecoder(small_dem, backend="fusion_blossom", num_partitions=3)
+
+    def test_sinter_factory_forwards_backend(self, small_dem):
+        """Test that the sinter factory passes backend options through."""
+        from asr_mp.union_find_decoder import UnionFindSinterDecoder
+
+        compiled = UnionFindSinterDecoder(backend="fusion_blossom").compile_decoder_for_dem(
+            dem=small_dem
+        )
+
+        assert compiled.decoder.backend == "fusion_blossom"
@@ -0,0 +1,104 @@
+"""
+Unit tests for sliding-window decoding.
+"""
+
+import numpy as np
+import pytest
+from conftest import requires_asr_mp
+
+
+def _long_circuit(rounds: int, p: float = 0.002):
+    """d=3 rotated memory circuit with the given number of rounds."""
+    import stim
+
+    return stim.Circuit.generated(
+        "surface_code:rotated_memory_z",
+        distance=3,
+        rounds=rounds,
+        after_clifford_depolarization=p,
+        before_round_data_depolarization=p,
+        before_measure_flip_probability=p,
+        after_reset_flip_probability=p,
+    )
+
+
+@requires_asr_mp
+class TestSlidingWindowDecoder:
+    """Tests for the SlidingWindowDecoder class."""
+
+    def test_invalid_window(self, small_dem):
+        """Test that commit sizes outside [1, window] are rejected."""
+        from asr_mp.windowed import SlidingWindowDecoder
+
+        with pytest.raises(ValueError):
+            SlidingWindowDecoder(small_dem, window=4, commit=5)
+        with pytest.raises(ValueError):
+            SlidingWindowDecoder(small_dem, window=4, commit=0)
+
+    def test_single_window_covers_dem(self, small_dem):
+        """Test that a window spanning every layer decodes in one step."""
+        from asr_mp.windowed import SlidingWindowDecoder
+
+        decoder = SlidingWindowDecoder(small_dem, window=100, preset="fast")
+
+        assert decoder.num_windows == 1
+        assert decoder.num_layers == 4
+
+    def test_window_count_scales_with_rounds(self):
+        """Test that windows slide by the commit size."""
+        from asr_mp.windowed import SlidingWindowDecoder
+
+        dem = _long_circuit(rounds=20).detector_error_model(decompose_errors=True)
+        decoder = SlidingWindowDecoder(dem, window=6, commit=3, preset="fast")
+
+        assert decoder.num_layers == 21
+        assert decoder.num_windows == 6
+        # Interior windows share one BP+OSD instance
+        assert len(decoder._decoders) < decoder.num_windows
+
+    def test_zero_syndrome(self):
+        """Test that zero syndromes produce zero corrections."""
+        from asr_mp.windowed import SlidingWindowDecoder
+
+        dem = _long_circuit(rounds=10).detector_error_model(decompose_errors=True)
+        decoder = SlidingWindowDecoder(dem, window=4, commit=2, preset="fast")
+
+        syndromes = np.zeros((5, dem.num_detectors), dtype=np.uint8)
+        corrections = decoder.get_logical_correction_batch(syndromes)
+
+        assert corrections.shape == (5, dem.num_observables)
+        assert not corrections.any()
+
+    def test_matches_reference_on_sampled_shots(self):
+        """Test that windowed predictions agree with full BP+OSD on >= 97% of shots."""
+        from asr_mp.decoder import ASRMPDecoder
+        from asr_mp.windowed import SlidingWindowDecoder
+
+        circuit = _long_circuit(rounds=12, p=0.001)
+        dem = circuit.detector_error_model(decompose_errors=True)
+        decoder = SlidingWindowDecoder(dem, window=6, commit=3, preset="fast")
+        reference = ASRMPDecoder(dem, preset="fast")
+
+        sampler = circuit.compile_detector_sampler(seed=7)
+        dets, obs = sampler.sample(shots=200, separate_observables=True)
+        corrections = decoder.get_logical_correction_batch(dets.astype(np.uint8))
+        expected = reference.get_logical_correction_batch(dets.astype(np.uint8))
+
+        agreement = np.all(corrections == expected, axis=1).mean()
+        assert agreement >= 0.97
+        assert len(decoder.latencies) == 200
+
+    def test_compiled_decoder_bit_packed(self, small_circuit, small_dem):
+        """Test the sinter wrapper on bit-packed shots."""
+        from asr_mp.windowed import SlidingWindowBPOSD
+
+        compiled = SlidingWindowBPOSD(window=2, commit=1, preset="fast").compile_decoder_for_dem(
+            dem=small_dem
+        )
+        shots = small_circuit.compile_detector_sampler(seed=3).sample(shots=20, bit_packed=True)
+        result = compiled.decode_shots_bit_packed(bit_packed_detection_event_data=shots)
+
+        unpacked = np.unpackbits(shots, axis=1, count=small_dem.num_detectors, bitorder="little")
+        expected = np.array([compiled.decoder.get_logical_correction(s) for s in unpacked])
+        assert result.shape == (20, (small_dem.num_observables + 7) // 8)
+        np.testing.assert_array_equal(result, np.packbits(expected, axis=1, bitorder="little"))